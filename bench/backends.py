@@ -0,0 +1,60 @@
+"""
+Benchmark of the numeric kernels backends on the catalogue of the specifications.
+
+    python bench/backends.py --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                             '..')))
+
+from kernels import BACKENDS
+from splines import Splines
+
+SPECS = [
+    f'{kind} {teeth}z x {module}m x {angle}R x {tolerance} - ISO 4156'
+    for kind, tolerance in (('EXT', '5f'), ('EXT', '6e'), ('INT', '5H'))
+    for teeth in range(10, 60) for module in ('1', '1,25', '2', '2,5')
+    for angle in (30, 37.5, 45)
+] + [
+    f'{kind} FLAT ROOT SIDE FIT {pitch}/{2 * pitch} {teeth}T 30 CLASS {tol_class} ANSI B92'
+    for kind in ('EXT', 'INT') for pitch in (8, 12, 16)
+    for teeth in range(10, 60) for tol_class in (4, 5, 6, 7)
+]
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(repeat):
+    print(f'{len(SPECS)} specifications, best of {repeat}')
+    for backend, kernels in BACKENDS.items():
+        Splines(SPECS[0], backend=backend)
+        construction = best_time(
+            lambda: [Splines(spec, backend=backend) for spec in SPECS],
+            repeat)
+        pins = best_time(
+            lambda: [
+                kernels.pin_measurement(21.65, 25., 30., 25, 1.9,
+                                        1.5 + i * 1e-6, True)
+                for i in range(100000)
+            ], repeat)
+        print(f'{backend:>8}: {1e6 * construction / len(SPECS):8.2f} us per '
+              f'splines, {1e9 * pins / 100000:8.1f} ns per pin measurement')
+    if 'numba' not in BACKENDS:
+        print('   numba: not installed')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5)
+    main(parser.parse_args().repeat)
@@ -0,0 +1,88 @@
+"""
+Load test of the sizing service, starts a local instance unless the port of the running one is given.
+
+    python bench/loadtest.py --clients 50 --requests 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                             '..')))
+
+from service import SizingService
+
+SPECS = [
+    f'{kind} {teeth}z x {module}m x 30{root} x {tolerance} - ISO 4156'
+    for kind, tolerance in (('EXT', '5f'), ('EXT', '6e'), ('INT', '5H'))
+    for teeth in range(10, 40, 3) for module in ('1', '1,25', '2', '2,5')
+    for root in 'PR'
+]
+
+
+async def request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b''
+    writer.write(f'{method} {path} HTTP/1.1\r\nHost: localhost\r\n'
+                 f'Content-Length: {len(body)}\r\n\r\n'.encode() + body)
+    await writer.drain()
+    await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        if line.lower().startswith(b'content-length'):
+            length = int(line.split(b':')[1])
+    return json.loads(await reader.readexactly(length))
+
+
+async def client(host, port, requests, specs, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    for _ in range(requests):
+        start = time.perf_counter()
+        await request(reader, writer, 'POST', '/sizes',
+                      {'spec': random.choice(specs)})
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(args):
+    server = None
+    if args.port is None:
+        server = await SizingService(args.window).serve(args.host, 0)
+        args.port = server.sockets[0].getsockname()[1]
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(args.host, args.port, args.requests, SPECS,
+                                  latencies) for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    metrics = await request(reader, writer, 'GET', '/metrics')
+    writer.close()
+    await writer.wait_closed()
+    if server is not None:
+        await asyncio.sleep(.01)
+        server.close()
+        await server.wait_closed()
+    latencies.sort()
+    print(f'{len(latencies)} requests in {elapsed:.3f} s, '
+          f'{len(latencies) / elapsed:.0f} requests/s')
+    for p in (.5, .95, .99):
+        print(f'p{int(p * 100)} latency '
+              f'{1e3 * latencies[int(p * (len(latencies) - 1))]:.3f} ms')
+    print(json.dumps(metrics, indent=2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=None)
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--window', type=float, default=0.002)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from glob import escape as glob_escape, glob
+from math import inf, isnan, nan
+from types import SimpleNamespace
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# The editions of the standards and their data files, see `register_edition`
+EDITIONS = {
+    'ISO 4156-1:2005': os.path.join(DATA_DIR, 'iso_4156-1_2005.json'),
+    'ANSI B92.1-1996': os.path.join(DATA_DIR, 'ansi_b92.1_1996.json'),
+}
+
+_MAGIC = b'SPLNTAB1'
+_HEADER = struct.Struct('<8sI')
+
+
+class RangeTable:
+    """
+    A table of the rows by the ranges of the size, the lower limits inclusive and the upper ones exclusive, the rows are looked up by bisection
+
+    Attributes
+    ----------
+    names: tuple
+        The column names.
+
+    Methods
+    -------
+    lookup(size, name)
+        Returns the row or its named value for the size.
+    """
+
+    def __init__(self, values, rows, names):
+        self.names = tuple(names)
+        self._lower = values[:rows]
+        self._upper = values[rows:2 * rows]
+        self._values = values[2 * rows:]
+
+    def lookup(self, size, name=None):
+        """
+        Returns the row or its named value for the size.
+
+        Raises
+        ------
+        ValueError
+            If the size is not within the table ranges or the value is not tabulated.
+        """
+        i = bisect_right(self._lower, size) - 1
+        if i < 0 or size >= self._upper[i]:
+            raise ValueError(f'The size is out of the table: {size}')
+        columns = len(self.names)
+        if name is None:
+            return tuple(self._values[i * columns:(i + 1) * columns])
+        if name not in self.names:
+            raise ValueError(f'The {name} is not in the table')
+        value = self._values[i * columns + self.names.index(name)]
+        if isnan(value):
+            raise ValueError(f'The {name} is not tabulated for the size {size}')
+        return value
+
+
+class GridTable:
+    """
+    A table of the rows by the combinations of the key values, the rows are stored in the order of `itertools.product` of the keys
+
+    Attributes
+    ----------
+    keys: list
+        The values of each key.
+    names: tuple
+        The column names.
+
+    Methods
+    -------
+    lookup(*key)
+        Returns the row for the key values.
+    """
+
+    def __init__(self, values, keys, names):
+        self.keys = keys
+        self.names = tuple(names)
+        self._values = values
+
+    def lookup(self, *key):
+        """
+        Returns the row for the key values.
+
+        Raises
+        ------
+        ValueError
+            If a key value is not in the table.
+        """
+        i = 0
+        for values, value in zip(self.keys, key):
+            if value not in values:
+                raise ValueError(f'The key is not in the table: {value}')
+            i = i * len(values) + values.index(value)
+        columns = len(self.names)
+        return tuple(self._values[i * columns:(i + 1) * columns])
+
+
+def register_edition(edition, path):
+    """
+    Registers the data file of the standard edition, the JSON with the `edition`, the `standards` it applies to and the `tables`.
+    """
+    EDITIONS[edition] = path
+    load_edition.cache_clear()
+
+
+def compile_edition(source, path):
+    """
+    Compiles the data file to the binary tables: the header with the table layout followed by the float64 values in the native byte order.
+
+    Parameters
+    ----------
+    source : bytes
+        The content of the JSON data file.
+    path : str
+        The path of the compiled file.
+
+    Returns
+    -------
+    None
+    """
+    data = json.loads(source)
+    values = array('d')
+    layout = {}
+    for name, table in data['tables'].items():
+        offset = len(values)
+        if table['kind'] == 'ranges':
+            rows = table['rows']
+            values.extend(lower for lower, _, _ in rows)
+            values.extend(inf if upper is None else upper
+                          for _, upper, _ in rows)
+            for _, _, row in rows:
+                values.extend(nan if value is None else value
+                              for value in row)
+        else:
+            for row in table['rows']:
+                values.extend(row)
+        layout[name] = {
+            'kind': table['kind'],
+            'offset': offset,
+            'size': len(values) - offset,
+            'rows': len(table['rows']),
+            'keys': table.get('keys'),
+            'names': table['names'],
+        }
+    header = json.dumps({
+        'edition': data['edition'],
+        'standards': data['standards'],
+        'tables': layout,
+    }).encode()
+    header += b' ' * (-(len(header) + _HEADER.size) % 8)
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
+        f.write(_HEADER.pack(_MAGIC, len(header)) + header)
+        values.tofile(f)
+    os.replace(f.name, path)
+
+
+def _cache_path(path, digest):
+    name = os.path.splitext(os.path.basename(path))[0]
+    cache_name = f'{name}-{digest[:16]}-{sys.byteorder}.bin'
+    directory = os.environ.get('SPLINES_CACHE_DIR',
+                               os.path.join(os.path.dirname(path),
+                                            '__cache__'))
+    # the stale caches of this data file only, not of the data files whose
+    # name starts with the same prefix
+    stale = f'{glob_escape(name)}-{"[0-9a-f]" * 16}-*.bin'
+    return os.path.join(directory, cache_name), os.path.join(directory, stale)
+
+
+@lru_cache(maxsize=None)
+def load_edition(edition):
+    """
+    Loads the tables of the standard edition from the memory mapped binary cache, the cache is compiled on the first use and whenever the content hash of the data file changes.
+
+    Parameters
+    ----------
+    edition : str
+        The edition designation, e.g. 'ISO 4156-1:2005'.
+
+    Returns
+    -------
+    SimpleNamespace
+        The `edition`, the `standards` and the `RangeTable` and `GridTable` by the table names.
+
+    Raises
+    ------
+    ValueError
+        If the edition is unknown.
+    """
+    if edition not in EDITIONS:
+        raise ValueError(f'The edition is unknown: {edition}')
+    with open(EDITIONS[edition], 'rb') as f:
+        source = f.read()
+    digest = hashlib.sha256(source).hexdigest()
+    path, pattern = _cache_path(EDITIONS[edition], digest)
+    if not os.path.exists(path):
+        try:
+            compile_edition(source, path)
+        except OSError:
+            # the data directory is read only, e.g. installed system wide
+            path, pattern = _cache_path(
+                os.path.join(tempfile.gettempdir(), 'splines',
+                             os.path.basename(EDITIONS[edition])), digest)
+            if not os.path.exists(path):
+                compile_edition(source, path)
+        for stale in glob(pattern):
+            if stale != path:
+                os.remove(stale)
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _, header_size = _HEADER.unpack_from(buffer)
+    header = json.loads(buffer[_HEADER.size:_HEADER.size + header_size])
+    values = memoryview(buffer)[_HEADER.size + header_size:].cast('d')
+    tables = {}
+    for name, table in header['tables'].items():
+        view = values[table['offset']:table['offset'] + table['size']]
+        if table['kind'] == 'ranges':
+            tables[name] = RangeTable(view, table['rows'], table['names'])
+        else:
+            tables[name] = GridTable(view, table['keys'], table['names'])
+    return SimpleNamespace(edition=header['edition'],
+                           standards=tuple(header['standards']),
+                           **tables)
@@ -0,0 +1,311 @@
+import asyncio
+from functools import wraps
+from time import perf_counter
+
+from profiles import gear_profile, profile_svg
+from rendering import render_table
+from splines import cached_splines
+
+try:
+    import ipywidgets as widgets
+except ImportError:
+    widgets = None
+
+# The design options of the explorer by the standard
+ISO_MODULES = (0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.5, 3.0, 4.0, 5.0,
+               6.0, 8.0, 10.0)
+ANSI_PITCHES = ('2.5/5', '3/6', '4/8', '5/10', '6/12', '8/16', '10/20',
+                '12/24', '16/32', '20/40', '24/48', '32/64', '40/80', '48/96')
+PRESSURE_ANGLES = (30.0, 37.5, 45.0)
+TOLERANCE_CLASSES = (4, 5, 6, 7)
+FITS = {
+    ('ISO 4156', 'EXT'): ('d', 'e', 'f', 'h', 'js'),
+    ('ISO 4156', 'INT'): ('H', ),
+    ('ANSI B92', 'EXT'): ('SIDE', 'DIA'),
+    ('ANSI B92', 'INT'): ('SIDE', 'DIA'),
+}
+
+
+def design_spec(standard, spline_type, teeth, pitch, pressure_angle, root,
+                fit, tol_class):
+    """
+    Returns the specification of the design.
+
+    Parameters
+    ----------
+    standard : str
+        'ISO 4156' or 'ANSI B92'.
+    spline_type : str
+        'EXT' or 'INT'.
+    teeth : int
+        The number of teeth.
+    pitch : float or str
+        The module of ISO 4156 splines or the diametral pitch and the stub pitch of ANSI B92 splines, e.g. '12/24'.
+    pressure_angle : float
+        The pressure angle in degrees.
+    root : str
+        'FLAT' or 'FILLET'.
+    fit : str
+        The fundamental deviation of ISO 4156 splines, e.g. 'f', or the fit of ANSI B92 splines, 'SIDE' or 'DIA'.
+    tol_class : int
+        The tolerance class.
+
+    Returns
+    -------
+    str
+
+    Raises
+    ------
+    ValueError
+        If the standard is not explored.
+    """
+    if standard == 'ISO 4156':
+        module = str(float(pitch)).replace('.', ',')
+        root = 'R' if root == 'FILLET' else 'P'
+        return (f'{spline_type} {teeth}z x {module}m x {pressure_angle:g}'
+                f'{root} x {tol_class}{fit} - ISO 4156')
+    if standard == 'ANSI B92':
+        return (f'{spline_type} {root} ROOT {fit} FIT {pitch} {teeth}T '
+                f'{pressure_angle:g} CLASS {tol_class} ANSI B92')
+    raise ValueError(f'The standard is not explored: {standard}')
+
+
+def design_fields(splines):
+    """
+    Returns the design of the splines as the keyword arguments of `design_spec`.
+
+    Returns
+    -------
+    dict
+
+    Raises
+    ------
+    ValueError
+        If the standard is not explored.
+    """
+    if splines.standard == 'ISO 4156':
+        pitch = splines.module
+        fit, tol_class = splines.tolerance[1:], int(splines.tolerance[0])
+    elif splines.standard == 'ANSI B92':
+        pitch = f'{splines.diametral_pitch}/{splines.stub_pitch}'
+        fit, tol_class = splines.spline_fit, splines.tol_class
+    else:
+        raise ValueError(f'The standard is not explored: {splines.standard}')
+    return {
+        'standard': splines.standard,
+        'spline_type': splines.spline_type,
+        'teeth': splines.teeth,
+        'pitch': pitch,
+        'pressure_angle': splines.pressure_angle,
+        'root': splines.spline_root.upper(),
+        'fit': fit,
+        'tol_class': tol_class,
+    }
+
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def debounce(wait):
+    """
+    Returns the decorator delaying the call of the function until no other call is made for the wait in seconds, only the last call is made. Outside of the running event loop, e.g. in a script, the function is called at once.
+    """
+
+    def decorator(function):
+        handle = None
+
+        @wraps(function)
+        def debounced(*args, **kwargs):
+            nonlocal handle
+            if handle is not None:
+                handle.cancel()
+            loop = _running_loop()
+            if loop is None:
+                return function(*args, **kwargs)
+            handle = loop.call_later(wait, lambda: function(*args, **kwargs))
+
+        return debounced
+
+    return decorator
+
+
+class Explorer:
+    """
+    The notebook explorer of the splines designs with the controls of the design parameters, the drawing data table and the profile. The changes of the controls are debounced and only the outputs affected by the change are recalculated: the ISO 4156 tolerance changes reuse the geometry by `Splines.with_tolerance`, the designs are cached by `cached_splines` and the profile is redrawn only when the specification or the length changes. The neighbouring designs are calculated ahead when the notebook is idle.
+
+    Attributes
+    ----------
+    splines: Splines
+        The splines of the design, None if the design is not valid.
+    widget: ipywidgets.VBox
+        The explorer widget.
+
+    Methods
+    -------
+    spec()
+        Returns the specification of the design.
+    update()
+        Recalculates the design and refreshes the affected outputs.
+    """
+
+    def __init__(self,
+                 spec='EXT 24z x 2,5m x 30R x 5f - ISO 4156',
+                 length=None,
+                 units=None,
+                 wait=0.15,
+                 resolution=8):
+        if widgets is None:
+            raise ImportError('The explorer requires ipywidgets')
+        fields = design_fields(cached_splines(spec, length))
+        self.units = units
+        self.resolution = resolution
+        self.splines = None
+        self._design = None
+        self._rows = None
+        self._profile_key = None
+        self.standard = widgets.ToggleButtons(options=('ISO 4156', 'ANSI B92'),
+                                              value=fields['standard'],
+                                              description='Standard')
+        self.spline_type = widgets.ToggleButtons(options=('EXT', 'INT'),
+                                                 value=fields['spline_type'],
+                                                 description='Type')
+        self.teeth = widgets.IntSlider(value=fields['teeth'],
+                                       min=6,
+                                       max=100,
+                                       description='Teeth')
+        self.pitch = widgets.SelectionSlider(options=self._pitches(),
+                                             value=fields['pitch'],
+                                             description=self._pitch_label())
+        self.pressure_angle = widgets.Dropdown(options=PRESSURE_ANGLES,
+                                               value=fields['pressure_angle'],
+                                               description='Angle')
+        self.root = widgets.Dropdown(options=('FLAT', 'FILLET'),
+                                     value=fields['root'],
+                                     description='Root')
+        self.fit = widgets.Dropdown(options=FITS[fields['standard'],
+                                                 fields['spline_type']],
+                                    value=fields['fit'],
+                                    description='Fit')
+        self.tol_class = widgets.Dropdown(options=TOLERANCE_CLASSES,
+                                          value=fields['tol_class'],
+                                          description='Class')
+        self.length = widgets.BoundedFloatText(value=length or 0,
+                                               min=0,
+                                               max=1e4,
+                                               description='Length')
+        self.table = widgets.HTML()
+        self.profile = widgets.HTML(layout=widgets.Layout(width='360px'))
+        self.status = widgets.Label()
+        controls = (self.standard, self.spline_type, self.teeth, self.pitch,
+                    self.pressure_angle, self.root, self.fit, self.tol_class,
+                    self.length)
+        # the options are replaced before the update is scheduled
+        self.standard.observe(self._options_changed, names='value')
+        self.spline_type.observe(self._options_changed, names='value')
+        self._schedule = debounce(wait)(self.update)
+        for control in controls:
+            control.observe(lambda change: self._schedule(), names='value')
+        self.widget = widgets.VBox([
+            widgets.HBox([widgets.VBox(controls), self.profile]), self.table,
+            self.status
+        ])
+        self.update()
+
+    def _ipython_display_(self):
+        from IPython.display import display
+        display(self.widget)
+
+    def _pitches(self):
+        return ISO_MODULES if self.standard.value == 'ISO 4156' else ANSI_PITCHES
+
+    def _pitch_label(self):
+        return 'Module' if self.standard.value == 'ISO 4156' else 'Pitch'
+
+    def _options_changed(self, change):
+        pitches = self._pitches()
+        if tuple(self.pitch.options) != pitches:
+            self.pitch.options = pitches
+            self.pitch.value = pitches[len(pitches) // 2]
+            self.pitch.description = self._pitch_label()
+        fits = FITS[self.standard.value, self.spline_type.value]
+        if tuple(self.fit.options) != fits:
+            self.fit.options = fits
+
+    def spec(self, **fields):
+        """
+        Returns the specification of the design, the fields given override the controls, see `design_spec`.
+
+        Returns
+        -------
+        str
+        """
+        return design_spec(
+            **{
+                'standard': self.standard.value,
+                'spline_type': self.spline_type.value,
+                'teeth': self.teeth.value,
+                'pitch': self.pitch.value,
+                'pressure_angle': self.pressure_angle.value,
+                'root': self.root.value,
+                'fit': self.fit.value,
+                'tol_class': self.tol_class.value,
+                **fields
+            })
+
+    def update(self):
+        """
+        Recalculates the design and refreshes the outputs affected by the change, the status shows the refresh time or the error of the design.
+
+        Returns
+        -------
+        None
+        """
+        start = perf_counter()
+        spec = self.spec()
+        length = self.length.value or None
+        # the specification up to the tolerance designation and the length
+        design = (spec.rsplit(' x ', 1)[0], length)
+        try:
+            if (self.splines is not None and design == self._design
+                    and self.splines.standard == 'ISO 4156'):
+                splines = self.splines.with_tolerance(
+                    f'{self.tol_class.value}{self.fit.value}')
+            else:
+                splines = cached_splines(spec, length)
+            rows = splines.drawing_data(self.units)
+            if rows != self._rows:
+                self.table.value = render_table(splines, 'html', self.units)
+            if (spec, length) != self._profile_key:
+                self.profile.value = profile_svg(spec, self.resolution, length)
+        except Exception as e:
+            self.splines, self._design = None, None
+            self.status.value = f'{spec}: {e}'
+            return
+        self.splines, self._design = splines, design
+        self._rows, self._profile_key = rows, (spec, length)
+        self.status.value = f'{spec}: {(perf_counter() - start) * 1e3:.0f} ms'
+        loop = _running_loop()
+        if loop is not None:
+            for neighbour in self._neighbours():
+                loop.call_soon(self._prefetch, neighbour, length)
+
+    def _neighbours(self):
+        teeth = self.teeth.value
+        pitches = list(self.pitch.options)
+        i = pitches.index(self.pitch.value)
+        yield from (self.spec(teeth=n) for n in (teeth - 1, teeth + 1)
+                    if self.teeth.min <= n <= self.teeth.max)
+        yield from (self.spec(pitch=pitches[j]) for j in (i - 1, i + 1)
+                    if 0 <= j < len(pitches))
+
+    def _prefetch(self, spec, length):
+        try:
+            cached_splines(spec, length)
+            gear_profile(spec, self.resolution, length)
+        except Exception:
+            pass
+
@@ -0,0 +1,111 @@
+import csv
+from collections import namedtuple
+
+from splines import cached_splines
+
+Gauge = namedtuple('Gauge', [
+    'spec', 'gauge', 'element', 'min_size', 'max_size', 'wear_limit',
+    'min_major_dia', 'max_major_dia', 'min_minor_dia', 'max_minor_dia'
+])
+
+
+def splines_gauges(splines, gauge_tolerance=0.1, wear_allowance=0.1):
+    """
+    Calculates the GO composite and NO-GO sector gauges of the splines. Both gauges are made within the splines tolerance so that they never accept the bad splines: the GO gauge shifted by the wear allowance from the maximum material effective size, which is its wear limit, and the NO-GO gauge from the least material actual size. The price is that the good splines near either limit may be rejected, the more the larger `gauge_tolerance` and `wear_allowance`. The major and minor diameters of the gauges clear the splines by the clearance of the twentieth of the module, or of the inverse diametral pitch, at least.
+
+    Parameters
+    ----------
+    splines : Splines
+        The splines.
+    gauge_tolerance : float
+        The gauge maker tolerance as the fraction of the splines tolerance from the maximum effective to the minimum actual size.
+    wear_allowance : float
+        The GO gauge wear allowance as the fraction of the splines tolerance.
+
+    Returns
+    -------
+    tuple
+        The GO and the NO-GO `Gauge`.
+    """
+    if splines.standard != 'ISO 4156':
+        clearance = 0.05 / splines.diametral_pitch
+    else:
+        clearance = 0.05 * splines.module
+    if splines.spline_type == 'EXT':
+        go_size, no_go_size = splines.max_eff_thickness, splines.min_act_thickness
+        form_dia = getattr(splines, 'max_form_dia', None) or getattr(
+            splines, 'form_ext_dia')
+        major_dia, minor_dia = splines.max_major_ext_dia, form_dia
+        kind, element, sign = 'ring', 'space width', -1
+    else:
+        go_size, no_go_size = splines.min_eff_width, splines.max_act_width
+        form_dia = getattr(splines, 'min_form_int_dia', None) or getattr(
+            splines, 'form_dia')
+        major_dia, minor_dia = form_dia, splines.min_minor_int_dia
+        kind, element, sign = 'plug', 'tooth thickness', 1
+    # the gauge diameters are made between one and two clearances from the
+    # splines diameters, beyond the external and within the internal splines
+    major_dias = sorted(major_dia - sign * k * clearance for k in (1, 2))
+    minor_dias = sorted(minor_dia - sign * k * clearance for k in (1, 2))
+    tolerance = abs(no_go_size - go_size)
+    half_gauge_tolerance = gauge_tolerance * tolerance / 2
+    go_centre = go_size + sign * wear_allowance * tolerance
+    no_go_sizes = sorted(
+        (no_go_size, no_go_size - sign * gauge_tolerance * tolerance))
+    return (Gauge(splines.spec, f'GO composite {kind}', element,
+                  go_centre - half_gauge_tolerance,
+                  go_centre + half_gauge_tolerance, go_size, *major_dias,
+                  *minor_dias),
+            Gauge(splines.spec, f'NO-GO sector {kind}', element, *no_go_sizes,
+                  None, *major_dias, *minor_dias))
+
+
+def gauge_data(catalogue, gauge_tolerance=0.1, wear_allowance=0.1):
+    """
+    Calculates the GO and NO-GO gauges for the whole catalogue of the splines.
+
+    Parameters
+    ----------
+    catalogue : iterable
+        The `Splines` or the specifications.
+
+    Yields
+    ------
+    Gauge
+    """
+    for splines in catalogue:
+        if isinstance(splines, str):
+            splines = cached_splines(splines)
+        yield from splines_gauges(splines, gauge_tolerance, wear_allowance)
+
+
+def print_gauge_data(gauges, ndigits=4):
+    """
+    Prints out the gauge data in the format of the drawing data.
+    """
+    for gauge in gauges:
+        print(
+            f'{gauge.spec}',
+            f'{gauge.gauge}',
+            f'Max {gauge.element} {round(gauge.max_size, ndigits=ndigits)}',
+            f'Min {gauge.element} {round(gauge.min_size, ndigits=ndigits)}',
+            *([f'Wear limit {round(gauge.wear_limit, ndigits=ndigits)}']
+              if gauge.wear_limit is not None else []),
+            f'Max major diameter {round(gauge.max_major_dia, ndigits=ndigits)}',
+            f'Min major diameter {round(gauge.min_major_dia, ndigits=ndigits)}',
+            f'Max minor diameter {round(gauge.max_minor_dia, ndigits=ndigits)}',
+            f'Min minor diameter {round(gauge.min_minor_dia, ndigits=ndigits)}\n',
+            sep='\n')
+
+
+def write_gauge_data(gauges, path):
+    """
+    Writes the gauge data to the CSV file row by row, returns the gauges count.
+    """
+    count = 0
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(Gauge._fields)
+        for count, gauge in enumerate(gauges, start=1):
+            writer.writerow(gauge)
+    return count
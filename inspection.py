@@ -0,0 +1,157 @@
+import csv
+from collections import namedtuple
+from math import sqrt
+
+from splines import cached_splines
+
+Inspection = namedtuple('Inspection', [
+    'lot', 'spec', 'measurement', 'act_size', 'min_act_size', 'max_act_size',
+    'conforming', 'error'
+],
+                        defaults=(None, ))
+InspectionPlan = namedtuple('InspectionPlan', [
+    'spec', 'pin_dia', 'min_pin_measurement', 'max_pin_measurement',
+    'ball_dia', 'min_ball_measurement', 'max_ball_measurement', 'span_teeth',
+    'min_span_measurement', 'max_span_measurement'
+])
+LotSummary = namedtuple('LotSummary', [
+    'lot', 'count', 'nonconforming', 'mean', 'std', 'min', 'max'
+])
+
+
+def _number(text):
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def read_measurements(path):
+    """
+    Reads the measurements over or between pins from the CSV file with the `lot`, `spec`, `length` and `measurement` columns, the `length` may be left empty. The cells which are not numbers are kept as the text for `inspect` to report.
+
+    Parameters
+    ----------
+    path : str
+        The path to the CSV file.
+
+    Yields
+    ------
+    tuple
+        The lot, the spline specification, the length and the measurement.
+    """
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            length = row.get('length')
+            yield (row['lot'], row['spec'], _number(length) if length else None,
+                   _number(row['measurement']))
+
+
+def inspect(rows):
+    """
+    Converts the measurements to the actual tooth thickness or space width and checks them against the actual size limits of the splines. The splines sizes are calculated once per specification and length. The rows which cannot be inspected, e.g. the measurement is not a number or is less than the pins fit, are nonconforming with the error and no actual size.
+
+    Parameters
+    ----------
+    rows : iterable
+        The (lot, spec, length, measurement) tuples, e.g. from `read_measurements`.
+
+    Yields
+    ------
+    Inspection
+    """
+    for lot, spec, length, measurement in rows:
+        try:
+            splines = cached_splines(
+                spec, None if length is None else float(length))
+            act_size = splines.act_size_from_measurement(float(measurement))
+        except (ValueError, TypeError) as e:
+            yield Inspection(lot, spec, measurement, None, None, None, False,
+                             str(e))
+            continue
+        min_act_size, max_act_size = splines.act_size_limits()
+        yield Inspection(lot, spec, measurement, act_size, min_act_size,
+                         max_act_size, min_act_size <= act_size <= max_act_size)
+
+
+def summarise(inspections):
+    """
+    Calculates the per lot statistics of the actual sizes in one pass over the inspections, the rows in error are counted as nonconforming.
+
+    Parameters
+    ----------
+    inspections : iterable
+        The `Inspection` tuples.
+
+    Returns
+    -------
+    dict
+        The `LotSummary` tuples keyed by lot.
+    """
+    lots = {}
+    for inspection in inspections:
+        count, nonconforming, measured, mean, m2, lowest, highest = lots.get(
+            inspection.lot, (0, 0, 0, 0., 0., float('inf'), -float('inf')))
+        count += 1
+        nonconforming += not inspection.conforming
+        # the rows in error count as nonconforming without the actual size
+        if inspection.act_size is not None:
+            measured += 1
+            delta = inspection.act_size - mean
+            mean += delta / measured
+            m2 += delta * (inspection.act_size - mean)
+            lowest = min(lowest, inspection.act_size)
+            highest = max(highest, inspection.act_size)
+        lots[inspection.lot] = (count, nonconforming, measured, mean, m2,
+                                lowest, highest)
+    return {
+        lot: LotSummary(lot, count, nonconforming,
+                        mean if measured else None,
+                        sqrt(m2 / (measured - 1)) if measured > 1 else 0.,
+                        lowest if measured else None,
+                        highest if measured else None)
+        for lot, (count, nonconforming, measured, mean, m2, lowest,
+                  highest) in lots.items()
+    }
+
+
+def inspection_plan(catalogue, ball_dia=None):
+    """
+    Calculates the limits of the measurements over or between pins and balls and the base tangent length of the external splines for the whole catalogue.
+
+    Parameters
+    ----------
+    catalogue : iterable
+        The `Splines` or the specifications.
+    ball_dia : float
+        The ball diameter, default the pin diameter.
+
+    Yields
+    ------
+    InspectionPlan
+    """
+    for splines in catalogue:
+        if isinstance(splines, str):
+            splines = cached_splines(splines)
+        pin_dia = splines.measuring_pin_dia()
+        if splines.spline_type == 'EXT':
+            span = splines.span_measurement()
+        else:
+            span = None, None, None
+        yield InspectionPlan(splines.spec, pin_dia,
+                             *splines.ball_measurement(pin_dia),
+                             pin_dia if ball_dia is None else ball_dia,
+                             *splines.ball_measurement(ball_dia), *span)
+
+
+def write_inspections(inspections, path):
+    """
+    Writes the inspections to the CSV file row by row, returns the inspections count.
+    """
+    count = 0
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(Inspection._fields)
+        for count, inspection in enumerate(inspections, start=1):
+            writer.writerow(inspection)
+    return count
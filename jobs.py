@@ -0,0 +1,246 @@
+import argparse
+import csv
+import json
+import os
+import tempfile
+from itertools import islice
+from math import isfinite
+
+from splines import Splines, calculate_batch, json_sizes
+from validation import CODES, pins_fit, validate
+
+MANIFEST = 'manifest.json'
+
+
+def _write_json(data, path):
+    """
+    Writes the JSON file atomically, so an interrupted run leaves either the previous or the new file.
+    """
+    directory = os.path.dirname(path)
+    with tempfile.NamedTemporaryFile('w', dir=directory, delete=False) as f:
+        json.dump(data, f)
+    os.replace(f.name, path)
+
+
+def _fingerprint(path):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _lines(f):
+    # readline keeps `tell` available unlike iterating over the file
+    while True:
+        line = f.readline()
+        if not line:
+            return
+        yield line
+
+
+def _size_rows(rows, backend, edition):
+    """
+    Calculates the sizes of the (spec, length) rows in the batch, the specifications failing in the batch are calculated one by one to record their errors.
+    """
+    specs = [spec for spec, _ in rows]
+    lengths = [length for _, length in rows]
+    try:
+        return [
+            json_sizes(splines)
+            for splines in calculate_batch(specs, lengths, backend, edition)
+        ]
+    except Exception:
+        results = []
+        for spec, length in rows:
+            try:
+                results.append(
+                    json_sizes(Splines(spec, length, backend, edition)))
+            except Exception as e:
+                results.append({'spec': spec, 'length': length, 'error': repr(e)})
+        return results
+
+
+def _length(value):
+    """
+    Returns the length of the number or the text of the CSV cell, None if empty.
+
+    Raises
+    ------
+    ValueError
+        If the length is not a finite number.
+    """
+    if value is None or value == '':
+        return None
+    length = float(value)
+    if not isfinite(length):
+        raise ValueError(f'The length is not finite: {value}')
+    return length
+
+
+def size_chunk(rows, backend='python', edition=None):
+    """
+    Calculates the sizes of the chunk of the (spec, length) rows as the columns, the length is the number, the text of the CSV cell or None. The specifications are validated first, the invalid ones and the lengths which are not numbers are recorded with their diagnostic code and the normalised valid ones are calculated in the batch, see `validation.validate`. The sized rows whose recommended measuring pins do not fit have the `pin_fit` warning, see `validation.pins_fit`.
+
+    Returns
+    -------
+    dict
+        The lists of the values by the column names, the `error` column holds the error message or None and the `warning` column the warning or None.
+    """
+    results = [None] * len(rows)
+    valid = []
+    for diagnostic, (spec, length) in zip(
+            validate((spec for spec, _ in rows), edition), rows):
+        error = None
+        if diagnostic.code != 'ok':
+            error = f'{diagnostic.code}: {diagnostic.message}'
+        else:
+            try:
+                valid.append((diagnostic.row, diagnostic.normalised,
+                              _length(length)))
+            except ValueError as e:
+                error = f'length: {e}'
+        if error is not None:
+            results[diagnostic.row] = {
+                'spec': spec,
+                'length': length,
+                'error': error
+            }
+    sizes = _size_rows([(spec, length) for _, spec, length in valid], backend,
+                       edition)
+    for (row, _, _), result in zip(valid, sizes):
+        warning = None
+        if not pins_fit(result):
+            warning = f"pin_fit: {CODES['pin_fit']}"
+        results[row] = {**result, 'spec': rows[row][0], 'warning': warning}
+    names = ['spec', 'length']
+    for result in results:
+        names.extend(name for name in result
+                     if name not in names and name not in ('error', 'warning'))
+    names.extend(('error', 'warning'))
+    return {
+        name: [result.get(name) for result in results]
+        for name in names
+    }
+
+
+def run_job(input_path,
+            output_dir,
+            chunk_size=10000,
+            backend='python',
+            edition=None):
+    """
+    Calculates the sizes of the splines from the CSV file with the `spec` and `length` columns in chunks, the `length` may be left empty. Each chunk is written as the columnar JSON file and recorded in the manifest, an interrupted job resumes from the last completed chunk. Only one chunk is held in memory.
+
+    Parameters
+    ----------
+    input_path : str
+        The path to the CSV file.
+    output_dir : str
+        The directory of the chunk files and the manifest.
+    chunk_size : int
+        The number of the rows per chunk, default 10000.
+    backend : str
+        The backend of the numeric kernels, 'python' or 'numba'.
+    edition : str
+        The edition of the standard tables, default the edition of each standard.
+
+    Returns
+    -------
+    dict
+        The manifest.
+
+    Raises
+    ------
+    ValueError
+        If the manifest in the output directory is of another input file or chunk size.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST)
+    job = {
+        'input': os.path.abspath(input_path),
+        'fingerprint': _fingerprint(input_path),
+        'chunk_size': chunk_size,
+        'backend': backend,
+        'edition': edition,
+    }
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if {name: manifest[name] for name in job} != job:
+            raise ValueError(
+                f'The output directory is of another job: {output_dir}')
+    else:
+        manifest = {**job, 'header': None, 'chunks': [], 'complete': False}
+    if manifest['complete']:
+        return manifest
+
+    with open(input_path, newline='') as f:
+        if manifest['chunks']:
+            f.seek(manifest['chunks'][-1]['offset'])
+            header = manifest['header']
+        else:
+            header = next(csv.reader([f.readline()]))
+            manifest['header'] = header
+        spec_column = header.index('spec')
+        length_column = header.index('length') if 'length' in header else None
+        reader = csv.reader(_lines(f))
+        first_row = sum(chunk['rows'] for chunk in manifest['chunks'])
+        while True:
+            # the lengths are parsed per row, see `size_chunk`
+            rows = [(row[spec_column],
+                     row[length_column] if length_column is not None else None)
+                    for row in islice(reader, chunk_size)]
+            if not rows:
+                break
+            columns = size_chunk(rows, backend, edition)
+            columns = {
+                'row': list(range(first_row, first_row + len(rows))),
+                **columns
+            }
+            name = f'chunk-{len(manifest["chunks"]):06d}.json'
+            _write_json(columns, os.path.join(output_dir, name))
+            manifest['chunks'].append({
+                'file': name,
+                'rows': len(rows),
+                'errors': sum(error is not None
+                              for error in columns['error']),
+                'offset': f.tell(),
+            })
+            _write_json(manifest, manifest_path)
+            first_row += len(rows)
+    manifest['complete'] = True
+    _write_json(manifest, manifest_path)
+    return manifest
+
+
+def read_chunks(output_dir):
+    """
+    Reads the completed chunks of the job one by one.
+
+    Yields
+    ------
+    dict
+        The lists of the values by the column names.
+    """
+    with open(os.path.join(output_dir, MANIFEST)) as f:
+        manifest = json.load(f)
+    for chunk in manifest['chunks']:
+        with open(os.path.join(output_dir, chunk['file'])) as f:
+            yield json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Splines batch sizing job')
+    parser.add_argument('input', help='CSV file with spec and length columns')
+    parser.add_argument('output', help='output directory')
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('--backend', default='python')
+    parser.add_argument('--edition', default=None)
+    args = parser.parse_args()
+    manifest = run_job(args.input, args.output, args.chunk_size, args.backend,
+                       args.edition)
+    print(f'{sum(chunk["rows"] for chunk in manifest["chunks"])} rows, '
+          f'{sum(chunk["errors"] for chunk in manifest["chunks"])} errors, '
+          f'{len(manifest["chunks"])} chunks')
+
+
+if __name__ == '__main__':
+    main()
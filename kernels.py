@@ -0,0 +1,132 @@
+from math import cos, nan, pi, radians, sin, sqrt, tan
+from types import SimpleNamespace
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def involute(alpha):
+    """
+    Returns the involute function of the angle in degrees.
+    """
+    alpha = radians(alpha)
+    return tan(alpha) - alpha
+
+
+def inverse_involute(x):
+    """
+    Returns the angle in radians of the involute function value, the approximation refined by three Newton iterations to the machine precision up to the pressure angles of 60 degrees.
+    """
+    alpha = x**(1 / 3) / (.693357 + .192484 * x**(2 / 3))
+    for _ in range(3):
+        alpha -= (tan(alpha) - alpha - x) / tan(alpha)**2
+    return alpha
+
+
+def pin_measurement(base_dia, pitch_dia, pressure_angle, teeth, pin_dia,
+                    act_size, external):
+    """
+    Calculates the measurement over (external) or between (internal) two pins for the actual tooth thickness or space width, nan if the pins do not fit the spaces, i.e. the involute at the pin centre is not positive.
+
+    Parameters
+    ----------
+    base_dia : float
+        The base diameter.
+    pitch_dia : float
+        The pitch diameter.
+    pressure_angle : float
+        The pressure angle in degrees.
+    teeth : int
+        The number of teeth, the pins are diametrically opposite for the even number of teeth only.
+    pin_dia : float
+        The pin diameter.
+    act_size : float
+        The actual tooth thickness or space width.
+    external : bool
+        True for the external splines, False for the internal ones.
+
+    Returns
+    -------
+    float
+    """
+    alpha = radians(pressure_angle)
+    if external:
+        inv_alpha = act_size / pitch_dia + tan(
+            alpha) - alpha + pin_dia / base_dia - pi / teeth
+    else:
+        inv_alpha = act_size / pitch_dia + tan(alpha) - alpha - pin_dia / base_dia
+    if inv_alpha <= 0:
+        return nan
+    # the inverse involute inlined for the compiled backends, see `inverse_involute`
+    centre_alpha = inv_alpha**(1 / 3) / (.693357 +
+                                         .192484 * inv_alpha**(2 / 3))
+    for _ in range(3):
+        centre_alpha -= (tan(centre_alpha) - centre_alpha -
+                         inv_alpha) / tan(centre_alpha)**2
+    centres_dia = base_dia / cos(centre_alpha)
+    if teeth % 2:
+        centres_dia *= cos(pi / (2 * teeth))
+    return centres_dia + pin_dia if external else centres_dia - pin_dia
+
+
+def iso_tolerances(i_D, i_E, arc_length, tol_factor, length, coefficients):
+    """
+    Calculates the total space width tolerance and the deviation allowance in micrometres according to ISO 4156-1:2005.
+
+    Parameters
+    ----------
+    coefficients : tuple
+        The row of the `tolerance_coefficients` table of the tolerance class.
+
+    Returns
+    -------
+    tuple
+    """
+    a, b, c, d, e, f, g, h = coefficients
+    pitch_dev = c * sqrt(arc_length) + d
+    profile_dev = e * tol_factor + f
+    helix_dev = g * sqrt(length) + h
+    return a * i_D + b * i_E, .6 * sqrt(pitch_dev**2 + profile_dev**2 +
+                                        helix_dev**2)
+
+
+def iso_max_form_dia(base_dia, pitch_dia, pressure_angle, hs, fund_deviation):
+    """
+    Calculates the maximum form diameter of the external splines or the form diameter of the internal splines according to ISO 4156-1:2005.
+
+    Returns
+    -------
+    float
+    """
+    alpha = radians(pressure_angle)
+    return 2 * sqrt((.5 * base_dia)**2 +
+                    (.5 * pitch_dia * sin(alpha) -
+                     (hs - .5 * fund_deviation / tan(alpha)) / sin(alpha))**2)
+
+
+_KERNELS = (involute, inverse_involute, pin_measurement, iso_tolerances,
+            iso_max_form_dia)
+
+BACKENDS = {
+    'python': SimpleNamespace(**{f.__name__: f
+                                 for f in _KERNELS}),
+}
+if njit is not None:
+    BACKENDS['numba'] = SimpleNamespace(
+        **{f.__name__: njit(cache=True)(f)
+           for f in _KERNELS})
+
+
+def get_kernels(backend='python'):
+    """
+    Returns the namespace of the kernels of the backend, 'python' or 'numba'. The 'numba' backend falls back to 'python' when Numba is not installed.
+
+    Returns
+    -------
+    SimpleNamespace
+    """
+    if backend not in ('python', 'numba'):
+        raise ValueError(f'The backend is unknown: {backend}')
+    return BACKENDS.get(backend, BACKENDS['python'])
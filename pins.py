@@ -0,0 +1,199 @@
+import csv
+from collections import namedtuple
+from math import exp, pi, radians, sqrt, tan
+
+from renard import R40, rrange
+
+from kernels import inverse_involute
+from sensitivity import DUAL_KERNELS, Dual
+from splines import Splines, calculate_batch
+
+# The default pin inventory, the R40 preferred numbers from 0.1 to 20 mm
+DEFAULT_INVENTORY = tuple(rrange(R40, 0.1, 20))
+
+# The weights of the score terms of the pins
+Weights = namedtuple('Weights', ['contact', 'sensitivity', 'clearance'],
+                     defaults=(1., 1., 1.))
+
+PinChoice = namedtuple('PinChoice', [
+    'spec', 'pin_dia', 'score', 'contact_dia', 'min_measurement',
+    'max_measurement', 'candidates'
+])
+
+
+def _first(splines, *names):
+    for name in names:
+        if hasattr(splines, name):
+            return getattr(splines, name)
+
+
+def _geometry(splines):
+    """
+    Returns the diameters limiting the pins of the splines: the range of the contact diameters on the flank, the root diameter the pin must not touch and the tip diameter the pin must protrude over.
+    """
+    if splines.spline_type == 'EXT':
+        form_dia = _first(splines, 'max_form_dia', 'form_ext_dia', 'form_dia')
+        root_dia = _first(splines, 'max_minor_ext_dia', 'min_minor_ext_dia')
+        return (form_dia, splines.min_major_ext_dia, root_dia,
+                splines.max_major_ext_dia)
+    form_dia = _first(splines, 'min_form_int_dia', 'form_dia')
+    root_dia = _first(splines, 'min_major_int_dia', 'max_major_int_dia')
+    return (splines.max_minor_int_dia, form_dia, root_dia,
+            splines.min_minor_int_dia)
+
+
+def evaluate_pin(splines, pin_dia, weights=Weights()):
+    """
+    Evaluates the pin for the measurement over (external splines) or between (internal splines) two pins at the limits of the actual tooth thickness or space width.
+
+    The pin is feasible when it contacts the flanks between the form and the tip diameters, clears the root and protrudes over the tips at both limits. The score adds the weighted terms, the lower the better: the distance of the contact point from the pitch circle in modules, the change of the actual size per the change of the measurement and the exponential penalty of the clearance less than the tenth of the module.
+
+    Parameters
+    ----------
+    splines : Splines
+        The splines.
+    pin_dia : float
+        The pin diameter in the units of the splines.
+    weights : Weights
+        The weights of the score terms.
+
+    Returns
+    -------
+    tuple
+        The score and the contact diameter at the mean actual size, None if the pin is not feasible.
+    """
+    external = splines.spline_type == 'EXT'
+    sign = 1 if external else -1
+    base_dia, pitch_dia, teeth = splines.base_dia, splines.pitch_dia, splines.teeth
+    alpha = radians(splines.pressure_angle)
+    module = pitch_dia / teeth
+    min_contact_dia, max_contact_dia, root_dia, tip_dia = _geometry(splines)
+    contact, margin = 0, float('inf')
+    min_act_size, max_act_size = splines.act_size_limits()
+    mean_act_size = (min_act_size + max_act_size) / 2
+    # the contact diameter of the mean actual size, the last, is returned
+    for act_size in (min_act_size, max_act_size, mean_act_size):
+        inv_alpha = act_size / pitch_dia + tan(alpha) - alpha + sign * (
+            pin_dia / base_dia - (pi / teeth if external else 0))
+        if inv_alpha <= 0:
+            return None
+        tan_centre = tan(inverse_involute(inv_alpha))
+        centre_dia = base_dia * sqrt(1 + tan_centre**2)
+        # the contact point is on the base tangent through the pin centre
+        tan_contact = tan_centre - sign * pin_dia / base_dia
+        contact_dia = base_dia * sqrt(1 + tan_contact**2)
+        if tan_contact < 0 or not min_contact_dia <= contact_dia <= max_contact_dia:
+            return None
+        contact = max(contact, abs(contact_dia - pitch_dia) / (2 * module))
+        margin = min(margin,
+                     sign * (centre_dia - sign * pin_dia - root_dia) / 2,
+                     sign * (centre_dia + sign * pin_dia - tip_dia) / 2)
+        if margin <= 0:
+            return None
+    measurement = DUAL_KERNELS.pin_measurement(base_dia, pitch_dia,
+                                               splines.pressure_angle, teeth,
+                                               pin_dia,
+                                               Dual(mean_act_size, (1., )),
+                                               external)
+    score = (weights.contact * contact +
+             weights.sensitivity / abs(measurement.grad[0]) +
+             weights.clearance * exp(-10 * margin / module))
+    return score, contact_dia
+
+
+def _size_specs(specs, lengths, edition):
+    """
+    Calculates the specifications in the batch, the ones failing in the batch are calculated one by one, None for those failing.
+    """
+    try:
+        return calculate_batch(specs, lengths, edition=edition)
+    except Exception:
+        result = []
+        for spec, length in zip(specs, lengths or [None] * len(specs)):
+            try:
+                result.append(Splines(spec, length, edition=edition))
+            except Exception:
+                result.append(None)
+        return result
+
+
+def optimise_pins(catalogue,
+                  inventory=DEFAULT_INVENTORY,
+                  weights=Weights(),
+                  lengths=None,
+                  edition=None):
+    """
+    Finds the best pin of the inventory for each splines of the catalogue, see `evaluate_pin`, and its measurement limits. The specifications are calculated in one batch, the ones which cannot be sized have no pin.
+
+    Parameters
+    ----------
+    catalogue : iterable
+        The `Splines` or the specifications.
+    inventory : iterable
+        The available pin diameters in millimetres, default the R40 preferred numbers from 0.1 to 20 mm.
+    weights : Weights
+        The weights of the score terms.
+    lengths : iterable
+        The splines lengths of the specifications, default None for all.
+    edition : str
+        The edition of the standard tables of the specifications, default the edition of each standard.
+
+    Returns
+    -------
+    list
+        The `PinChoice` of each splines in the order of the catalogue, the pin diameter, the contact diameter and the measurements in the units of the splines, None if no pin is feasible.
+    """
+    catalogue = list(catalogue)
+    specs = [(i, splines) for i, splines in enumerate(catalogue)
+             if isinstance(splines, str)]
+    if lengths is not None:
+        lengths = [length for i, length in enumerate(lengths)
+                   if isinstance(catalogue[i], str)]
+    sizes = _size_specs([spec for _, spec in specs], lengths, edition)
+    for (i, spec), splines in zip(specs, sizes):
+        # the specifications which cannot be sized have no pin
+        catalogue[i] = spec if splines is None else splines
+    inventory = sorted(inventory)
+    result = []
+    for splines in catalogue:
+        if isinstance(splines, str):
+            result.append(PinChoice(splines, None, None, None, None, None, 0))
+            continue
+        units_coef = 1 if splines.standard == 'ISO 4156' else 1 / 25.4
+        best, candidates = None, 0
+        for pin_dia in inventory:
+            # the pins larger than the circular pitch do not fit the spaces
+            if pin_dia * units_coef > pi * splines.pitch_dia / splines.teeth:
+                break
+            evaluation = evaluate_pin(splines, pin_dia * units_coef, weights)
+            if evaluation is None:
+                continue
+            candidates += 1
+            if best is None or evaluation[0] < best[1]:
+                best = (pin_dia * units_coef, *evaluation)
+        if best is None:
+            result.append(PinChoice(splines.spec, None, None, None, None, None,
+                                    0))
+            continue
+        pin_dia, score, contact_dia = best
+        min_measurement, max_measurement = sorted(
+            splines.measurement_from_act_size(act_size, pin_dia)
+            for act_size in splines.act_size_limits())
+        result.append(
+            PinChoice(splines.spec, pin_dia, score, contact_dia,
+                      min_measurement, max_measurement, candidates))
+    return result
+
+
+def write_pins(catalogue, path, inventory=DEFAULT_INVENTORY, weights=Weights()):
+    """
+    Writes the best pins of the catalogue to the CSV file, see `optimise_pins`, returns the rows count.
+    """
+    count = 0
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(PinChoice._fields)
+        for choice in optimise_pins(catalogue, inventory, weights):
+            writer.writerow(choice)
+            count += 1
+    return count
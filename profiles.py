@@ -0,0 +1,187 @@
+import csv
+from functools import lru_cache
+from html import escape
+from math import acos, atan2, cos, sin, sqrt, tan, pi
+
+from splines import cached_splines, involute
+
+
+def _first(splines, *names):
+    for name in names:
+        if hasattr(splines, name):
+            return getattr(splines, name)
+
+
+def _arc(r, start, end, resolution):
+    return [(r, start + (end - start) * i / resolution)
+            for i in range(resolution + 1)]
+
+
+def _fillet(r_centre, theta_centre, rho, outward, resolution):
+    """
+    Returns the quarter circle of the radius `rho` centred at (`r_centre`, `theta_centre`) in the polar coordinates, from the root circle to the radial line of the flank start for the external splines (`outward`) or the other way round for the internal ones.
+    """
+    xc, yc = r_centre * cos(theta_centre), r_centre * sin(theta_centre)
+    u = cos(theta_centre), sin(theta_centre)
+    t = -sin(theta_centre), cos(theta_centre)
+    points = []
+    for i in range(resolution + 1):
+        phi = pi / 2 * i / resolution
+        if outward:
+            dx = -u[0] * cos(phi) + t[0] * sin(phi)
+            dy = -u[1] * cos(phi) + t[1] * sin(phi)
+        else:
+            dx = -t[0] * cos(phi) + u[0] * sin(phi)
+            dy = -t[1] * cos(phi) + u[1] * sin(phi)
+        x, y = xc + rho * dx, yc + rho * dy
+        points.append(((x * x + y * y)**.5, atan2(y, x)))
+    return points
+
+
+def _join(*segments):
+    points = []
+    for segment in segments:
+        if points and segment and all(
+                abs(a - b) < 1e-12 for a, b in zip(points[-1], segment[0])):
+            segment = segment[1:]
+        points.extend(segment)
+    return points
+
+
+def _involute_angle(r_base, r):
+    alpha = acos(min(r_base / r, 1.))
+    return tan(alpha) - alpha
+
+
+def _ext_half_tooth(splines, resolution):
+    r_base = splines.base_dia / 2
+    r_tip = splines.max_major_ext_dia / 2
+    r_root = _first(splines, 'max_minor_ext_dia', 'min_minor_ext_dia') / 2
+    r_start = max(_first(splines, 'max_form_dia', 'form_dia') / 2, r_base,
+                  r_root)
+    thickness = sum(splines.act_size_limits()) / 2
+    psi = lambda r: thickness / splines.pitch_dia + involute(
+        splines.pressure_angle) - _involute_angle(r_base, r)
+    # the fillet ends on the flank within the form circle
+    rho = min(_first(splines, 'ext_root_rad') or 0.,
+              (sqrt(2 * r_start**2 - r_root**2) - r_root) / 2)
+    r_end = sqrt((r_root + rho)**2 + rho**2)
+    theta_centre = -psi(r_end) - atan2(rho, r_root + rho)
+    return _join(
+        _arc(r_root, -pi / splines.teeth, theta_centre, resolution),
+        _fillet(r_root + rho, theta_centre, rho, True, resolution)
+        if rho > 0 else [],
+        [(r, -psi(r)) for r in (r_end + (r_tip - r_end) * i / resolution
+                                for i in range(resolution + 1))],
+        _arc(r_tip, -psi(r_tip), 0., resolution))
+
+
+def _int_half_space(splines, resolution):
+    r_base = splines.base_dia / 2
+    r_tip = splines.min_minor_int_dia / 2
+    r_root = _first(splines, 'min_major_int_dia', 'max_major_int_dia') / 2
+    r_start = max(r_tip, r_base)
+    r_end = min(_first(splines, 'min_form_int_dia', 'form_dia') / 2, r_root)
+    width = sum(splines.act_size_limits()) / 2
+    eta = lambda r: width / splines.pitch_dia + involute(
+        splines.pressure_angle) - _involute_angle(r_base, r)
+    # the fillet starts on the flank outside the form circle
+    rho = min(_first(splines, 'int_root_rad') or 0.,
+              (r_root - sqrt(2 * r_end**2 - r_root**2)) / 2)
+    r_end = sqrt((r_root - rho)**2 + rho**2)
+    theta_centre = -eta(r_end) + atan2(rho, r_root - rho)
+    return _join(
+        _arc(r_tip, -pi / splines.teeth, -eta(r_start), resolution),
+        [(r, -eta(r)) for r in (r_start + (r_end - r_start) * i / resolution
+                                for i in range(resolution + 1))],
+        _fillet(r_root - rho, theta_centre, rho, False, resolution)
+        if rho > 0 else [],
+        _arc(r_root, theta_centre, 0., resolution))
+
+
+@lru_cache(maxsize=256)
+def gear_profile(spec: str, resolution=20, length=None):
+    """
+    Calculates the closed contour of the whole splined component with the involute flanks, the root fillets, the major and the minor circles for the mean actual tooth thickness or space width.
+
+    The fillet is approximated by the quarter circle of the root radius tangent to the root circle and ending on the flank, the flank covers the form circle. The contour is cached per specification, resolution and length.
+
+    Parameters
+    ----------
+    spec : str
+        The spline specification.
+    resolution : int
+        The number of segments per flank, fillet and arc.
+    length : float
+        The splines length, default None, it changes the actual sizes of ISO 4156 splines.
+
+    Returns
+    -------
+    tuple
+        The (x, y) points in the specification units, starting at the space (external) or the tooth (internal) centre.
+    """
+    splines = cached_splines(spec, length)
+    if splines.spline_type == 'EXT':
+        half = _ext_half_tooth(splines, resolution)
+    else:
+        half = _int_half_space(splines, resolution)
+    pattern = half + [(r, -theta) for r, theta in reversed(half[:-1])]
+    pattern.pop()
+    points = []
+    for tooth in range(splines.teeth):
+        rotation = 2 * pi * tooth / splines.teeth
+        points.extend((r * cos(theta + rotation), r * sin(theta + rotation))
+                      for r, theta in pattern)
+    return tuple(points)
+
+
+def write_csv(specs, path, resolution=20):
+    """
+    Writes the contours of the specifications to the CSV file with the `spec`, `x` and `y` columns one contour at a time.
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(('spec', 'x', 'y'))
+        for spec in specs:
+            writer.writerows(
+                (spec, x, y) for x, y in gear_profile(spec, resolution))
+
+
+def write_dxf(specs, path, resolution=20):
+    """
+    Writes the contours of the specifications to the DXF R12 file as the closed polylines one contour at a time, the n-th contour on the layer SPLINE_n.
+    """
+    with open(path, 'w') as f:
+        f.write('0\nSECTION\n2\nENTITIES\n')
+        for i, spec in enumerate(specs):
+            layer = f'SPLINE_{i}'
+            f.write(f'0\nPOLYLINE\n8\n{layer}\n66\n1\n70\n1\n'
+                    '10\n0.0\n20\n0.0\n30\n0.0\n')
+            for x, y in gear_profile(spec, resolution):
+                f.write(f'0\nVERTEX\n8\n{layer}\n10\n{x:.6f}\n20\n{y:.6f}\n'
+                        '30\n0.0\n')
+            f.write(f'0\nSEQEND\n8\n{layer}\n')
+        f.write('0\nENDSEC\n0\nEOF\n')
+
+
+def profile_svg(spec, resolution=20, length=None):
+    """
+    Returns the SVG document of the contour of the specification and the length centred in the view box of the outer diameter.
+    """
+    points = gear_profile(spec, resolution, length)
+    r = max((x * x + y * y)**.5 for x, y in points)
+    path_data = ' '.join(f'{x:.6f},{-y:.6f}' for x, y in points)
+    return ('<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="{-r:.6f} {-r:.6f} {2 * r:.6f} {2 * r:.6f}">\n'
+            f'<title>{escape(spec)}</title>\n'
+            f'<polygon points="{path_data}" fill="none" stroke="black" '
+            f'stroke-width="{r / 500:.6f}"/>\n'
+            '</svg>\n')
+
+
+def write_svg(spec, path, resolution=20):
+    """
+    Writes the contour of the specification to the SVG file, see `profile_svg`.
+    """
+    with open(path, 'w') as f:
+        f.write(profile_svg(spec, resolution))
@@ -0,0 +1,219 @@
+import html
+import os
+import re
+from collections import namedtuple
+from multiprocessing import Pool
+from string import Template
+
+from splines import cached_splines
+
+# The document parts of the format: the header and the footer filled once per
+# file, the block filled per splines with the rows filled per drawing data row
+Format = namedtuple('Format',
+                    ['header', 'block', 'row', 'footer', 'escape', 'extension'])
+
+# The LaTeX special characters, escaped in one pass so that the escapes are
+# not escaped again
+_LATEX_ESCAPES = {
+    **{char: '\\' + char
+       for char in '&%$#_{}'},
+    '\\': '\\textbackslash{}',
+    '~': '\\textasciitilde{}',
+    '^': '\\textasciicircum{}',
+}
+_LATEX_SPECIAL = re.compile('|'.join(map(re.escape, _LATEX_ESCAPES)))
+
+FORMATS = {
+    'html':
+    Format(
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+        '<title>$title</title>\n<style>\n'
+        'table { border-collapse: collapse; margin: 1em 0; }\n'
+        'th, td { border: 1px solid black; padding: 0.2em 0.5em; }\n'
+        'th { text-align: left; font-weight: normal; }\n'
+        'td { text-align: right; }\n</style>\n</head>\n<body>\n',
+        '<table class="drawing-data">\n<caption>$spec</caption>\n$rows'
+        '</table>\n', '<tr><th>$label</th><td>$value</td></tr>\n',
+        '</body>\n</html>\n', html.escape, '.html'),
+    'latex':
+    Format(
+        '\\documentclass{article}\n\\usepackage{booktabs}\n'
+        '\\title{$title}\n\\begin{document}\n',
+        '\\begin{table}[htbp]\n\\centering\n\\caption{$spec}\n'
+        '\\begin{tabular}{lr}\n\\toprule\n$rows\\bottomrule\n'
+        '\\end{tabular}\n\\end{table}\n', '$label & $value \\\\\n',
+        '\\end{document}\n', lambda text: _LATEX_SPECIAL.sub(
+            lambda match: _LATEX_ESCAPES[match.group()], text),
+        '.tex'),
+    'dxf':
+    Format(
+        '0\nSECTION\n2\nENTITIES\n', '$rows',
+        '0\nTEXT\n8\n$layer\n10\n$x\n20\n$y\n30\n0.0\n40\n$height\n1\n$label\n'
+        '0\nTEXT\n8\n$layer\n10\n$value_x\n20\n$y\n30\n0.0\n40\n$height\n'
+        '1\n$value\n', '0\nENDSEC\n0\nEOF\n', str, '.dxf'),
+}
+
+
+def compile_template(text):
+    """
+    Splits the template into the literal text and the placeholders once, so filling it is a join of the parts.
+
+    Parameters
+    ----------
+    text : str
+        The template in the `string.Template` syntax.
+
+    Returns
+    -------
+    callable
+        Fills the template from the keyword arguments.
+    """
+    parts, names = [], []
+    position = 0
+    for match in Template.pattern.finditer(text):
+        parts.append(text[position:match.start()])
+        if match.group('escaped') is not None:
+            parts.append('$')
+        else:
+            names.append(
+                (len(parts), match.group('named') or match.group('braced')))
+            parts.append(None)
+        position = match.end()
+    parts.append(text[position:])
+
+    def fill(**values):
+        filled = parts[:]
+        for i, name in names:
+            filled[i] = str(values[name])
+        return ''.join(filled)
+
+    return fill
+
+
+# The formats with the templates compiled once per process
+_COMPILED = {
+    name: Format(*map(compile_template, fmt[:4]), fmt.escape, fmt.extension)
+    for name, fmt in FORMATS.items()
+}
+
+
+def _key(splines):
+    if isinstance(splines, str):
+        return splines, None, None, None
+    return splines.spec, splines.length, splines.edition, splines._pin_dia
+
+
+def render_table(splines, fmt='html', units=None, index=0, height=2.5):
+    """
+    Renders the drawing data table of the splines in the format.
+
+    Parameters
+    ----------
+    splines : Splines
+        The splines.
+    fmt : str
+        The format, 'html', 'latex' or 'dxf'.
+    units : str
+        The units of the sizes, see `Splines.drawing_data`.
+    index : int
+        The position of the table in the document, the DXF tables are placed side by side on the layers DRAWING_DATA_n.
+    height : float
+        The text height of the DXF tables.
+
+    Returns
+    -------
+    str
+    """
+    compiled, escape = _COMPILED[fmt], FORMATS[fmt].escape
+    rows = [(splines.spec, '')] if fmt == 'dxf' else []
+    rows += splines.drawing_data(units)
+    x = index * 40 * height
+    return compiled.block(
+        spec=escape(splines.spec),
+        rows=''.join(
+            compiled.row(label=escape(label),
+                         value=escape(str(value)),
+                         layer=f'DRAWING_DATA_{index}',
+                         x=x,
+                         value_x=x + 20 * height,
+                         y=-1.5 * height * i,
+                         height=height) for i, (label, value) in enumerate(rows)))
+
+
+def render_block(key, fmt='html', units=None, index=0, height=2.5):
+    """
+    Renders the drawing data table of the cached splines, see `render_table`.
+
+    Parameters
+    ----------
+    key : tuple
+        The specification, the length, the edition and the pin diameter of the splines.
+
+    Returns
+    -------
+    str
+    """
+    return render_table(cached_splines(*key), fmt, units, index, height)
+
+
+def _render_block(args):
+    return render_block(*args)
+
+
+def _write_blocks(f, blocks):
+    count = 0
+    for count, block in enumerate(blocks, start=1):
+        f.write(block)
+    return count
+
+
+def render(catalogue,
+           path,
+           fmt=None,
+           units=None,
+           processes=None,
+           chunksize=16,
+           title='Drawing data'):
+    """
+    Renders the drawing data tables of the catalogue to one file, the tables are rendered in parallel and written in the catalogue order as they are done.
+
+    Parameters
+    ----------
+    catalogue : iterable
+        The `Splines` or the specifications.
+    path : str
+        The path of the file.
+    fmt : str
+        The format, 'html', 'latex' or 'dxf', default by the file extension.
+    units : str
+        The units of the sizes, see `Splines.drawing_data`.
+    processes : int
+        The number of the worker processes, default the number of the CPUs, 1 renders in this process.
+    chunksize : int
+        The number of the tables per task of the worker processes.
+    title : str
+        The document title.
+
+    Returns
+    -------
+    int
+        The tables count.
+    """
+    if fmt is None:
+        extension = os.path.splitext(path)[1]
+        fmt = next((name for name, known in FORMATS.items()
+                    if known.extension == extension), None)
+    if fmt not in FORMATS:
+        raise ValueError(f'The format is unknown: {fmt}')
+    tasks = ((_key(splines), fmt, units, index)
+             for index, splines in enumerate(catalogue))
+    with open(path, 'w') as f:
+        f.write(_COMPILED[fmt].header(title=FORMATS[fmt].escape(title)))
+        if processes == 1:
+            count = _write_blocks(f, map(_render_block, tasks))
+        else:
+            with Pool(processes) as pool:
+                count = _write_blocks(
+                    f, pool.imap(_render_block, tasks, chunksize))
+        f.write(_COMPILED[fmt].footer())
+    return count
@@ -0,0 +1,292 @@
+import csv
+from math import acos, ceil, cos, floor, pi, radians, sin, sqrt, tan
+from types import FunctionType, SimpleNamespace
+
+import kernels
+import splines
+from splines import STANDARDS, Splines, calculate_batch, edition_tables
+
+# The continuous inputs of the splines sizes, the module of ISO 4156 splines
+# and the diametral pitch of ANSI B92 and BS 3550 splines
+INPUTS = ('module', 'diametral_pitch', 'pressure_angle', 'length', 'pin_dia')
+
+
+class Dual:
+    """
+    A dual number of the value and its gradient with respect to the inputs for the forward mode differentiation
+
+    Attributes
+    ----------
+    value: float
+        The value.
+    grad: tuple
+        The partial derivatives of the value.
+    """
+
+    __slots__ = ('value', 'grad')
+
+    def __init__(self, value, grad):
+        self.value = value
+        self.grad = grad
+
+    def __repr__(self):
+        return f'Dual({self.value!r}, {self.grad!r})'
+
+    def _lift(self, other):
+        if isinstance(other, Dual):
+            return other
+        return Dual(other, (0., ) * len(self.grad))
+
+    def __add__(self, other):
+        other = self._lift(other)
+        return Dual(self.value + other.value,
+                    tuple(a + b for a, b in zip(self.grad, other.grad)))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = self._lift(other)
+        return Dual(self.value - other.value,
+                    tuple(a - b for a, b in zip(self.grad, other.grad)))
+
+    def __rsub__(self, other):
+        return self._lift(other) - self
+
+    def __mul__(self, other):
+        if not isinstance(other, Dual):
+            return Dual(self.value * other, tuple(a * other for a in self.grad))
+        return Dual(
+            self.value * other.value,
+            tuple(a * other.value + self.value * b
+                  for a, b in zip(self.grad, other.grad)))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, Dual):
+            return Dual(self.value / other, tuple(a / other for a in self.grad))
+        return Dual(
+            self.value / other.value,
+            tuple((a * other.value - self.value * b) / other.value**2
+                  for a, b in zip(self.grad, other.grad)))
+
+    def __rtruediv__(self, other):
+        return self._lift(other) / self
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Dual):
+            raise TypeError('The exponent must be a number')
+        derivative = exponent * self.value**(exponent - 1)
+        return Dual(self.value**exponent,
+                    tuple(derivative * a for a in self.grad))
+
+    def __neg__(self):
+        return Dual(-self.value, tuple(-a for a in self.grad))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.value < 0 else self
+
+    def __round__(self, ndigits=None):
+        # the rounded values are piecewise constant
+        if ndigits is None:
+            return round(self.value)
+        return Dual(round(self.value, ndigits), (0., ) * len(self.grad))
+
+    def __ceil__(self):
+        return ceil(self.value)
+
+    def __floor__(self):
+        return floor(self.value)
+
+    def __eq__(self, other):
+        return self.value == getattr(other, 'value', other)
+
+    def __ne__(self, other):
+        return self.value != getattr(other, 'value', other)
+
+    def __lt__(self, other):
+        return self.value < getattr(other, 'value', other)
+
+    def __le__(self, other):
+        return self.value <= getattr(other, 'value', other)
+
+    def __gt__(self, other):
+        return self.value > getattr(other, 'value', other)
+
+    def __ge__(self, other):
+        return self.value >= getattr(other, 'value', other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __bool__(self):
+        return bool(self.value)
+
+
+def _chain(function, derivative):
+    """
+    Returns the function of the number or the `Dual` by the chain rule.
+    """
+
+    def chained(x):
+        if isinstance(x, Dual):
+            slope = derivative(x.value)
+            return Dual(function(x.value), tuple(slope * a for a in x.grad))
+        return function(x)
+
+    chained.__name__ = function.__name__
+    return chained
+
+
+DUAL_MATH = {
+    'acos': _chain(acos, lambda x: -1 / sqrt(1 - x * x)),
+    'cos': _chain(cos, lambda x: -sin(x)),
+    'sin': _chain(sin, cos),
+    'tan': _chain(tan, lambda x: 1 / cos(x)**2),
+    'sqrt': _chain(sqrt, lambda x: .5 / sqrt(x)),
+    'radians': _chain(radians, lambda x: pi / 180),
+}
+
+
+def _rebind(function, namespace):
+    """
+    Returns the copy of the function looking up its globals, e.g. the math functions, in the namespace.
+    """
+    return FunctionType(function.__code__, namespace, function.__name__,
+                        function.__defaults__, function.__closure__)
+
+
+# The splines calculation running on the `Dual` numbers: the module globals,
+# the `Splines` methods and the kernels see the dual math functions
+_namespace = {**vars(splines), **DUAL_MATH}
+for _name in ('involute', 'involute_from_measurement'):
+    _namespace[_name] = _rebind(_namespace[_name], _namespace)
+DualSplines = type(
+    'DualSplines', (Splines, ), {
+        name: _rebind(function, _namespace)
+        for name, function in vars(Splines).items()
+        if isinstance(function, FunctionType)
+    })
+DUAL_KERNELS = SimpleNamespace(
+    **{
+        function.__name__: _rebind(function, {
+            **vars(kernels),
+            **DUAL_MATH
+        })
+        for function in kernels._KERNELS
+    })
+
+
+def _dual_function(function):
+    if function is None:
+        return None
+    if vars(Splines).get(function.__name__) is function:
+        return getattr(DualSplines, function.__name__)
+    if function.__globals__ is vars(splines):
+        return _rebind(function, _namespace)
+    return _rebind(function, {**function.__globals__, **DUAL_MATH})
+
+
+def _dual_standards():
+    """
+    Returns the registry of the standards with the calculation running on the `Dual` numbers.
+    """
+    return {
+        name: standard._replace(
+            calculate=_dual_function(standard.calculate),
+            calculate_batch=_dual_function(standard.calculate_batch))
+        for name, standard in STANDARDS.items()
+    }
+
+
+def jacobians(specs, lengths=None, edition=None, pin_dias=None):
+    """
+    Calculates the derivatives of the sizes of the batch of the splines with respect to the continuous inputs by the forward mode differentiation in one pass. The default length and the recommended pin diameter are held at their values.
+
+    Parameters
+    ----------
+    specs : iterable
+        The spline specifications.
+    lengths : iterable
+        The splines lengths, default None for all.
+    edition : str
+        The edition of the standard tables, default the edition of each standard.
+    pin_dias : iterable
+        The measuring pin diameters, default None for the recommended ones.
+
+    Returns
+    -------
+    list
+        The dictionaries of the sizes, each one the dictionary of the derivatives keyed by the inputs, see `INPUTS`, in the order of the specifications.
+    """
+    specs = list(specs)
+    if lengths is None:
+        lengths = [None] * len(specs)
+    if pin_dias is None:
+        pin_dias = [None] * len(specs)
+    pin_dias = list(pin_dias)
+    standards = _dual_standards()
+    _namespace['STANDARDS'] = standards
+    batches = {}
+    result = []
+    for plain, pin_dia in zip(calculate_batch(specs, lengths, edition=edition),
+                              pin_dias):
+        dual = DualSplines.__new__(DualSplines)
+        dual.spec, dual.length = plain.spec, plain.length
+        dual.standard, dual._kernels = plain.standard, DUAL_KERNELS
+        dual.edition, dual._tables = edition_tables(plain.standard, edition)
+        standards[dual.standard].parse(dual)
+        dual._pin_dia = plain.measuring_pin_dia(
+        ) if pin_dia is None else pin_dia
+        inputs = [
+            name for name in INPUTS[:-1]
+            if getattr(dual, name, None) is not None
+        ] + ['pin_dia']
+        for i, name in enumerate(inputs):
+            grad = tuple(float(i == j) for j in range(len(inputs)))
+            if name == 'pin_dia':
+                dual._pin_dia = Dual(dual._pin_dia, grad)
+            else:
+                setattr(dual, name, Dual(getattr(dual, name), grad))
+        batches.setdefault(dual.standard, []).append(dual)
+        result.append((dual, inputs))
+    for name, batch in batches.items():
+        standards[name].calculate_batch(batch)
+    return [{
+        name: dict(zip(inputs, value.grad))
+        for name, value in vars(dual).items()
+        if isinstance(value, Dual) and not name.startswith('_')
+        and name not in inputs and value is not dual._pin_dia
+    } for dual, inputs in result]
+
+
+def jacobian(spec: str, length=None, edition=None, pin_dia=None):
+    """
+    Calculates the derivatives of the sizes of the splines with respect to the continuous inputs, see `jacobians`.
+
+    Returns
+    -------
+    dict
+        The dictionary of the derivatives keyed by the inputs per size.
+    """
+    return jacobians([spec], [length], edition, [pin_dia])[0]
+
+
+def write_jacobians(specs, path, lengths=None, edition=None):
+    """
+    Writes the derivatives of the sizes of the catalogue to the CSV file, one row per specification and size, returns the rows count.
+    """
+    count = 0
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(('spec', 'size', *(f'd_{name}' for name in INPUTS)))
+        specs = list(specs)
+        for spec, sizes in zip(specs, jacobians(specs, lengths, edition)):
+            for size, derivatives in sizes.items():
+                writer.writerow((spec, size,
+                                 *(derivatives.get(name) for name in INPUTS)))
+                count += 1
+    return count
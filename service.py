@@ -0,0 +1,238 @@
+import argparse
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+
+from splines import Splines, calculate_batch, json_sizes
+
+
+class SizingService:
+    """
+    A sizing service coalescing the concurrent requests of the same specification and calculating the distinct ones in batches
+
+    Attributes
+    ----------
+    window: float
+        The time to collect the requests into one batch in seconds, default 0.002.
+    cache_size: int
+        The number of the results kept in the cache, default 10000.
+
+    Methods
+    -------
+    size(spec, length)
+        Returns the sizes of the splines.
+    metrics()
+        Returns the service metrics.
+    serve(host, port)
+        Starts the HTTP server.
+    """
+
+    def __init__(self, window=0.002, cache_size=10000):
+        self.window = window
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.in_flight = {}
+        self.pending = []
+        self.flush_handle = None
+        self.tasks = set()
+        self.started = time.perf_counter()
+        self.latencies = deque(maxlen=10000)
+        self.counters = dict.fromkeys(
+            ('requests', 'cache_hits', 'coalesced', 'batches', 'calculated',
+             'errors'), 0)
+
+    async def size(self, spec: str, length=None):
+        """
+        Returns the copy of the sizes of the splines from the cache, from the calculation in flight for the same arguments or from the next batch.
+
+        Raises
+        ------
+        ValueError
+            If the specification cannot be calculated.
+        """
+        start = time.perf_counter()
+        self.counters['requests'] += 1
+        key = spec, length
+        try:
+            if key in self.cache:
+                self.counters['cache_hits'] += 1
+                self.cache.move_to_end(key)
+                return dict(self.cache[key])
+            if key in self.in_flight:
+                self.counters['coalesced'] += 1
+                return dict(await asyncio.shield(self.in_flight[key]))
+            future = asyncio.get_running_loop().create_future()
+            self.in_flight[key] = future
+            self.pending.append(key)
+            if self.flush_handle is None:
+                self.flush_handle = asyncio.get_running_loop().call_later(
+                    self.window, self._flush)
+            return dict(await asyncio.shield(future))
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+    def _flush(self):
+        self.flush_handle = None
+        keys, self.pending = self.pending, []
+        # the loop keeps the weak references to the tasks only
+        task = asyncio.get_running_loop().create_task(self._calculate(keys))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _calculate(self, keys):
+        self.counters['batches'] += 1
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(None, _calculate_keys, keys)
+        except Exception as e:
+            results = [e] * len(keys)
+        for key, result in zip(keys, results):
+            future = self.in_flight.pop(key)
+            if isinstance(result, Exception):
+                self.counters['errors'] += 1
+                future.set_exception(ValueError(f'{key[0]}: {result!r}'))
+                continue
+            self.counters['calculated'] += 1
+            self.cache[key] = result
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+            future.set_result(result)
+
+    def metrics(self):
+        """
+        Returns the counters, the throughput in requests per second and the latency percentiles in milliseconds.
+
+        Returns
+        -------
+        dict
+        """
+        latencies = sorted(self.latencies)
+        percentile = lambda p: 1e3 * latencies[min(
+            int(p * len(latencies)),
+            len(latencies) - 1)] if latencies else None
+        uptime = time.perf_counter() - self.started
+        return {
+            **self.counters,
+            'cache_size': len(self.cache),
+            'uptime': uptime,
+            'throughput': self.counters['requests'] / uptime,
+            'latency_p50': percentile(.5),
+            'latency_p95': percentile(.95),
+            'latency_p99': percentile(.99),
+        }
+
+    async def _handle_request(self, method, path, body):
+        if method == 'GET' and path == '/metrics':
+            return 200, self.metrics()
+        if method == 'POST' and path == '/sizes':
+            request = json.loads(body)
+            if not isinstance(request, dict):
+                raise TypeError('The request is not a JSON object')
+            if 'specs' in request:
+                results = await asyncio.gather(
+                    *(self.size(item['spec'], item.get('length'))
+                      for item in request['specs']),
+                    return_exceptions=True)
+                return 200, [{
+                    'error': str(result)
+                } if isinstance(result, Exception) else result
+                             for result in results]
+            return 200, await self.size(request['spec'], request.get('length'))
+        return 404, {'error': f'{method} {path} not found'}
+
+    async def _read_request(self, reader, request_line):
+        method, path, _ = request_line.decode().split(' ', 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, value = line.decode().split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get('content-length', 0)))
+        return method, path, headers, body
+
+    async def _reply(self, writer, status, payload):
+        content = json.dumps(payload).encode()
+        writer.write(
+            f'HTTP/1.1 {status} {"OK" if status == 200 else "Error"}\r\n'
+            'Content-Type: application/json\r\n'
+            f'Content-Length: {len(content)}\r\n\r\n'.encode() + content)
+        await writer.drain()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                # the malformed request ends the connection, the request
+                # which cannot be sized only fails itself
+                try:
+                    method, path, headers, body = await self._read_request(
+                        reader, request_line)
+                except ValueError as e:
+                    await self._reply(writer, 400,
+                                      {'error': f'Malformed request: {e}'})
+                    break
+                try:
+                    status, payload = await self._handle_request(
+                        method, path, body)
+                except (ValueError, KeyError, TypeError) as e:
+                    status, payload = 400, {'error': str(e)}
+                await self._reply(writer, status, payload)
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8000):
+        """
+        Starts the HTTP server with the POST /sizes and GET /metrics endpoints.
+
+        Returns
+        -------
+        asyncio.Server
+        """
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+
+def _calculate_keys(keys):
+    """
+    Calculates the batch of the (spec, length) keys, the specifications failing in the batch are calculated one by one to return their exceptions.
+    """
+    try:
+        return [json_sizes(splines) for splines in calculate_batch(*zip(*keys))]
+    except Exception:
+        results = []
+        for spec, length in keys:
+            try:
+                results.append(json_sizes(Splines(spec, length)))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Splines sizing service')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--window', type=float, default=0.002)
+    parser.add_argument('--cache-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    async def run():
+        service = SizingService(args.window, args.cache_size)
+        server = await service.serve(args.host, args.port)
+        print(f'Serving on http://{args.host}:{args.port}')
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
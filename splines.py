@@ -1,258 +1,122 @@
 import re
-from math import ceil, cos, sin, tan, pi, radians, sqrt, degrees
+from collections import namedtuple
+from copy import copy
+from functools import lru_cache
+from math import acos, ceil, cos, isnan, tan, pi, radians, sqrt
 from renard import R40, find_greater_than_or_equal
 
-# See table 5 ISO 4156-1:2005
-FUNDAMENTAL_DEVIATIONS = {
-    range(1, 4): {
-        'd': -20,
-        'e': -14,
-        'f': -6,
-        'h': 0,
-        'H': 0,
-    },
-    range(3, 7): {
-        'd': -30,
-        'e': -20,
-        'f': -10,
-        'h': 0,
-        'H': 0,
-    },
-    range(7, 10): {
-        'd': -40,
-        'e': -25,
-        'f': -13,
-        'h': 0,
-        'H': 0,
-    },
-    range(10, 18): {
-        'd': -50,
-        'e': -32,
-        'f': -16,
-        'h': 0,
-        'H': 0,
-    },
-    range(18, 30): {
-        'd': -65,
-        'e': -40,
-        'f': -20,
-        'h': 0,
-        'H': 0,
-    },
-    range(30, 50): {
-        'd': -80,
-        'e': -50,
-        'f': -25,
-        'h': 0,
-        'H': 0,
-    },
-    range(50, 80): {
-        'd': -100,
-        'e': -60,
-        'f': -30,
-        'h': 0,
-        'H': 0,
-    },
-    range(80, 120): {
-        'd': -120,
-        'e': -72,
-        'f': -36,
-        'h': 0,
-        'H': 0,
-    },
-    range(120, 180): {
-        'd': -145,
-        'e': -85,
-        'f': -43,
-        'h': 0,
-        'H': 0,
-    },
-    range(180, 250): {
-        'd': -170,
-        'e': -100,
-        'f': -50,
-        'h': 0,
-        'H': 0,
-    },
-    range(250, 315): {
-        'd': -190,
-        'e': -110,
-        'f': -56,
-        'h': 0,
-        'H': 0,
-    },
-    range(315, 400): {
-        'd': -210,
-        'e': -125,
-        'f': -62,
-        'h': 0,
-        'H': 0,
-    },
-    range(400, 500): {
-        'd': -230,
-        'e': -135,
-        'f': -68,
-        'h': 0,
-        'H': 0,
-    },
-    range(500, 630): {
-        'd': -260,
-        'e': -145,
-        'f': -76,
-        'h': 0,
-        'H': 0,
-    },
-    range(630, 800): {
-        'd': -290,
-        'e': -160,
-        'f': -80,
-        'h': 0,
-        'H': 0,
-    },
-    range(800, 1000): {
-        'd': -320,
-        'e': -170,
-        'f': -86,
-        'h': 0,
-        'H': 0,
-    },
-}
+from editions import load_edition
+from kernels import get_kernels
 
-# See table 11 ISO 4156-1:2005
-MAJOR_MINOR_DIA_TOLERANCES = {
-    range(1, 4): {
-        10: 40
-    },
-    range(4, 7): {
-        10: 48,
-        11: 75
-    },
-    range(7, 11): {
-        10: 58,
-        11: 90
-    },
-    range(11, 19): {
-        10: 70,
-        11: 110,
-        12: 180
-    },
-    range(19, 31): {
-        10: 84,
-        11: 130,
-        12: 210
-    },
-    range(31, 51): {
-        10: 100,
-        11: 160,
-        12: 250
-    },
-    range(51, 81): {
-        10: 120,
-        11: 190,
-        12: 300
-    },
-    range(81, 121): {
-        11: 200,
-        12: 350
-    },
-    range(121, 181): {
-        11: 250,
-        12: 400
-    },
-    range(181, 251): {
-        12: 460
-    },
-    range(251, 316): {
-        12: 520
-    },
-    range(316, 401): {
-        12: 570
-    },
-    range(401, 501): {
-        12: 630
-    },
-    range(501, 631): {
-        12: 700
-    },
-    range(631, 801): {
-        12: 800
-    },
-    range(801, 1001): {
-        12: 900
-    },
-}
+# The row of the `coefficients` table of ANSI B92.1, see table 2 ANSI
+# B92.1-1996, the coefficients of the form diameter
+# (N + form_offset) / P + form_clearance * c_F + form_constant, of the minor
+# diameter (N + minor_offset) / P + minor_constant + minor_tolerance * T / tan(alpha)
+# with minor_offset_fine for P > 12, and of the effective tooth thickness or
+# space width (0.5 * pi + eff_offset) / P
+AnsiCoefficients = namedtuple('AnsiCoefficients', [
+    'form_offset', 'form_clearance', 'form_constant', 'minor_offset',
+    'minor_offset_fine', 'minor_constant', 'minor_tolerance', 'eff_offset'
+])
 
-# see table 107 ANSI B92.1-1996
-maj_min_dia_tolerances_dict = {
-    range(1, 3): {
-        'TAB': 0.0200,
-        'FN': lambda P: round((2000 / P + 250) * 1e-4, ndigits=4)
-    },
-    range(3, 4): {
-        'TAB': 0.0150,
-        'FN': lambda P: round((2000 / P + 200) * 1e-4, ndigits=4)
-    },
-    range(4, 5): {
-        'TAB': 0.0100,
-        'FN': lambda P: round((2000 / P + 150) * 1e-4, ndigits=4)
-    },
-    range(5, 6): {
-        'TAB': 0.0080,
-        'FN': lambda P: round((2000 / P + 130) * 1e-4, ndigits=4)
-    },
-    range(6, 32): {
-        'TAB': 0.0050,
-        'FN': lambda P: round((2000 / P + 100) * 1e-4, ndigits=4)
-    },
-    range(32, 64): {
-        'TAB': 0.0030,
-        'FN': lambda P: round((2000 / P + 80) * 1e-4, ndigits=4)
-    },
-    range(64, 160): {
-        'TAB': 0.0020,
-        'FN': lambda P: round((2000 / P + 70) * 1e-4, ndigits=4)
-    },
+# The drawing data fields (label, attribute, ndigits) according to section
+# 12.4 ISO 4156-1:2005
+ISO_DRAWING_DATA = {
+    'INT': [
+        ('Pitch diameter', 'pitch_dia', 4),
+        ('Base diameter', 'base_dia', 4),
+        ('Min major diameter', 'min_major_int_dia', 3),
+        ('Max major diameter', 'max_major_int_dia', 3),
+        ('Min form diameter', 'min_form_int_dia', 3),
+        ('Min minor diameter', 'min_minor_int_dia', 3),
+        ('Max minor diameter', 'max_minor_int_dia', 3),
+        ('Max actual space width', 'max_act_width', 3),
+        ('Max effective space width', 'max_eff_width', 3),
+        ('Min actual space width', 'min_act_width', 3),
+        ('Min effective space width', 'min_eff_width', 3),
+        ('Max measurement between pins', 'max_int_measurement', 3),
+        ('Min measurement between pins', 'min_int_measurement', 3),
+        ('Pin diameter', 'int_pin_dia', 3),
+        ('Fillet radius', 'int_root_rad', 1),
+    ],
+    'EXT': [
+        ('Pitch diameter', 'pitch_dia', 4),
+        ('Base diameter', 'base_dia', 4),
+        ('Max major diameter', 'max_major_ext_dia', 4),
+        ('Min major diameter', 'min_major_ext_dia', 4),
+        ('Max form diameter', 'max_form_dia', 3),
+        ('Min minor diameter', 'min_minor_ext_dia', 3),
+        ('Max minor diameter', 'max_minor_ext_dia', 3),
+        ('Max effective tooth thickness', 'max_eff_thickness', 3),
+        ('Max actual tooth thickness', 'max_act_thickness', 3),
+        ('Min effective tooth thickness', 'min_eff_thickness', 3),
+        ('Min actual tooth thickness', 'min_act_thickness', 3),
+        ('Max measurement over pins', 'max_ext_measurement', 3),
+        ('Min measurement over pins', 'min_ext_measurement', 3),
+        ('Pin diameter', 'ext_pin_dia', 3),
+        ('Fillet radius', 'ext_root_rad', 1),
+    ],
 }
 
-# see table 106 ANSI B92.1-1996
-allowances_class5 = {
-    range(1, 4): {
-        'machining': lambda N: round((0.18 * N + 15) * 1e-4, ndigits=4),
-        'variations': lambda N: round((0.35 * N + 20) * 1e-4, ndigits=4),
-    },
-    range(4, 6): {
-        'machining': lambda N: round((0.15 * N + 13) * 1e-4, ndigits=4),
-        'variations': lambda N: round((0.23 * N + 18) * 1e-4, ndigits=4),
-    },
-    range(6, 10): {
-        'machining': lambda N: round((0.15 * N + 11) * 1e-4, ndigits=4),
-        'variations': lambda N: round((0.20 * N + 15) * 1e-4, ndigits=4),
-    },
-    range(10, 16): {
-        'machining': lambda N: round((0.10 * N + 11) * 1e-4, ndigits=4),
-        'variations': lambda N: round((0.17 * N + 14) * 1e-4, ndigits=4),
-    },
-    range(16, 24): {
-        'machining': lambda N: round((0.07 * N + 11) * 1e-4, ndigits=4),
-        'variations': lambda N: round((0.12 * N + 13) * 1e-4, ndigits=4),
-    },
-    range(24, 49): {
-        'machining': lambda N: round((0.07 * N + 11) * 1e-4, ndigits=4),
-        'variations': lambda N: round((0.12 * N + 11) * 1e-4, ndigits=4),
-    },
-    range(64, 81): {
-        'machining': lambda N: round((0.06 * N + 9) * 1e-4, ndigits=4),
-        'variations': lambda N: round((0.10 * N + 10) * 1e-4, ndigits=4),
-    },
-    range(128, 256): {
-        'machining': lambda N: round((0.05 * N + 9) * 1e-4, ndigits=4),
-        'variations': lambda N: round((0.08 * N + 9) * 1e-4, ndigits=4),
-    },
+# The drawing data fields (label, attribute, ndigits) of ANSI B92.1-1996
+ANSI_DRAWING_DATA = {
+    'INT': [
+        ('Base diameter', 'base_dia', 6),
+        ('Pitch diameter', 'pitch_dia', 6),
+        ('Max major diameter', 'max_major_int_dia', 4),
+        ('Min major diameter', 'min_major_int_dia', 4),
+        ('Form diameter', 'form_dia', 3),
+        ('Min minor diameter', 'min_minor_int_dia', 4),
+        ('Max minor diameter', 'max_minor_int_dia', 4),
+        ('Max actual space width', 'max_act_width', 4),
+        ('Max effective space width', 'max_eff_width', 4),
+        ('Min actual space width', 'min_act_width', 4),
+        ('Min effective space width', 'min_eff_width', 4),
+        ('Max measurement between pins', 'max_pin_measurement', 4),
+        ('Min measurement between pins', 'min_pin_measurement', 4),
+        ('Pin diameter', 'pin_dia', 4),
+        ('Max corner clearance', 'max_corner_clearance', 3),
+        ('Min corner clearance', 'min_corner_clearance', 3),
+    ],
+    'EXT': [
+        ('Base diameter', 'base_dia', 6),
+        ('Pitch diameter', 'pitch_dia', 6),
+        ('Min major diameter', 'min_major_ext_dia', 4),
+        ('Max major diameter', 'max_major_ext_dia', 4),
+        ('Form diameter', 'form_dia', 3),
+        ('Min minor diameter', 'min_minor_ext_dia', 3),
+        ('Max effective tooth thickness', 'max_eff_thickness', 4),
+        ('Max actual tooth thickness', 'max_act_thickness', 4),
+        ('Min effective tooth thickness', 'min_eff_thickness', 4),
+        ('Min actual tooth thickness', 'min_act_thickness', 4),
+        ('Max measurement over pins', 'max_pin_measurement', 4),
+        ('Min measurement over pins', 'min_pin_measurement', 4),
+        ('Pin diameter', 'pin_dia', 4),
+        ('Max chamfer height', 'max_major_dia_chamfer', 3),
+        ('Min chamfer height', 'min_major_dia_chamfer', 3),
+    ],
 }
 
 involute = lambda alpha: tan(radians(alpha)) - radians(alpha)
-sevolute = lambda phi: 1 / cos(radians(phi)) - involute(phi)
-inverse_involute = lambda x: x**(1 / 3) / (.693357 + .192484 * x**(2 / 3))
+
+
+def involute_from_measurement(base_dia,
+                              pin_dia,
+                              teeth,
+                              measurement,
+                              external=True):
+    """
+    Calculates the involute of the pressure angle at the pin centre from the measurement over (external) or between (internal) two pins, the inverse of `kernels.pin_measurement`.
+
+    Returns
+    -------
+    float
+    """
+    centres_dia = measurement - pin_dia if external else measurement + pin_dia
+    if teeth % 2:
+        centres_dia /= cos(pi / (2 * teeth))
+    alpha = acos(base_dia / centres_dia)
+    return tan(alpha) - alpha
 
 
 class Splines:
@@ -265,508 +129,658 @@ class Splines:
         A formatted string according to either the designation section in section 12.3 ISO 4156-1:2005, or ANSI B92.
     length: float
         The splines length, default None.
+    backend: str
+        The backend of the numeric kernels, 'python' or 'numba', default 'python'. The 'numba' backend falls back to 'python' when Numba is not installed.
+    edition: str
+        The edition of the standard tables, e.g. 'ISO 4156-1:2005' or 'ANSI B92.1-1996', default the edition registered with the standard.
+    pin_dia: float
+        The measuring pin diameter, default None for the diameter recommended by the standard.
     
     Methods
     -------
     calculate_spline_sizes()
         Calculates the spline sizes to the given specification
+    with_tolerance(tolerance)
+        Returns the copy of the splines for another tolerance designation.
+    as_dict()
+        Returns the parameters and the sizes as the dictionary.
+    act_size_limits()
+        Returns the limits of the actual tooth thickness or space width.
+    act_size_from_measurement(measurement)
+        Calculates the actual tooth thickness or space width from the measurement over or between pins.
+    measurement_from_act_size(act_size, pin_dia)
+        Calculates the measurement over or between pins for the actual tooth thickness or space width.
+    ball_measurement(ball_dia)
+        Calculates the limits of the measurement over or between balls.
+    span_measurement(k)
+        Calculates the limits of the base tangent length over k teeth.
+    drawing_data(units)
+        Returns the list of sizes required on the splined component drawing.
     print_drawing_data()
         Prints the list of sizes required on the splined component drawing.
     """
 
-    def __init__(self, spec: str, length=None):
+    def __init__(self,
+                 spec: str,
+                 length=None,
+                 backend='python',
+                 edition=None,
+                 pin_dia=None):
         self.spec = spec
         self.length = length
+        self.edition = edition
+        self._pin_dia = pin_dia
+        self._kernels = get_kernels(backend)
         self.calculate_spline_sizes()
 
     def calculate_spline_sizes(self):
         """
-        Calculates the sizes according to the methodology either in ISO 4156:1-2001, or in , or ANSI B92, stores the key sizes in the class attributes.
-        
+        Calculates the sizes according to the methodology either in ISO 4156:1-2001, or in ANSI B92, or in BS 3550, stores the key sizes in the class attributes. The standard is looked up in the `STANDARDS` registry by its designation in the specification, the tables are loaded from the data file of the edition.
+
         Returns
         -------
         None
         """
-        spec_list = [
-            i for i in re.split(
-                r'x| |/|-|ISO|4156|ANSI|B92|ROOT|FIT|BS|3550|CLASS', self.spec)
-            if bool(i)
-        ]
-        if 'ANSI' in self.spec:
-            self.spline_type, self.spline_root, self.spline_fit, self.diametral_pitch, self.stub_pitch, self.teeth, self.pressure_angle, self.tol_class = spec_list
-            self.diametral_pitch = float(
-                self.diametral_pitch) if '.' in self.diametral_pitch else int(
-                    self.diametral_pitch)
-            self.pressure_angle = float(self.pressure_angle)
-            self.stub_pitch = int(self.stub_pitch)
-            self.teeth = int(self.teeth[:-1])
-            self.tol_class = int(self.tol_class)
-
-            self.pitch_dia = self.teeth / self.diametral_pitch
-            self.base_dia = self.pitch_dia * cos(radians(self.pressure_angle))
-            self.circular_pitch = pi / float(self.diametral_pitch)
-
-            for pitch_range in maj_min_dia_tolerances_dict:
-                if self.diametral_pitch in pitch_range:
-                    self.dia_tolerance = maj_min_dia_tolerances_dict[
-                        pitch_range]
-
-            for pitch_range in allowances_class5:
-                if self.diametral_pitch in pitch_range:
-                    self.tolerances_class5 = allowances_class5[pitch_range][
-                        'machining'](self.teeth) + allowances_class5[
-                            pitch_range]['variations'](self.teeth)
-            if self.tol_class == 4:
-                self.total_tolerance = 0.71 * self.tolerances_class5
-            elif self.tol_class == 5:
-                self.total_tolerance = self.tolerances_class5
-            elif self.tol_class == 6:
-                self.total_tolerance = 1.40 * self.tolerances_class5
-            elif self.tol_class == 7:
-                self.total_tolerance = 2.00 * self.tolerances_class5
-
-            # see table 2 ANSI B92.1-1996
-            self.rad_form_clearance = min(max(0.001 * self.pitch_dia, 0.002),
-                                          0.01)
-
-            # see table 2 ANSI B92.1-1996
-            form_dia_dict = {
-                'EXT': {
-                    30.0: lambda N, P:
-                    (N - 1) / P - 2 * self.rad_form_clearance,
-                    37.5: lambda N, P:
-                    (N - 0.8) / P - 2 * self.rad_form_clearance,
-                    45.0: lambda N, P:
-                    (N - 0.6) / P - 2 * self.rad_form_clearance,
-                },
-                'INT': {
-                    'SIDE':
-                    lambda N, P: (N + 1) / P + 2 * self.rad_form_clearance,
-                    'DIA':
-                    lambda N, P:
-                    (N + 0.8) / P + 2 * self.rad_form_clearance - 0.004,
-                },
-            }
-            # see table 2 ANSI B92.1-1996
-            min_minor_dia_dict = {
-                'INT': {
-                    30.0: lambda N, P: (N - 1) / P,
-                    37.5: lambda N, P: (N - 0.8) / P,
-                    45.0: lambda N, P: (N - 0.6) / P,
-                },
-                'EXT': {
-                    30.0: {
-                        'FLAT':
-                        lambda N, P: (N - 1.35) / P - 0.004 - 2 * self.
-                        total_tolerance / tan(radians(self.pressure_angle)),
-                        'FILLET': {
-                            range(1, 12 + 1):
-                            lambda N, P:
-                            (N - 1.9) / P - 2 * self.total_tolerance / tan(
-                                radians(self.pressure_angle)),
-                            range(16, 160):
-                            lambda N, P:
-                            (N - 2.1) / P - 2 * self.total_tolerance / tan(
-                                radians(self.pressure_angle)),
-                        },
-                    },
-                    37.5:
-                    lambda N, P:
-                    (N - 1.4) / P - 2 * self.total_tolerance / tan(
-                        radians(self.pressure_angle)),
-                    45.0:
-                    lambda N, P:
-                    (N - 1.1) / P - 2 * self.total_tolerance / tan(
-                        radians(self.pressure_angle)),
-                },
-            }
-            # see table 107a ANSI B92.1-1996
-            eff_clearance_dia_fit_dict = {
-                range(1, 4): lambda N: round(
-                    (0.20 * N + 18) * 1e-4, ndigits=4),
-                range(4, 6): lambda N: round(
-                    (0.15 * N + 16) * 1e-4, ndigits=4),
-                range(6, 10): lambda N: round(
-                    (0.10 * N + 14) * 1e-4, ndigits=4),
-                range(10, 16): lambda N: round(
-                    (0.07 * N + 14) * 1e-4, ndigits=4),
-            }
-            for pitch_range in eff_clearance_dia_fit_dict:
-                if self.diametral_pitch in pitch_range:
-                    self.eff_clearance_dia_fit = eff_clearance_dia_fit_dict[
-                        pitch_range](self.teeth)
-                elif self.diametral_pitch >= 16:
-                    self.eff_clearance_dia_fit = 15 * 1e-4
+        self.standard = find_standard(self.spec)
+        self.edition, self._tables = edition_tables(self.standard, self.edition)
+        standard = STANDARDS[self.standard]
+        standard.parse(self)
+        standard.calculate(self)
 
-            if self.spline_type == 'EXT':
-                self.form_dia = form_dia_dict[self.spline_type][
-                    self.pressure_angle](self.teeth, self.diametral_pitch)
-                self.min_form_ext_dia = sqrt(3 * self.teeth**2 + (
-                    self.teeth - 0.016 * self.diametral_pitch - 4.5)**2) / (
-                        2 * self.diametral_pitch
-                    ) if self.spline_root == 'FLAT' else sqrt(
-                        3 * self.teeth**2 +
-                        (self.teeth - 5.359)**2) / (2 * self.diametral_pitch)
-                if self.pressure_angle == 30.0:
+    def _parse_ansi(self):
+        """
+        Parses the ANSI B92 specification.
+
+        Returns
+        -------
+        None
+        """
+        self.spline_type, self.spline_root, self.spline_fit, self.diametral_pitch, self.stub_pitch, self.teeth, self.pressure_angle, self.tol_class = spec_fields(
+            self.spec)
+        self.diametral_pitch = float(
+            self.diametral_pitch) if '.' in self.diametral_pitch else int(
+                self.diametral_pitch)
+        self.pressure_angle = float(self.pressure_angle)
+        self.stub_pitch = int(self.stub_pitch)
+        self.teeth = int(self.teeth[:-1])
+        self.tol_class = int(self.tol_class)
+
+    def _parse_bs(self):
+        """
+        Parses the BS 3550 specification, the tolerance class is optional and defaults to the class 5 which equals the tolerances of ANSI B92.1-1960 adopted by BS 3550.
+
+        Returns
+        -------
+        None
+        """
+        fields = spec_fields(self.spec)
+        self.spline_type, self.spline_root, self.spline_fit, self.diametral_pitch, self.stub_pitch, self.teeth, self.pressure_angle = fields[:7]
+        self.tol_class = int(fields[7]) if len(fields) > 7 else 5
+        self.diametral_pitch = float(
+            self.diametral_pitch) if '.' in self.diametral_pitch else int(
+                self.diametral_pitch)
+        self.pressure_angle = float(self.pressure_angle)
+        self.stub_pitch = int(self.stub_pitch)
+        self.teeth = int(self.teeth.rstrip('T'))
+
+    def _calculate_ansi(self):
+        """
+        Calculates the sizes according to ANSI B92.1-1996.
+
+        Returns
+        -------
+        None
+        """
+        self.pitch_dia = self.teeth / self.diametral_pitch
+        self.base_dia = self.pitch_dia * cos(radians(self.pressure_angle))
+        self.circular_pitch = pi / self.diametral_pitch
+        N, P = self.teeth, self.diametral_pitch
+
+        tables = self._tables
+        tab, b = tables.dia_tolerances.lookup(P)
+        self.dia_tolerance = {
+            'TAB': tab,
+            'FN': round((2000 / P + b) * 1e-4, ndigits=4)
+        }
+        machining_a, machining_b, variations_a, variations_b = tables.allowances_class5.lookup(
+            P)
+        variations_class5 = round((variations_a * N + variations_b) * 1e-4,
+                                  ndigits=4)
+        self.tolerances_class5 = round(
+            (machining_a * N + machining_b) * 1e-4,
+            ndigits=4) + variations_class5
+        class_factor, = tables.class_factors.lookup(self.tol_class)
+        self.total_tolerance = class_factor * self.tolerances_class5
+        self.variation_allowance = class_factor * variations_class5
+
+        # see table 2 ANSI B92.1-1996
+        self.rad_form_clearance = min(max(0.001 * self.pitch_dia, 0.002),
+                                      0.01)
+        c = AnsiCoefficients(*tables.coefficients.lookup(
+            self.spline_type, self.pressure_angle, self.spline_root,
+            self.spline_fit))
+        self.form_dia = (N + c.form_offset) / P + (
+            c.form_clearance * self.rad_form_clearance + c.form_constant)
+        min_minor_dia = (N + (c.minor_offset if P <= 12 else
+                              c.minor_offset_fine)) / P + (
+                                  c.minor_constant +
+                                  c.minor_tolerance * self.total_tolerance /
+                                  tan(radians(self.pressure_angle)))
+        a, b = tables.eff_clearance_dia_fit.lookup(P)
+        self.eff_clearance_dia_fit = round((a * N + b) * 1e-4, ndigits=4)
+
+        if self.spline_type == 'EXT':
+            self.min_form_ext_dia = sqrt(3 * N**2 + (N - 0.016 * P - 4.5)**2) / (
+                2 * P) if self.spline_root == 'FLAT' else sqrt(
+                    3 * N**2 + (N - 5.359)**2) / (2 * P)
+            self.max_eff_thickness = (0.5 * pi + c.eff_offset) / P
+            if self.pressure_angle == 30.0 and self.spline_fit == 'DIA':
+                self.max_eff_thickness -= self.eff_clearance_dia_fit
+            self.min_minor_ext_dia = min_minor_dia
+            self.form_ext_dia = max(self.min_form_ext_dia, self.form_dia)
+            if self.spline_fit == 'SIDE':
+                self.max_major_ext_dia = (N + 1) / P
+                self.min_major_ext_dia = self.max_major_ext_dia - self.dia_tolerance[
+                    'FN' if self.spline_root == 'FLAT' else 'TAB']
+            elif self.spline_fit == 'DIA':
+                self.max_major_dia_chamfer = .14 / P + .006
+                self.min_major_dia_chamfer = .1 / P + .002
+                self.max_major_ext_dia = (N + 1) / P - 0.0001
+                self.min_major_ext_dia = self.max_major_ext_dia - round(
+                    (3 + 2 * self.pitch_dia) * 1e-4, ndigits=4)
+            self.min_act_thickness = self.max_eff_thickness - self.total_tolerance
+            self.max_act_thickness = self.max_eff_thickness - self.variation_allowance
+            self.min_eff_thickness = self.min_act_thickness + self.variation_allowance
+            self.pin_dia = 1.9200 / P if self._pin_dia is None else self._pin_dia
+        elif self.spline_type == 'INT':
+            self.min_minor_int_dia = min_minor_dia
+            self.max_minor_int_dia = self.min_minor_int_dia + self.dia_tolerance[
+                'TAB']
+            self.min_eff_width = (0.5 * pi + c.eff_offset) / P
+            self.pin_dia = (
+                1.9200 if self.pressure_angle == 45.0 else 1.7280
+            ) / P if self._pin_dia is None else self._pin_dia
+            if self.pressure_angle == 30.0:
+                if self.spline_root == 'FLAT':
                     if self.spline_fit == 'SIDE':
-                        self.max_eff_thickness = 0.5 * self.circular_pitch
+                        self.max_major_int_dia = (N + 1.35) / P + 0.004
                     elif self.spline_fit == 'DIA':
-                        self.max_eff_thickness = 0.5 * self.circular_pitch - self.eff_clearance_dia_fit
-                    if self.spline_root == 'FILLET':
-                        for pitch_range in min_minor_dia_dict[
-                                self.spline_type][self.pressure_angle][
-                                    self.spline_root]:
-                            if self.diametral_pitch in pitch_range:
-                                self.min_minor_ext_dia = self.min_minor_ext_dia[
-                                    self.spline_type][self.pressure_angle][
-                                        self.spline_root][pitch_range](
-                                            self.teeth, self.diametral_pitch)
-                    elif self.spline_root == 'FLAT':
-                        self.min_minor_ext_dia = min_minor_dia_dict[
-                            self.spline_type][self.pressure_angle][
-                                self.spline_root](self.teeth,
-                                                  self.diametral_pitch)
-                elif self.pressure_angle == 37.5:
-                    self.max_eff_thickness = (0.5 * pi +
-                                              0.1) / self.diametral_pitch
-                    self.min_minor_ext_dia = min_minor_dia_dict[
-                        self.spline_type][self.pressure_angle](
-                            self.teeth, self.diametral_pitch)
-                elif self.pressure_angle == 45.0:
-                    self.max_eff_thickness = (0.5 * pi +
-                                              0.2) / self.diametral_pitch
-                    self.min_minor_ext_dia = min_minor_dia_dict[
-                        self.spline_type][self.pressure_angle](
-                            self.teeth, self.diametral_pitch)
-                if self.spline_fit == 'SIDE':
-                    self.max_major_ext_dia = (self.teeth +
-                                              1) / self.diametral_pitch
-                    if self.spline_root == 'FLAT':
-                        self.min_major_ext_dia = self.max_major_ext_dia - self.dia_tolerance[
-                            'FN'](self.diametral_pitch)
-                        self.form_ext_dia = max(self.min_form_ext_dia,
-                                                self.form_dia)
-                    elif self.spline_root == 'FILLET':
-                        self.min_major_ext_dia = self.max_major_ext_dia - self.dia_tolerance[
-                            'TAB']
-                        self.form_ext_dia = max(self.min_form_ext_dia,
-                                                self.form_dia)
-                elif self.spline_fit == 'DIA':
-                    self.max_major_dia_chamfer = .14 / self.diametral_pitch + .006
-                    self.min_major_dia_chamfer = .1 / self.diametral_pitch + .002
-                    self.form_ext_dia = max(self.min_form_ext_dia,
-                                            self.form_dia)
-                    self.max_major_ext_dia = (
-                        self.teeth + 1) / self.diametral_pitch - 0.0001
-                    self.min_major_ext_dia = self.max_major_ext_dia - round(
-                        (3 + 2 * self.pitch_dia) * 1e-4, ndigits=4)
-                self.min_act_thickness = self.max_eff_thickness - self.total_tolerance
-                self.pin_dia = 1.9200 / self.diametral_pitch
-            elif self.spline_type == 'INT':
-                self.form_dia = form_dia_dict[self.spline_type][
-                    self.spline_fit](self.teeth, self.diametral_pitch)
-                self.min_minor_int_dia = min_minor_dia_dict[self.spline_type][
-                    self.pressure_angle](self.teeth, self.diametral_pitch)
-                self.max_minor_int_dia = self.min_minor_int_dia + self.dia_tolerance[
-                    'TAB']
-                if self.pressure_angle == 30.0:
-                    self.pin_dia = 1.7280 / self.diametral_pitch
-                    self.min_eff_width = pi / (2 * self.diametral_pitch)
-                    if self.spline_root == 'FLAT':
-                        if self.spline_fit == 'SIDE':
-                            self.max_major_int_dia = (
-                                self.teeth +
-                                1.35) / self.diametral_pitch + 0.004
-                        elif self.spline_fit == 'DIA':
-                            self.min_major_int_dia = (self.teeth +
-                                                      1) / self.diametral_pitch
-                            self.max_major_int_dia = self.min_major_int_dia + round(
-                                (10 + 3 * self.pitch_dia) * 1e-4, ndigits=4)
-                            self.min_corner_clearance = 0.12 / self.diametral_pitch
-                            self.max_corner_clearance = 0.2 / self.diametral_pitch
-                    elif self.spline_root == 'FILLET':
-                        self.max_major_int_dia = (self.teeth +
-                                                  1.8) / self.diametral_pitch
-                elif self.pressure_angle == 37.5:
-                    self.pin_dia = 1.7280 / self.diametral_pitch
-                    self.min_eff_width = (0.5 * pi + .1) / self.diametral_pitch
-                    self.max_major_int_dia = (self.teeth +
-                                              1.6) / self.diametral_pitch
-                elif self.pressure_angle == 45.0:
-                    self.pin_dia = 1.9200 / self.diametral_pitch
-                    self.max_eff_width = (0.5 * pi + .2) / self.diametral_pitch
-                    self.min_major_int_dia = (self.teeth +
-                                              1.4) / self.diametral_pitch
-                self.max_act_width = self.min_eff_width + self.total_tolerance
+                        self.min_major_int_dia = (N + 1) / P
+                        self.max_major_int_dia = self.min_major_int_dia + round(
+                            (10 + 3 * self.pitch_dia) * 1e-4, ndigits=4)
+                        self.min_corner_clearance = 0.12 / P
+                        self.max_corner_clearance = 0.2 / P
+                elif self.spline_root == 'FILLET':
+                    self.max_major_int_dia = (N + 1.8) / P
+            elif self.pressure_angle == 37.5:
+                self.max_major_int_dia = (N + 1.6) / P
+            elif self.pressure_angle == 45.0:
+                self.min_major_int_dia = (N + 1.4) / P
+            self.max_act_width = self.min_eff_width + self.total_tolerance
+            self.min_act_width = self.min_eff_width + self.variation_allowance
+            self.max_eff_width = self.max_act_width - self.variation_allowance
+        if self.spline_type == 'EXT':
+            self.inv_phi_e = self.min_act_thickness / self.pitch_dia + (
+                involute(self.pressure_angle) +
+                self.pin_dia / self.base_dia - pi / self.teeth)
+            self.min_pin_measurement = self.measurement_from_act_size(
+                self.min_act_thickness, self.pin_dia)
+            self.max_pin_measurement = self.measurement_from_act_size(
+                self.max_act_thickness, self.pin_dia)
+        elif self.spline_type == 'INT':
+            self.inv_phi_i = self.max_act_width / self.pitch_dia + (
+                involute(self.pressure_angle) -
+                self.pin_dia / self.base_dia)
+            self.max_pin_measurement = self.measurement_from_act_size(
+                self.max_act_width, self.pin_dia)
+            self.min_pin_measurement = self.measurement_from_act_size(
+                self.min_act_width, self.pin_dia)
+
+    def _parse_iso(self):
+        """
+        Parses the ISO 4156 specification.
+
+        Returns
+        -------
+        None
+        """
+        self.spline_type, self.teeth, self.module, self.pressure_angle, self.tolerance = spec_fields(
+            self.spec)
+        self.teeth = int(self.teeth[:-1])
+        if self.pressure_angle[-1] == 'R': self.spline_root = 'fillet'
+        if self.pressure_angle[-1] == 'P': self.spline_root = 'flat'
+        self.pressure_angle = float(self.pressure_angle[:-1])
+        try:
+            self.module = float(self.module[:-1])
+        except ValueError:
+            self.module = float(self.module[:-1].replace(',', '.'))
+
+    def _calculate_iso(self):
+        """
+        Calculates the sizes according to ISO 4156-1:2005, see `_calculate_iso_geometry` and `_calculate_iso_tolerances`.
+
+        Returns
+        -------
+        None
+        """
+        self._calculate_iso_geometry()
+        self._calculate_iso_tolerances(self.tolerance)
+
+    def _calculate_iso_geometry(self):
+        """
+        Calculates the sizes independent of the tolerance class and the fit class according to ISO 4156-1:2005, stores the intermediate values in the `_iso_geometry` attribute.
+
+        Returns
+        -------
+        None
+        """
+        self.pitch_dia = self.module * self.teeth
+        if self.pitch_dia > 1000:
+            raise Exception(
+                'The pitch diameter is out of range of fundamental deviations.'
+            )
+
+        self.base_dia = self.pitch_dia * cos(radians(self.pressure_angle))
+        circular_pitch = pi * self.module
+        base_pitch = circular_pitch * cos(radians(self.pressure_angle))
+        basic_size = .5 * pi * self.module
+        i_E = 0.45 * basic_size**(1 / 3) + .001 * basic_size
+        if self.pitch_dia <= 500:
+            i_D = 0.45 * self.pitch_dia**(1 / 3) + .001 * self.pitch_dia
+        if self.pitch_dia > 500: i_D = 0.004 * self.pitch_dia + 2.1
+        cF = .1 * self.module
+        if self.length is None: self.length = self.pitch_dia / 2
+        tot_dia_tol = 40 * i_D + 160 * i_E
+
+        if self.pressure_angle == 30:
+            hs = .6 * self.module
             if self.spline_type == 'EXT':
-                self.inv_phi_e = self.min_act_thickness / self.pitch_dia + (
-                    involute(self.pressure_angle) +
-                    self.pin_dia / self.base_dia - pi / self.teeth)
-                if self.teeth % 2 == 0:
-                    self.min_pin_measurement = self.base_dia / cos(
-                        inverse_involute(self.inv_phi_e)) + self.pin_dia
-                else:
-                    self.min_pin_measurement = self.base_dia / (cos(
-                        pi / (2 * self.teeth) *
-                        cos(inverse_involute(self.inv_phi_e)))) + self.pin_dia
+                major_factor = 1
+                if self.spline_root == 'flat':
+                    minor_factor = -1.5
+                    self.ext_root_rad = .2 * self.module
+                elif self.spline_root == 'fillet':
+                    minor_factor = -1.8
+                    self.ext_root_rad = .4 * self.module
             elif self.spline_type == 'INT':
-                self.inv_phi_i = self.max_act_width / self.pitch_dia + (
-                    involute(self.pressure_angle) -
-                    self.pin_dia / self.base_dia)
-                if self.teeth % 2 == 0:
-                    self.max_pin_measurement = self.base_dia / cos(
-                        inverse_involute(self.inv_phi_i)) - self.pin_dia
-                else:
-                    self.max_pin_measurement = self.base_dia / (cos(
-                        pi / (2 * self.teeth) *
-                        cos(inverse_involute(self.inv_phi_i)))) - self.pin_dia
-        elif 'ISO' in self.spec:
-            self.spline_type, self.teeth, self.module, self.pressure_angle, tolerance = spec_list
-            self.teeth = int(self.teeth[:-1])
-            if self.pressure_angle[-1] == 'R': root = 'fillet'
-            if self.pressure_angle[-1] == 'P': root = 'flat'
-            self.pressure_angle = float(self.pressure_angle[:-1])
-            try:
-                self.module = float(self.module[:-1])
-            except ValueError:
-                self.module = float(self.module[:-1].replace(',', '.'))
-            tolerance_class = int(tolerance[0])
-            fit_class = tolerance[1:]
-
-            self.pitch_dia = self.module * self.teeth
-            if self.pitch_dia > 1000:
-                raise Exception(
-                    'The pitch diameter is out of range of fundamental deviations.'
-                )
-
-            self.base_dia = self.pitch_dia * cos(radians(self.pressure_angle))
-            circular_pitch = pi * self.module
-            base_pitch = circular_pitch * cos(radians(self.pressure_angle))
+                if self.spline_root == 'flat':
+                    self.min_major_int_dia = self.module * (self.teeth + 1.5)
+                    self.int_root_rad = .2 * self.module
+                elif self.spline_root == 'fillet':
+                    self.min_major_int_dia = self.module * (self.teeth + 1.8)
+                    self.int_root_rad = .4 * self.module
+        elif self.pressure_angle == 37.5:
+            hs = .55 * self.module
             if self.spline_type == 'EXT':
-                basic_tooth_thickeness = .5 * pi * self.module
-                i_E = 0.45 * basic_tooth_thickeness**(
-                    1 / 3) + .001 * basic_tooth_thickeness
+                major_factor, minor_factor = 0.9, -1.4
+                self.ext_root_rad = .3 * self.module
             elif self.spline_type == 'INT':
-                basic_space_width = .5 * pi * self.module
-                i_E = 0.45 * basic_space_width**(1 /
-                                                 3) + .001 * basic_space_width
-            if self.pitch_dia <= 500:
-                i_D = 0.45 * self.pitch_dia**(1 / 3) + .001 * self.pitch_dia
-            if self.pitch_dia > 500: i_D = 0.004 * self.pitch_dia + 2.1
-            arc_length = self.module * self.teeth * pi / 2
-            tol_factor = self.module + .0125 * self.module * self.teeth
-            cF = .1 * self.module
-            if self.length is None: self.length = self.pitch_dia / 2
-            if tolerance_class == 7:
-                self.tot_space_width_tol = 40 * i_D + 160 * i_E
-                pitch_dev = 7.1 * sqrt(arc_length) + 18
-                profile_dev = 6.3 * tol_factor + 40
-                helix_dev = 2 * sqrt(self.length) + 10
-            elif tolerance_class == 6:
-                self.tot_space_width_tol = 25 * i_D + 100 * i_E
-                pitch_dev = 5 * sqrt(arc_length) + 12.5
-                profile_dev = 4 * tol_factor + 25
-                helix_dev = 1.25 * sqrt(self.length) + 6.3
-            elif tolerance_class == 5:
-                self.tot_space_width_tol = 16 * i_D + 64 * i_E
-                pitch_dev = 3.55 * sqrt(arc_length) + 9
-                profile_dev = 2.5 * tol_factor + 16
-                helix_dev = sqrt(self.length) + 5
-            elif tolerance_class == 4:
-                self.tot_space_width_tol = 10 * i_D + 40 * i_E
-                pitch_dev = 2.5 * sqrt(arc_length) + 6.3
-                profile_dev = 1.6 * tol_factor + 10
-                helix_dev = 0.8 * sqrt(self.length) + 4
-
-            tot_dia_tol = 40 * i_D + 160 * i_E
-            dev_allowance = .6 * sqrt(pitch_dev**2 + profile_dev**2 +
-                                      helix_dev**2)
-
-            for diameters_range in FUNDAMENTAL_DEVIATIONS:
-                if round(self.pitch_dia) in diameters_range:
-                    if fit_class in FUNDAMENTAL_DEVIATIONS[diameters_range]:
-                        fund_deviation = FUNDAMENTAL_DEVIATIONS[
-                            diameters_range][fit_class] * 1e-3
-                    else:
-                        if fit_class == 'js':
-                            FUNDAMENTAL_DEVIATIONS[diameters_range][
-                                fit_class] = ceil(self.tot_space_width_tol / 2)
-                        elif fit_class == 'k':
-                            FUNDAMENTAL_DEVIATIONS[diameters_range][
-                                fit_class] = ceil(self.tot_space_width_tol)
-                        fund_deviation = FUNDAMENTAL_DEVIATIONS[
-                            diameters_range][fit_class] * 1e-3
-                    break
-
-            if fit_class in ('js', 'k'):
-                fund_deviation_max_major_ext = 0
-            else:
-                fund_deviation_max_major_ext = fund_deviation
-
-            if self.pressure_angle == 30:
-                hs = .6 * self.module
-                if self.spline_type == 'EXT':
-                    self.max_major_ext_dia = self.module * (
-                        self.teeth + 1) + fund_deviation_max_major_ext / tan(
-                            radians(self.pressure_angle))
-                    if root == 'flat':
-                        self.max_minor_ext_dia = self.module * (
-                            self.teeth - 1.5) + fund_deviation / tan(
-                                radians(self.pressure_angle))
-                        self.ext_root_rad = .2 * self.module
-                    elif root == 'fillet':
-                        self.max_minor_ext_dia = self.module * (
-                            self.teeth - 1.8) + fund_deviation / tan(
-                                radians(self.pressure_angle))
-                        self.ext_root_rad = .4 * self.module
-                elif self.spline_type == 'INT':
-                    if root == 'flat':
-                        self.min_major_int_dia = self.module * (self.teeth +
-                                                                1.5)
-                        self.int_root_rad = .2 * self.module
-                    elif root == 'fillet':
-                        self.min_major_int_dia = self.module * (self.teeth +
-                                                                1.8)
-                        self.int_root_rad = .4 * self.module
-            elif self.pressure_angle == 37.5:
-                hs = .55 * self.module
-                if self.spline_type == 'EXT':
-                    self.max_major_ext_dia = self.module * (
-                        self.teeth + 0.9) + fund_deviation_max_major_ext / tan(
-                            radians(self.pressure_angle))
-                    self.max_minor_ext_dia = self.module * (
-                        self.teeth - 1.4) + fund_deviation / tan(
-                            radians(self.pressure_angle))
-                    self.ext_root_rad = .3 * self.module
-                elif self.spline_type == 'INT':
-                    self.min_major_int_dia = self.module * (self.teeth + 1.4)
-                    self.int_root_rad = .3 * self.module
-            elif self.pressure_angle == 45:
-                hs = .5 * self.module
-                if self.spline_type == 'EXT':
-                    self.max_major_ext_dia = self.module * (
-                        self.teeth + 0.8) + fund_deviation_max_major_ext / tan(
-                            radians(self.pressure_angle))
-                    self.max_minor_ext_dia = self.module * (
-                        self.teeth - 1.2) + fund_deviation / tan(
-                            radians(self.pressure_angle))
-                    self.ext_root_rad = .25 * self.module
-                elif self.spline_type == 'INT':
-                    self.min_major_int_dia = self.module * (self.teeth + 1.2)
-                    self.int_root_rad = .25 * self.module
-
-            self.max_form_dia = 2 * sqrt(
-                (.5 * self.base_dia)**2 +
-                (.5 * self.pitch_dia * sin(radians(self.pressure_angle)) -
-                 (hs - .5 * fund_deviation / tan(radians(self.pressure_angle))
-                  ) / sin(radians(self.pressure_angle)))**2)
-
+                self.min_major_int_dia = self.module * (self.teeth + 1.4)
+                self.int_root_rad = .3 * self.module
+        elif self.pressure_angle == 45:
+            hs = .5 * self.module
             if self.spline_type == 'EXT':
-                for diameters_range in MAJOR_MINOR_DIA_TOLERANCES:
-                    if round(self.max_major_ext_dia) in diameters_range:
-                        if self.module <= 0.75:
-                            self.min_major_ext_dia = self.max_major_ext_dia - MAJOR_MINOR_DIA_TOLERANCES[
-                                diameters_range][10] * 1e-3
-                        elif self.module < 2:
-                            self.min_major_ext_dia = self.max_major_ext_dia - MAJOR_MINOR_DIA_TOLERANCES[
-                                diameters_range][11] * 1e-3
-                        elif self.module >= 2:
-                            self.min_major_ext_dia = self.max_major_ext_dia - MAJOR_MINOR_DIA_TOLERANCES[
-                                diameters_range][12] * 1e-3
-                        break
-
-                self.min_minor_ext_dia = self.max_minor_ext_dia - tot_dia_tol * 1e-3 / tan(
-                    radians(self.pressure_angle))
-                self.max_eff_thickness = basic_tooth_thickeness + fund_deviation
-                self.max_act_thickness = self.max_eff_thickness - dev_allowance * 1e-3
-                self.min_act_thickness = self.max_eff_thickness - self.tot_space_width_tol * 1e-3
-                self.min_eff_thickness = self.min_act_thickness + dev_allowance * 1e-3
-                DEe = base_pitch - (
-                    basic_tooth_thickeness * cos(radians(self.pressure_angle))
-                    + self.base_dia * involute(self.pressure_angle))
-                BAarc = self.base_dia * tan(radians(self.pressure_angle)) / 2
-                BOe = self.base_dia * tan(
-                    radians(self.pressure_angle) +
-                    involute(self.pressure_angle) + DEe / self.base_dia) / 2
-                self.ext_pin_dia = find_greater_than_or_equal(
-                    R40, 2 * (BOe - BAarc))
-                inv_alphaEmax = self.max_act_thickness / self.pitch_dia + (
-                    involute(self.pressure_angle) +
-                    self.ext_pin_dia / self.base_dia - pi / self.teeth)
-                alphaEmax = degrees(inverse_involute(inv_alphaEmax))
-                self.max_ext_measurement = self.base_dia / cos(
-                    radians(alphaEmax)
-                ) + self.ext_pin_dia if self.teeth // 2 else self.base_dia * cos(
-                    radians(90 / self.teeth)) / cos(
-                        radians(alphaEmax)) + self.ext_pin_dia
-                inv_alphaEmin = self.min_act_thickness / self.pitch_dia + (
-                    involute(self.pressure_angle) +
-                    self.ext_pin_dia / self.base_dia - pi / self.teeth)
-                alphaEmin = degrees(inverse_involute(inv_alphaEmin))
-                self.min_ext_measurement = self.base_dia / cos(
-                    radians(alphaEmin)
-                ) + self.ext_pin_dia if self.teeth // 2 else self.base_dia * cos(
-                    radians(90 / self.teeth)) / cos(
-                        radians(alphaEmin)) + self.ext_pin_dia
+                major_factor, minor_factor = 0.8, -1.2
+                self.ext_root_rad = .25 * self.module
             elif self.spline_type == 'INT':
-                self.min_form_int_dia = self.module * (self.teeth + 1) + 2 * cF
-                self.min_minor_int_dia = self.max_form_dia + 2 * cF
-                for diameters_range in MAJOR_MINOR_DIA_TOLERANCES:
-                    if round(self.min_minor_int_dia) in diameters_range:
-                        if self.module <= 0.75:
-                            self.max_minor_int_dia = self.min_minor_int_dia + MAJOR_MINOR_DIA_TOLERANCES[
-                                diameters_range][10] * 1e-3
-                        elif self.module < 2:
-                            self.max_minor_int_dia = self.min_minor_int_dia + MAJOR_MINOR_DIA_TOLERANCES[
-                                diameters_range][11] * 1e-3
-                        elif self.module >= 2:
-                            self.max_minor_int_dia = self.min_minor_int_dia + MAJOR_MINOR_DIA_TOLERANCES[
-                                diameters_range][12] * 1e-3
-                        break
-
-                self.max_major_int_dia = self.min_major_int_dia + tot_dia_tol * 1e-3 / tan(
+                self.min_major_int_dia = self.module * (self.teeth + 1.2)
+                self.int_root_rad = .25 * self.module
+
+        BAarc = self.base_dia * tan(radians(self.pressure_angle)) / 2
+        if self.spline_type == 'EXT':
+            DEe = base_pitch - (basic_size * cos(radians(self.pressure_angle))
+                                + self.base_dia * involute(self.pressure_angle))
+            BOe = self.base_dia * tan(
+                radians(self.pressure_angle) + involute(self.pressure_angle) +
+                DEe / self.base_dia) / 2
+            self.ext_pin_dia = find_greater_than_or_equal(
+                R40, 2 *
+                (BOe - BAarc)) if self._pin_dia is None else self._pin_dia
+        elif self.spline_type == 'INT':
+            self.min_form_int_dia = self.module * (self.teeth + 1) + 2 * cF
+            self.max_major_int_dia = self.min_major_int_dia + tot_dia_tol * 1e-3 / tan(
+                radians(self.pressure_angle))
+            DEi = basic_size * cos(radians(
+                self.pressure_angle)) + self.base_dia * involute(
+                    self.pressure_angle)
+            BOi = self.base_dia * tan(
+                radians(self.pressure_angle) + involute(self.pressure_angle) -
+                DEi / self.base_dia) / 2
+            self.int_pin_dia = find_greater_than_or_equal(
+                R40, 2 *
+                (BAarc - BOi)) if self._pin_dia is None else self._pin_dia
+
+        self._iso_geometry = {
+            'basic_size': basic_size,
+            'i_E': i_E,
+            'i_D': i_D,
+            'arc_length': self.module * self.teeth * pi / 2,
+            'tol_factor': self.module + .0125 * self.module * self.teeth,
+            'cF': cF,
+            'tot_dia_tol': tot_dia_tol,
+            'hs': hs,
+        }
+        if self.spline_type == 'EXT':
+            self._iso_geometry.update(major_factor=major_factor,
+                                      minor_factor=minor_factor)
+
+    def _calculate_iso_tolerances(self, tolerance):
+        """
+        Calculates the sizes dependent on the tolerance class and the fit class according to ISO 4156-1:2005 from the sizes calculated by `_calculate_iso_geometry`.
+
+        Parameters
+        ----------
+        tolerance : str
+            The tolerance class followed by the fit class, e.g. '5f'.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the tolerance designation is malformed or its fit class is not of the spline type.
+        """
+        if re.fullmatch(r'\d[a-zA-Z]+', tolerance) is None:
+            raise ValueError(f'The tolerance designation is malformed: {tolerance}')
+        if tolerance[1:].islower() != (self.spline_type == 'EXT'):
+            raise ValueError(
+                f'The fit class is not of the {self.spline_type} splines: {tolerance}')
+        geometry = self._iso_geometry
+        basic_size, i_E, i_D = geometry['basic_size'], geometry[
+            'i_E'], geometry['i_D']
+        arc_length, tol_factor = geometry['arc_length'], geometry['tol_factor']
+        self.tolerance = tolerance
+        tolerance_class = int(tolerance[0])
+        fit_class = tolerance[1:]
+        self.tot_space_width_tol, dev_allowance = self._kernels.iso_tolerances(
+            i_D, i_E, arc_length, tol_factor, self.length,
+            self._tables.tolerance_coefficients.lookup(tolerance_class))
+
+        if fit_class == 'js':
+            fund_deviation = ceil(self.tot_space_width_tol / 2) * 1e-3
+        elif fit_class == 'k':
+            fund_deviation = ceil(self.tot_space_width_tol) * 1e-3
+        else:
+            fund_deviation = self._tables.fundamental_deviations.lookup(
+                round(self.pitch_dia), fit_class) * 1e-3
+
+        if fit_class in ('js', 'k'):
+            fund_deviation_max_major_ext = 0
+        else:
+            fund_deviation_max_major_ext = fund_deviation
+
+        if self.spline_type == 'EXT':
+            self.max_major_ext_dia = self.module * (
+                self.teeth + geometry['major_factor']
+            ) + fund_deviation_max_major_ext / tan(radians(
+                self.pressure_angle))
+            self.max_minor_ext_dia = self.module * (
+                self.teeth + geometry['minor_factor']) + fund_deviation / tan(
                     radians(self.pressure_angle))
-                self.min_eff_width = basic_space_width
-                self.max_act_width = self.min_eff_width + self.tot_space_width_tol * 1e-3
-                self.min_act_width = self.min_eff_width + dev_allowance * 1e-3
-                self.max_eff_width = self.max_act_width - dev_allowance * 1e-3
-                DEi = basic_space_width * cos(radians(
-                    self.pressure_angle)) + self.base_dia * involute(
-                        self.pressure_angle)
-                BAarc = self.base_dia * tan(radians(self.pressure_angle)) / 2
-                BOi = self.base_dia * tan(
-                    radians(self.pressure_angle) +
-                    involute(self.pressure_angle) - DEi / self.base_dia) / 2
-                self.int_pin_dia = find_greater_than_or_equal(
-                    R40, 2 * (BAarc - BOi))
-                inv_alphaImax = self.max_act_width / self.pitch_dia + (
-                    involute(self.pressure_angle) -
-                    self.int_pin_dia / self.base_dia)
-                alphaImax = degrees(inverse_involute(inv_alphaImax))
-                self.max_int_measurement = self.base_dia / cos(
-                    radians(alphaImax)
-                ) - self.int_pin_dia if self.teeth // 2 else self.base_dia * cos(
-                    radians(90 / self.teeth)) / cos(
-                        radians(alphaImax)) - self.int_pin_dia
-                inv_alphaImin = self.min_act_width / self.pitch_dia + (
-                    involute(self.pressure_angle) -
-                    self.int_pin_dia / self.base_dia)
-                alphaImin = degrees(inverse_involute(inv_alphaImin))
-                self.min_int_measurement = self.base_dia / cos(
-                    radians(alphaImin)
-                ) - self.int_pin_dia if self.teeth // 2 else self.base_dia * cos(
-                    radians(90 / self.teeth)) / cos(
-                        radians(alphaImin)) - self.int_pin_dia
-        elif 'BS' in self.spec:
-            self.spline_type, self.spline_root, self.spline_fit, self.diametral_pitch, self.stub_pitch, self.teeth, self.pressure_angle = spec_list
-            self.diametral_pitch = float(self.diametral_pitch)
-            self.pressure_angle = float(self.pressure_angle)
-            self.teeth = int(self.teeth)
-            self.stub_pitch = float(self.stub_pitch)
+
+        self.max_form_dia = self._kernels.iso_max_form_dia(
+            self.base_dia, self.pitch_dia, self.pressure_angle,
+            geometry['hs'], fund_deviation)
+        if self.module <= 0.75:
+            dia_tolerance_grade = 'IT10'
+        elif self.module < 2:
+            dia_tolerance_grade = 'IT11'
+        else:
+            dia_tolerance_grade = 'IT12'
+
+        if self.spline_type == 'EXT':
+            self.min_major_ext_dia = self.max_major_ext_dia - self._tables.major_minor_dia_tolerances.lookup(
+                round(self.max_major_ext_dia), dia_tolerance_grade) * 1e-3
+
+            self.min_minor_ext_dia = self.max_minor_ext_dia - geometry[
+                'tot_dia_tol'] * 1e-3 / tan(radians(self.pressure_angle))
+            self.max_eff_thickness = basic_size + fund_deviation
+            self.max_act_thickness = self.max_eff_thickness - dev_allowance * 1e-3
+            self.min_act_thickness = self.max_eff_thickness - self.tot_space_width_tol * 1e-3
+            self.min_eff_thickness = self.min_act_thickness + dev_allowance * 1e-3
+            self.max_ext_measurement = self.measurement_from_act_size(
+                self.max_act_thickness, self.ext_pin_dia)
+            self.min_ext_measurement = self.measurement_from_act_size(
+                self.min_act_thickness, self.ext_pin_dia)
+        elif self.spline_type == 'INT':
+            self.min_minor_int_dia = self.max_form_dia + 2 * geometry['cF']
+            self.max_minor_int_dia = self.min_minor_int_dia + self._tables.major_minor_dia_tolerances.lookup(
+                round(self.min_minor_int_dia), dia_tolerance_grade) * 1e-3
+
+            self.min_eff_width = basic_size
+            self.max_act_width = self.min_eff_width + self.tot_space_width_tol * 1e-3
+            self.min_act_width = self.min_eff_width + dev_allowance * 1e-3
+            self.max_eff_width = self.max_act_width - dev_allowance * 1e-3
+            self.max_int_measurement = self.measurement_from_act_size(
+                self.max_act_width, self.int_pin_dia)
+            self.min_int_measurement = self.measurement_from_act_size(
+                self.min_act_width, self.int_pin_dia)
+
+    def with_tolerance(self, tolerance):
+        """
+        Returns the copy of the splines with the sizes recalculated for another tolerance designation. The sizes independent of the tolerance are reused for ISO 4156 splines.
+
+        Parameters
+        ----------
+        tolerance : str or int
+            The tolerance class followed by the fit class for ISO 4156 splines, e.g. '5f', or the tolerance class for ANSI B92 splines.
+
+        Returns
+        -------
+        Splines
+        """
+        if self.standard != 'ISO 4156':
+            if re.search(r'CLASS\s*\d+', self.spec):
+                spec = re.sub(r'CLASS\s*\d+', f'CLASS {tolerance}', self.spec)
+            else:
+                # the class is optional in BS 3550 specifications, it is put
+                # before the designation of the standard
+                start = _loose_standard_pattern.search(self.spec).start()
+                spec = f'{self.spec[:start]}CLASS {tolerance} {self.spec[start:]}'
+            return Splines(spec,
+                           self.length,
+                           edition=self.edition,
+                           pin_dia=self._pin_dia)
+        variant = copy(self)
+        variant.spec = re.sub(r'\d[a-zA-Z]+(?=\s*-\s*ISO)', tolerance,
+                              self.spec)
+        variant._calculate_iso_tolerances(tolerance)
+        return variant
+
+    def as_dict(self):
+        """
+        Returns the specification, the parameters and the calculated sizes as the dictionary.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            name: value
+            for name, value in vars(self).items() if not name.startswith('_')
+        }
+
+    def act_size_limits(self):
+        """
+        Returns the limits of the actual tooth thickness (external splines) or the actual space width (internal splines).
+
+        Returns
+        -------
+        tuple
+            The minimum and the maximum actual size.
+        """
+        if self.spline_type == 'EXT':
+            return self.min_act_thickness, self.max_act_thickness
+        return self.min_act_width, self.max_act_width
+
+    def measuring_pin_dia(self):
+        """
+        Returns the diameter of the pins used in the drawing data.
+
+        Returns
+        -------
+        float
+        """
+        if self.standard != 'ISO 4156':
+            return self.pin_dia
+        return self.ext_pin_dia if self.spline_type == 'EXT' else self.int_pin_dia
+
+    def measurement_from_act_size(self, act_size, pin_dia=None):
+        """
+        Calculates the measurement over (external splines) or between (internal splines) two pins for the actual tooth thickness or space width.
+
+        Parameters
+        ----------
+        act_size : float
+            The actual tooth thickness or space width.
+        pin_dia : float
+            The pin diameter, default the diameter used in the drawing data.
+
+        Returns
+        -------
+        float
+            The measurement, None if the pins do not fit the spaces at the actual size.
+        """
+        if pin_dia is None:
+            pin_dia = self.measuring_pin_dia()
+        measurement = self._kernels.pin_measurement(self.base_dia,
+                                                    self.pitch_dia,
+                                                    self.pressure_angle,
+                                                    self.teeth, pin_dia,
+                                                    act_size,
+                                                    self.spline_type == 'EXT')
+        # the kernels return nan for the pins not fitting, the Dual otherwise
+        if isinstance(measurement, float) and isnan(measurement):
+            return None
+        return measurement
+
+    def ball_measurement(self, ball_dia=None):
+        """
+        Calculates the limits of the measurement over (external splines) or between (internal splines) two balls. The balls contact the straight flanks in the transverse plane of their centres, so the measurement is calculated as over the pins of the same diameter.
+
+        Parameters
+        ----------
+        ball_dia : float
+            The ball diameter, default the pin diameter used in the drawing data.
+
+        Returns
+        -------
+        tuple
+            The minimum and the maximum measurement, None if the balls do not fit the spaces.
+        """
+        measurements = [
+            self.measurement_from_act_size(act_size, ball_dia)
+            for act_size in self.act_size_limits()
+        ]
+        if None in measurements:
+            return None, None
+        return tuple(sorted(measurements))
+
+    def span_teeth(self):
+        """
+        Returns the number of teeth spanned by the base tangent measurement of the external splines with the contact nearest to the pitch circle.
+
+        Returns
+        -------
+        int
+        """
+        act_size = sum(self.act_size_limits()) / 2
+        k = round(1 + self.teeth / pi *
+                  (radians(self.pressure_angle) - act_size / self.pitch_dia))
+        return min(max(k, 2), self.teeth - 1)
+
+    def span_measurement(self, k=None):
+        """
+        Calculates the limits of the base tangent length over `k` teeth of the external splines.
+
+        Parameters
+        ----------
+        k : int
+            The number of teeth spanned, default `span_teeth()`.
+
+        Returns
+        -------
+        tuple
+            The number of teeth spanned, the minimum and the maximum base tangent length.
+        """
+        if self.spline_type != 'EXT':
+            raise ValueError(
+                'The span measurement is defined for the external splines only.'
+            )
+        if k is None:
+            k = self.span_teeth()
+        return (k, *(self.base_dia *
+                     ((k - 1) * pi / self.teeth + act_size / self.pitch_dia +
+                      involute(self.pressure_angle))
+                     for act_size in self.act_size_limits()))
+
+    def act_size_from_measurement(self, measurement):
+        """
+        Calculates the actual tooth thickness (external splines) or the actual space width (internal splines) from the measurement over or between pins of the diameter used in the drawing data.
+
+        Parameters
+        ----------
+        measurement : float
+            The measurement over (external) or between (internal) pins.
+
+        Returns
+        -------
+        float
+        """
+        external = self.spline_type == 'EXT'
+        pin_dia = self.measuring_pin_dia()
+        inv_alpha = involute_from_measurement(self.base_dia, pin_dia,
+                                              self.teeth, measurement,
+                                              external)
+        if external:
+            return self.pitch_dia * (inv_alpha - involute(self.pressure_angle)
+                                     - pin_dia / self.base_dia +
+                                     pi / self.teeth)
+        return self.pitch_dia * (inv_alpha - involute(self.pressure_angle) +
+                                 pin_dia / self.base_dia)
+
+    def drawing_data(self, units=None):
+        """
+        Returns the drawing data according to section 12.4 in ISO 4156:1-2001 or the equivalent data of ANSI B92.1, the sizes not defined for the splines are left out and the measurements of the pins not fitting the spaces are 'n/a'.
+
+        Parameters
+        ----------
+        units : str
+            The units of the sizes, 'metric' or 'imperial', default the units of the standard.
+
+        Returns
+        -------
+        list
+            The (label, value) tuples, the sizes rounded as on the drawing.
+        """
+        if self.standard == 'ISO 4156':
+            units_coef = 1 / 25.4 if units == 'imperial' else 1
+            data = [('Number of teeth', self.teeth),
+                    ('Module', round(self.module, ndigits=2)),
+                    ('Pressure angle', round(self.pressure_angle,
+                                             ndigits=1))]
+            fields = ISO_DRAWING_DATA[self.spline_type]
+        else:
+            units_coef = 25.4 if units == 'metric' else 1
+            data = [('Number of teeth', self.teeth),
+                    ('Pitch', f'{self.diametral_pitch}/{self.stub_pitch}'),
+                    ('Pressure angle', round(self.pressure_angle,
+                                             ndigits=1))]
+            fields = ANSI_DRAWING_DATA[self.spline_type]
+        for label, name, ndigits in fields:
+            if not hasattr(self, name):
+                continue
+            value = getattr(self, name)
+            # the measurements are None when the pins do not fit the spaces
+            data.append((label, 'n/a' if value is None else round(
+                value * units_coef, ndigits=ndigits)))
+        return data
 
     def print_drawing_data(self, units=None):
         """
-        Prints out the drawing data according to section 12.4 in ISO 4156:1-2001
+        Prints out the drawing data according to section 12.4 in ISO 4156:1-2001, see `drawing_data`.
 
         Parameters
         ----------
@@ -777,117 +791,479 @@ class Splines:
         -------
         None
         """
-        if 'ISO' in self.spec:
-            if units == None:
-                units = 'metric'
-            if units == 'metric':
-                units_coef = 1
-            elif units == 'imperial':
-                units_coef = 1 / 25.4
-            if self.spline_type == 'INT':
-                print(
-                    f'{self.spec}',
-                    f'Number of teeth {self.teeth}',
-                    f'Module {round(self.module, ndigits=2)}',
-                    f'Pressure angle {round(self.pressure_angle, ndigits=1)}',
-                    f'Pitch diameter {round(self.pitch_dia*units_coef, ndigits=4)}',
-                    f'Base diameter {round(self.base_dia*units_coef, ndigits=4)}',
-                    f'Min major diameter {round(self.min_major_int_dia*units_coef, ndigits=3)}',
-                    f'Max major diameter {round(self.max_major_int_dia*units_coef, ndigits=3)}',
-                    f'Min form diameter {round(self.min_form_int_dia*units_coef, ndigits=3)}',
-                    f'Min minor diameter {round(self.min_minor_int_dia*units_coef, ndigits=3)}',
-                    f'Max minor diameter {round(self.max_minor_int_dia*units_coef, ndigits=3)}',
-                    f'Max actual space width {round(self.max_act_width*units_coef, ndigits=3)}',
-                    f'Max effective space width {round(self.max_eff_width*units_coef, ndigits=3)}',
-                    f'Min actual space width {round(self.min_act_width*units_coef, ndigits=3)}',
-                    f'Min effective space width {round(self.min_eff_width*units_coef, ndigits=3)}',
-                    f'Max measurement over pins {round(self.max_int_measurement*units_coef, ndigits=3)}',
-                    f'Min measurement over pins {round(self.min_int_measurement*units_coef, ndigits=3)}',
-                    f'Pin diameter {round(self.int_pin_dia*units_coef, ndigits=3)}',
-                    f'Fillet radius {round(self.int_root_rad*units_coef, ndigits=1)}\n',
-                    sep='\n')
-            elif self.spline_type == 'EXT':
-                print(
-                    f'{self.spec}',
-                    f'Number of teeth {self.teeth}',
-                    f'Module {round(self.module, ndigits=2)}',
-                    f'Pressure angle {round(self.pressure_angle, ndigits=1)}',
-                    f'Pitch diameter {round(self.pitch_dia*units_coef, ndigits=4)}',
-                    f'Base diameter {round(self.base_dia*units_coef, ndigits=4)}',
-                    f'Max major diameter {round(self.max_major_ext_dia*units_coef, ndigits=4)}',
-                    f'Min major diameter {round(self.min_major_ext_dia*units_coef, ndigits=4)}',
-                    f'Max form diameter {round(self.max_form_dia*units_coef, ndigits=3)}',
-                    f'Min minor diameter {round(self.min_minor_ext_dia*units_coef, ndigits=3)}',
-                    f'Max minor diameter {round(self.max_minor_ext_dia*units_coef, ndigits=3)}',
-                    f'Max effective tooth thickness {round(self.max_eff_thickness*units_coef, ndigits=3)}',
-                    f'Max actual tooth thickness {round(self.max_act_thickness*units_coef, ndigits=3)}',
-                    f'Min effective tooth thickness {round(self.min_eff_thickness*units_coef, ndigits=3)}',
-                    f'Min actual tooth thickness {round(self.min_act_thickness*units_coef, ndigits=3)}',
-                    f'Max measurement over pins {round(self.max_ext_measurement*units_coef, ndigits=3)}',
-                    f'Min measurement over pins {round(self.min_ext_measurement*units_coef, ndigits=3)}',
-                    f'Pin diameter {round(self.ext_pin_dia, ndigits=3)}',
-                    f'Fillet radius {round(self.ext_root_rad, ndigits=1)}\n',
-                    sep='\n')
-        elif 'ANSI' in self.spec:
-            if units == None:
-                units = 'imperial'
-            if units == 'metric':
-                units_coef = 25.4
-            elif units == 'imperial':
-                units_coef = 1
-
-            if self.spline_type == 'INT':
-                print(
-                    f'{self.spec}',
-                    f'Number of teeth {self.teeth}',
-                    f'Pitch {self.diametral_pitch}/{self.stub_pitch}',
-                    f'Pressure angle {round(self.pressure_angle, ndigits=1)}',
-                    f'Base diameter {round(self.base_dia*units_coef, ndigits=6)}',
-                    f'Pitch diameter {round(self.pitch_dia*units_coef, ndigits=6)}',
-                    f'Max major diameter {round(self.max_major_int_dia*units_coef, ndigits=4)}',
-                    f'Min major diameter {round(self.min_major_int_dia*units_coef, ndigits=4)}',
-                    f'Form diameter {round(self.form_dia*units_coef, ndigits=3)}',
-                    f'Min minor diameter {round(self.min_minor_int_dia*units_coef, ndigits=4)}',
-                    f'Max minor diameter {round(self.max_minor_int_dia*units_coef, ndigits=4)}',
-                    f'Max actual space width {round(self.max_act_width*units_coef, ndigits=4)}',
-                    # f'Max effective space width {round(max_eff_width, ndigits=4)}',
-                    # f'Min actual space width {round(min_act_width, ndigits=4)}',
-                    f'Min effective space width {round(self.min_eff_width*units_coef, ndigits=4)}',
-                    f'Max measurement between pins {round(self.max_pin_measurement*units_coef, ndigits=4)}',
-                    # f'Min measurement over pins {round(min_int_measurement, ndigits=3)}',
-                    f'Pin diameter {round(self.pin_dia*units_coef, ndigits=4)}',
-                    # f'Fillet radius {round(int_root_rad, ndigits=1)}\n',
-                    sep='\n')
-                if self.spline_fit == 'DIA':
-                    print(
-                        f'Max corner clearance {round(self.max_corner_clearance*units_coef, ndigits=3)}',
-                        f'Min corner clearance {round(self.min_corner_clearance*units_coef, ndigits=3)}\n',
-                        sep='\n')
-
-            elif self.spline_type == 'EXT':
-                print(
-                    f'{self.spec}',
-                    f'Number of teeth {self.teeth}',
-                    f'Pitch {self.diametral_pitch}/{self.stub_pitch}',
-                    f'Pressure angle {round(self.pressure_angle, ndigits=1)}',
-                    f'Base diameter {round(self.base_dia*units_coef, ndigits=6)}',
-                    f'Pitch diameter {round(self.pitch_dia*units_coef, ndigits=6)}',
-                    f'Min major diameter {round(self.min_major_ext_dia*units_coef, ndigits=4)}',
-                    f'Max major diameter {round(self.max_major_ext_dia*units_coef, ndigits=4)}',
-                    f'Form diameter {round(self.form_dia*units_coef, ndigits=3)}',
-                    f'Min minor diameter {round(self.min_minor_ext_dia*units_coef, ndigits=3)}',
-                    # f'Max minor diameter {round(max_minor_ext_dia, ndigits=3)}',
-                    f'Max effective tooth thickness {round(self.max_eff_thickness*units_coef, ndigits=4)}',
-                    # f'Max actual tooth thickness {round(max_act_thickness, ndigits=4)}',
-                    # f'Min effective tooth thickness {round(min_eff_thickness, ndigits=4)}',
-                    f'Min actual tooth thickness {round(self.min_act_thickness*units_coef, ndigits=4)}',
-                    # f'Max measurement over pins {round(max_ext_measurement, ndigits=3)}',
-                    f'Min measurement over pins {round(self.min_pin_measurement*units_coef, ndigits=4)}',
-                    f'Pin diameter {round(self.pin_dia*units_coef, ndigits=4)}',
-                    # f'Fillet radius {round(ext_root_rad, ndigits=1)}\n',
-                    sep='\n')
-                if self.spline_fit == 'DIA':
-                    print(
-                        f'Max chamfer height {round(self.max_major_dia_chamfer*units_coef, ndigits=3)}',
-                        f'Min chamfer height {round(self.min_major_dia_chamfer*units_coef, ndigits=3)}\n',
-                        sep='\n')
\ No newline at end of file
+        print(self.spec,
+              *(f'{label} {value}'
+                for label, value in self.drawing_data(units)),
+              '',
+              sep='\n')
+
+
+Standard = namedtuple(
+    'Standard', ['parse', 'calculate', 'calculate_batch', 'edition', 'validate'],
+    defaults=(None, ))
+
+
+class SpecificationError(ValueError):
+    """
+    The specification does not follow the grammar of the standard or is not covered by the tables of its edition
+
+    Attributes
+    ----------
+    code: str
+        The diagnostic code, see `validation.CODES`.
+    """
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+_ISO_GRAMMAR = re.compile(
+    r'\s*(\w+)\s+(\d+)\s*z\s*x\s*(\d+(?:[.,]\d+)?)\s*m\s*x\s*(\d+(?:\.\d+)?)'
+    r'\s*([a-z])\s*x\s*(\d)([a-z]+)\s*-\s*ISO\s*4156\s*', re.IGNORECASE)
+_ANSI_GRAMMAR = re.compile(
+    r'\s*(\w+)\s+(\w+)\s+ROOT\s+(\w+)\s+FIT\s+(\d+(?:\.\d+)?)\s*/\s*(\d+)\s+'
+    r'(\d+)\s*T?\s+(\d+(?:\.\d+)?)\s+CLASS\s*(\d+)\s+ANSI\s*B92(?:\.1)?\s*',
+    re.IGNORECASE)
+_BS_GRAMMAR = re.compile(
+    r'\s*(\w+)\s+(\w+)\s+ROOT\s+(\w+)\s+FIT\s+(\d+(?:\.\d+)?)\s*/\s*(\d+)\s+'
+    r'(\d+)\s*T?\s+(\d+(?:\.\d+)?)(?:\s+CLASS\s*(\d+))?\s+BS\s*3550\s*',
+    re.IGNORECASE)
+
+# The smallest number of teeth of the splines of ISO 4156 and ANSI B92.1
+MIN_TEETH = 6
+
+# The profile height factor hs / m and the major diameter factor of the
+# external splines by the pressure angle, see `Splines._calculate_iso_geometry`
+_ISO_PROFILE_FACTORS = {30.0: (.6, 1.), 37.5: (.55, .9), 45.0: (.5, .8)}
+
+
+def _grammar(pattern, spec, standard):
+    match = pattern.fullmatch(spec)
+    if match is None:
+        raise SpecificationError(
+            'grammar', f'The specification does not follow {standard}: {spec}')
+    return match.groups()
+
+
+def _require(condition, code, message):
+    if not condition:
+        raise SpecificationError(code, message)
+
+
+def _lookup(table, code, *args):
+    try:
+        return table.lookup(*args)
+    except ValueError as e:
+        raise SpecificationError(code, str(e)) from None
+
+
+def _validate_iso(spec, tables):
+    """
+    Validates the ISO 4156 specification against the grammar and the coverage of the tables, including the diameter the major and minor diameter tolerance is looked up by.
+
+    Returns
+    -------
+    str
+        The normalised specification.
+
+    Raises
+    ------
+    SpecificationError
+        If the specification is not valid.
+    """
+    spline_type, teeth, module, pressure_angle, root, tolerance_class, fit_class = _grammar(
+        _ISO_GRAMMAR, spec, 'ISO 4156')
+    spline_type, root, module = spline_type.upper(), root.upper(
+    ), module.replace('.', ',')
+    _require(spline_type in ('EXT', 'INT'), 'spline_type',
+             f'The spline type is unknown: {spline_type}')
+    _require(root in ('R', 'P'), 'root', f'The root is unknown: {root}')
+    _require(
+        int(teeth) >= MIN_TEETH, 'teeth',
+        f'The number of teeth is less than {MIN_TEETH}: {int(teeth)}')
+    _require(
+        float(pressure_angle) in _ISO_PROFILE_FACTORS, 'pressure_angle',
+        f'The pressure angle is not tabulated: {pressure_angle}')
+    _lookup(tables.tolerance_coefficients, 'tolerance_class',
+            int(tolerance_class))
+    fit_classes = [
+        name for name in tables.fundamental_deviations.names
+        if name.islower() == (spline_type == 'EXT')
+    ] + (['js', 'k'] if spline_type == 'EXT' else [])
+    _require(fit_class in fit_classes, 'fit_class',
+             f'The fit class is not tabulated for {spline_type}: {fit_class}')
+    normalised = (f'{spline_type} {int(teeth)}z x {module}m x '
+                  f'{pressure_angle}{root} x {tolerance_class}{fit_class} - '
+                  'ISO 4156')
+
+    m, alpha = float(module.replace(',', '.')), float(pressure_angle)
+    pitch_dia = m * int(teeth)
+    _require(pitch_dia <= 1000, 'pitch_dia',
+             f'The pitch diameter is out of the tables: {pitch_dia}')
+    if fit_class in ('js', 'k'):
+        fund_deviation = 0
+    else:
+        fund_deviation = _lookup(tables.fundamental_deviations, 'pitch_dia',
+                                 round(pitch_dia), fit_class) * 1e-3
+    hs_factor, major_factor = _ISO_PROFILE_FACTORS[alpha]
+    if spline_type == 'EXT':
+        dia = m * (int(teeth) + major_factor) + fund_deviation / tan(
+            radians(alpha))
+    else:
+        dia = get_kernels().iso_max_form_dia(pitch_dia * cos(radians(alpha)),
+                                             pitch_dia, alpha, hs_factor * m,
+                                             fund_deviation) + .2 * m
+    grade = 'IT10' if m <= 0.75 else 'IT11' if m < 2 else 'IT12'
+    _lookup(tables.major_minor_dia_tolerances, 'dia_tolerance', round(dia),
+            grade)
+    return normalised
+
+
+def _validate_ansi_fields(tables, spline_type, root, fit, diametral_pitch,
+                          teeth, pressure_angle, tol_class):
+    _require(spline_type in ('EXT', 'INT'), 'spline_type',
+             f'The spline type is unknown: {spline_type}')
+    _require(root in ('FLAT', 'FILLET'), 'root', f'The root is unknown: {root}')
+    _require(fit in ('SIDE', 'DIA'), 'fit', f'The fit is unknown: {fit}')
+    _require(
+        int(teeth) >= MIN_TEETH, 'teeth',
+        f'The number of teeth is less than {MIN_TEETH}: {int(teeth)}')
+    _lookup(tables.coefficients, 'pressure_angle', spline_type,
+            float(pressure_angle), root, fit)
+    _lookup(tables.class_factors, 'tolerance_class', int(tol_class))
+    P = float(diametral_pitch)
+    for table in (tables.dia_tolerances, tables.allowances_class5,
+                  tables.eff_clearance_dia_fit):
+        _lookup(table, 'diametral_pitch', P)
+
+
+def _validate_ansi(spec, tables):
+    """
+    Validates the ANSI B92 specification against the grammar and the coverage of the tables, the designation ANSI B92.1 is normalised to ANSI B92.
+
+    Returns
+    -------
+    str
+        The normalised specification.
+
+    Raises
+    ------
+    SpecificationError
+        If the specification is not valid.
+    """
+    spline_type, root, fit, diametral_pitch, stub_pitch, teeth, pressure_angle, tol_class = _grammar(
+        _ANSI_GRAMMAR, spec, 'ANSI B92')
+    spline_type, root, fit = spline_type.upper(), root.upper(), fit.upper()
+    _validate_ansi_fields(tables, spline_type, root, fit, diametral_pitch,
+                          teeth, pressure_angle, tol_class)
+    return (f'{spline_type} {root} ROOT {fit} FIT {diametral_pitch}/'
+            f'{stub_pitch} {int(teeth)}T {pressure_angle} CLASS '
+            f'{int(tol_class)} ANSI B92')
+
+
+def _validate_bs(spec, tables):
+    """
+    Validates the BS 3550 specification against the grammar and the coverage of the ANSI B92.1 tables, the tolerance class is kept optional.
+
+    Returns
+    -------
+    str
+        The normalised specification.
+
+    Raises
+    ------
+    SpecificationError
+        If the specification is not valid.
+    """
+    spline_type, root, fit, diametral_pitch, stub_pitch, teeth, pressure_angle, tol_class = _grammar(
+        _BS_GRAMMAR, spec, 'BS 3550')
+    spline_type, root, fit = spline_type.upper(), root.upper(), fit.upper()
+    _validate_ansi_fields(tables, spline_type, root, fit, diametral_pitch,
+                          teeth, pressure_angle, tol_class or 5)
+    tol_class = '' if tol_class is None else f' CLASS {int(tol_class)}'
+    return (f'{spline_type} {root} ROOT {fit} FIT {diametral_pitch}/'
+            f'{stub_pitch} {int(teeth)}T {pressure_angle}{tol_class} BS 3550')
+
+
+def _calculate_batch(batch):
+    """
+    Calculates the sizes of the batch of the parsed splines of one standard one by one.
+    """
+    for splines in batch:
+        STANDARDS[splines.standard].calculate(splines)
+
+
+def _calculate_iso_batch(batch):
+    """
+    Calculates the sizes of the batch of the parsed ISO 4156 splines, the sizes independent of the tolerance are calculated once per geometry and length.
+    """
+    geometries = {}
+    for splines in batch:
+        key = (splines.spline_type, splines.teeth, splines.module,
+               splines.pressure_angle, splines.spline_root, splines.length,
+               splines._pin_dia)
+        if key in geometries:
+            geometry = geometries[key]
+            splines.length = geometry.length
+            splines._iso_geometry = geometry._iso_geometry
+            for name in ('pitch_dia', 'base_dia', 'ext_root_rad',
+                         'int_root_rad', 'ext_pin_dia', 'int_pin_dia',
+                         'min_major_int_dia', 'max_major_int_dia',
+                         'min_form_int_dia'):
+                if hasattr(geometry, name):
+                    setattr(splines, name, getattr(geometry, name))
+        else:
+            splines._calculate_iso_geometry()
+            geometries[key] = splines
+        splines._calculate_iso_tolerances(splines.tolerance)
+
+
+# The standards keyed by their designation in the specification
+STANDARDS = {
+    'ISO 4156':
+    Standard(Splines._parse_iso, Splines._calculate_iso, _calculate_iso_batch,
+             'ISO 4156-1:2005', _validate_iso),
+    'ANSI B92':
+    Standard(Splines._parse_ansi, Splines._calculate_ansi, _calculate_batch,
+             'ANSI B92.1-1996', _validate_ansi),
+    'BS 3550':
+    Standard(Splines._parse_bs, Splines._calculate_ansi, _calculate_batch,
+             'ANSI B92.1-1996', _validate_bs),
+}
+
+
+def _standard_patterns():
+    """
+    Returns the patterns of the designations of the standards, the exact one and the one regardless of the case and the spacing.
+    """
+    return (re.compile('|'.join(map(re.escape, STANDARDS))),
+            re.compile(
+                '|'.join(
+                    re.escape(name).replace(r'\ ', r'\s*')
+                    for name in STANDARDS), re.IGNORECASE))
+
+
+_standard_pattern, _loose_standard_pattern = _standard_patterns()
+
+
+def register_standard(name,
+                      parse,
+                      calculate,
+                      calculate_batch=_calculate_batch,
+                      edition=None,
+                      validate=None):
+    """
+    Registers the standard to be found by its designation `name` in the specifications.
+
+    Parameters
+    ----------
+    name : str
+        The standard designation, e.g. 'ISO 4156'.
+    parse : callable
+        Sets the splines parameters from the `spec` attribute of the splines.
+    calculate : callable
+        Calculates the sizes of the parsed splines.
+    calculate_batch : callable
+        Calculates the sizes of the list of the parsed splines.
+    edition : str
+        The default edition of the tables, see `editions.register_edition`, default None for the standards without the tables.
+    validate : callable
+        Returns the normalised specification from the specification and the tables or raises `SpecificationError`, default None for the standards without the validation, see `validate_spec`.
+
+    Returns
+    -------
+    None
+    """
+    global _standard_pattern, _loose_standard_pattern
+    STANDARDS[name] = Standard(parse, calculate, calculate_batch, edition,
+                               validate)
+    _standard_pattern, _loose_standard_pattern = _standard_patterns()
+
+
+def find_standard(spec: str):
+    """
+    Returns the designation of the standard of the specification.
+
+    Parameters
+    ----------
+    spec : str
+        The spline specification.
+
+    Returns
+    -------
+    str
+    """
+    match = _standard_pattern.search(spec)
+    if match is None:
+        raise ValueError(f'The standard of the specification is unknown: {spec}')
+    return match.group()
+
+
+def edition_tables(standard, edition=None):
+    """
+    Returns the edition and its tables for the standard, the default edition of the standard if `edition` is None.
+
+    Returns
+    -------
+    tuple
+        The edition and the tables loaded by `editions.load_edition`, None for the standards without the tables.
+
+    Raises
+    ------
+    ValueError
+        If the edition does not apply to the standard.
+    """
+    edition = edition or STANDARDS[standard].edition
+    if edition is None:
+        return None, None
+    tables = load_edition(edition)
+    if standard not in tables.standards:
+        raise ValueError(
+            f'The edition {edition} does not apply to the standard {standard}')
+    return edition, tables
+
+
+def validate_spec(spec: str, edition=None):
+    """
+    Validates the specification against the grammar and the coverage of the tables of its standard without calculating the sizes. The designation of the standard is found regardless of its case and spacing.
+
+    Parameters
+    ----------
+    spec : str
+        The spline specification.
+    edition : str
+        The edition of the standard tables, default the edition of the standard.
+
+    Returns
+    -------
+    str
+        The normalised specification, the stripped specification for the standards registered without the validation.
+
+    Raises
+    ------
+    SpecificationError
+        If the specification is not valid, the `code` attribute tells why.
+    """
+    match = _loose_standard_pattern.search(spec)
+    if match is None:
+        raise SpecificationError(
+            'standard', f'The standard of the specification is unknown: {spec}')
+    found = re.sub(r'\s', '', match.group()).upper()
+    standard = next(name for name in STANDARDS
+                    if name.replace(' ', '').upper() == found)
+    try:
+        _, tables = edition_tables(standard, edition)
+    except ValueError as e:
+        raise SpecificationError('edition', str(e)) from None
+    validate = STANDARDS[standard].validate
+    if validate is None:
+        return spec.strip()
+    return validate(spec, tables)
+
+
+def spec_fields(spec: str):
+    """
+    Splits the specification into the fields, dropping the standard designation and the separators.
+
+    Returns
+    -------
+    list
+    """
+    return [
+        i for i in re.split(
+            r'x| |/|-|ISO|4156|ANSI|B92|ROOT|FIT|BS|3550|CLASS', spec) if bool(i)
+    ]
+
+
+def calculate_batch(specs, lengths=None, backend='python', edition=None):
+    """
+    Calculates the sizes of the batch of the specifications, which may be of different standards. The specifications are parsed, split by the standard and calculated by the batch kernel of each standard.
+
+    Parameters
+    ----------
+    specs : iterable
+        The spline specifications.
+    lengths : iterable
+        The splines lengths, default None for all.
+    backend : str
+        The backend of the numeric kernels, 'python' or 'numba'.
+    edition : str
+        The edition of the standard tables, default the edition of each standard.
+
+    Returns
+    -------
+    list
+        The `Splines` in the order of the specifications.
+    """
+    kernels = get_kernels(backend)
+    specs = list(specs)
+    if lengths is None:
+        lengths = [None] * len(specs)
+    batches = {}
+    result = []
+    for spec, length in zip(specs, lengths):
+        splines = Splines.__new__(Splines)
+        splines.spec, splines.length = spec, length
+        splines._kernels, splines._pin_dia = kernels, None
+        splines.standard = find_standard(spec)
+        splines.edition, splines._tables = edition_tables(
+            splines.standard, edition)
+        STANDARDS[splines.standard].parse(splines)
+        batches.setdefault(splines.standard, []).append(splines)
+        result.append(splines)
+    for name, batch in batches.items():
+        STANDARDS[name].calculate_batch(batch)
+    return result
+
+
+def json_sizes(splines):
+    """
+    Returns the parameters and the sizes of the splines which can be serialised to JSON.
+
+    Returns
+    -------
+    dict
+    """
+    return {
+        name: value
+        for name, value in splines.as_dict().items()
+        if value is None or isinstance(value, (str, int, float))
+    }
+
+
+@lru_cache(maxsize=4096)
+def cached_splines(spec: str, length=None, edition=None, pin_dia=None):
+    """
+    Returns the `Splines` instance for the given specification, length, edition and pin diameter, reusing the instance calculated before for the same arguments.
+
+    The returned instance is shared between the callers and must not be modified.
+    """
+    return Splines(spec, length, edition=edition, pin_dia=pin_dia)
+
+
+def tolerance_table(spec: str, tolerances, length=None, edition=None):
+    """
+    Calculates the sizes of the splines for each of the tolerance designations, the sizes independent of the tolerance are calculated once.
+
+    Parameters
+    ----------
+    spec : str
+        The spline specification, its tolerance designation is replaced by each of the `tolerances`.
+    tolerances : iterable
+        The tolerance designations, e.g. ['4h', '5f', '6e'] for ISO 4156 splines or [4, 5, 6, 7] for ANSI B92 splines.
+    length : float
+        The splines length, default None.
+    edition : str
+        The edition of the standard tables, default the edition of the standard.
+
+    Returns
+    -------
+    list
+        The dictionaries of the sizes, one per tolerance designation.
+    """
+    splines = Splines(spec, length, edition=edition)
+    return [{
+        'tolerance': tolerance,
+        **splines.with_tolerance(tolerance).as_dict()
+    } for tolerance in tolerances]
@@ -0,0 +1,208 @@
+from itertools import islice
+from math import pi, radians, tan
+
+
+def stress_factors(splines,
+                   application_factor=1.,
+                   fatigue_factor=1.,
+                   load_distribution_factor=1.,
+                   wear_factor=1.,
+                   wall_thickness=None,
+                   bore_dia=0.):
+    """
+    Calculates the stresses in the splines per unit torque according to the strength formulae in ANSI B92.1-1996 appendix. The units are consistent with the specification, e.g. N*mm and MPa for ISO 4156 splines, lbf*in and psi for ANSI B92 splines.
+
+    Parameters
+    ----------
+    splines : Splines
+        The splines.
+    application_factor : float
+        The application factor, Ka.
+    fatigue_factor : float
+        The fatigue life factor, Kf.
+    load_distribution_factor : float
+        The load distribution factor, Km.
+    wear_factor : float
+        The wear life factor of the compressive stress, Kw.
+    wall_thickness : float
+        The wall thickness of the internal splines hub, required for the bursting stress.
+    bore_dia : float
+        The bore diameter of the hollow external splines shaft.
+
+    Returns
+    -------
+    dict
+        The tooth shear, root shear (external splines), compressive and bursting (internal splines with the wall thickness) stresses per unit torque. The bursting stress is the sum of the radial load and the beam loading tensile stresses, the centrifugal stress depends on the speed and is left out.
+    """
+    length = splines.length or splines.pitch_dia / 2
+    if splines.standard != 'ISO 4156':
+        engagement_depth = 0.9 / splines.diametral_pitch
+        circular_pitch = pi / splines.diametral_pitch
+    else:
+        engagement_depth = 0.9 * splines.module
+        circular_pitch = pi * splines.module
+    if splines.spline_type == 'EXT':
+        thickness = splines.min_act_thickness
+    else:
+        thickness = circular_pitch - splines.max_act_width
+    # the factors of the formulae in ANSI B92.1-1996 appendix
+    Ka, Kf, Km, Kw = (application_factor, fatigue_factor,
+                      load_distribution_factor, wear_factor)
+    factors = {
+        'tooth_shear':
+        4 * Km * Ka /
+        (splines.pitch_dia * splines.teeth * length * thickness * Kf),
+        'compressive':
+        2 * Km * Ka /
+        (splines.pitch_dia * splines.teeth * length * engagement_depth * Kw),
+    }
+    if splines.spline_type == 'EXT':
+        minor_dia = splines.min_minor_ext_dia
+        factors['root_shear'] = 16 * Ka * minor_dia / (
+            pi * (minor_dia**4 - bore_dia**4) * Kf)
+    elif wall_thickness is not None:
+        radial = tan(radians(splines.pressure_angle)) / (
+            pi * splines.pitch_dia * wall_thickness * length)
+        beam = 4 / (splines.pitch_dia**2 * wall_thickness * length)
+        factors['bursting'] = Km * Ka * (radial + beam) / Kf
+    return factors
+
+
+def chunks(values, chunk_size=65536):
+    """
+    Splits the iterable into the lists of at most `chunk_size` values.
+    """
+    values = iter(values)
+    chunk = list(islice(values, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(values, chunk_size))
+
+
+def read_torques(path):
+    """
+    Reads the torque history from the text file with one value per line.
+    """
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield float(line)
+
+
+def stress_chunks(splines, torques, chunk_size=65536, **kwargs):
+    """
+    Calculates the stresses for the torque history chunk by chunk, the keyword arguments are passed to `stress_factors`.
+
+    Yields
+    ------
+    dict
+        The lists of the stresses keyed by the stress name, one list per chunk of the torques.
+    """
+    factors = stress_factors(splines, **kwargs)
+    for chunk in chunks(torques, chunk_size):
+        yield {
+            name: [factor * torque for torque in chunk]
+            for name, factor in factors.items()
+        }
+
+
+def peak_stresses(splines, torques, chunk_size=65536, **kwargs):
+    """
+    Calculates the maximum absolute stresses over the torque history.
+
+    Returns
+    -------
+    dict
+    """
+    factors = stress_factors(splines, **kwargs)
+    peak = 0.
+    for chunk in chunks(torques, chunk_size):
+        peak = max(peak, max(chunk), -min(chunk))
+    return {name: factor * peak for name, factor in factors.items()}
+
+
+def reversals(values):
+    """
+    Yields the turning points of the history including the first and the last values.
+    """
+    values = iter(values)
+    try:
+        previous = next(values)
+    except StopIteration:
+        return
+    yield previous
+    direction = 0
+    for value in values:
+        if value == previous:
+            continue
+        new_direction = 1 if value > previous else -1
+        if direction and new_direction != direction:
+            yield previous
+        direction, previous = new_direction, value
+    if direction:
+        yield previous
+
+
+def rainflow(values):
+    """
+    Counts the cycles in the history with the rainflow method according to ASTM E1049-85.
+
+    Yields
+    ------
+    tuple
+        The range, the mean and the count, 0.5 or 1.0, of each cycle.
+    """
+    stack = []
+    for point in reversals(values):
+        stack.append(point)
+        while len(stack) >= 3:
+            x = abs(stack[-1] - stack[-2])
+            y = abs(stack[-2] - stack[-3])
+            if x < y:
+                break
+            mean = (stack[-2] + stack[-3]) / 2
+            if len(stack) == 3:
+                yield y, mean, .5
+                stack.pop(0)
+            else:
+                yield y, mean, 1.
+                del stack[-3:-1]
+    for first, second in zip(stack, stack[1:]):
+        yield abs(second - first), (first + second) / 2, .5
+
+
+def fatigue_damage(splines,
+                   torques,
+                   fatigue_strength,
+                   exponent,
+                   reference_cycles=1e7,
+                   **kwargs):
+    """
+    Calculates the Palmgren-Miner damage of the torque history for each stress with the S-N curve N = reference_cycles * (fatigue_strength / S)**exponent, where S is the stress amplitude of the rainflow cycle. The torque history is consumed once.
+
+    Parameters
+    ----------
+    splines : Splines
+        The splines.
+    torques : iterable
+        The torque history.
+    fatigue_strength : float
+        The stress amplitude endured for the reference number of cycles.
+    exponent : float
+        The S-N curve exponent.
+    reference_cycles : float
+        The number of cycles at the fatigue strength.
+
+    Returns
+    -------
+    dict
+        The damage keyed by the stress name, the failure is expected at 1.
+    """
+    factors = stress_factors(splines, **kwargs)
+    damage = dict.fromkeys(factors, 0.)
+    for torque_range, _, count in rainflow(torques):
+        for name, factor in factors.items():
+            amplitude = factor * torque_range / 2
+            damage[name] += count * (amplitude / fatigue_strength
+                                     )**exponent / reference_cycles
+    return damage
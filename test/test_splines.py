@@ -1,12 +1,32 @@
-import unittest
-import sys
+import asyncio
+import glob
+import json
+import math
 import os
+import sys
+import tempfile
+import unittest
 
 sys.path.append(os.path.abspath(os.getcwd()))
 sys.path.append(os.path.abspath(os.path.join(os.getcwd(), '..')))
 sys.path.append(os.path.abspath(os.path.join(os.getcwd(), '../..')))
 
-from splines import Splines
+from splines import (Splines, SpecificationError, calculate_batch,
+                     find_standard, tolerance_table, validate_spec)
+from editions import EDITIONS, register_edition
+from kernels import BACKENDS, get_kernels
+from jobs import read_chunks, run_job, size_chunk
+from sensitivity import jacobian, jacobians
+from rendering import FORMATS, render
+from explorer import debounce, design_fields, design_spec
+from validation import validate, write_diagnostics
+from pins import evaluate_pin, optimise_pins
+from inspection import (inspect, inspection_plan, read_measurements,
+                        summarise)
+from profiles import gear_profile
+from gauges import gauge_data
+from service import SizingService
+from strength import fatigue_damage, rainflow, stress_factors
 
 A2 = Splines('INT 25z x 1,0m x 30P x 5H - ISO 4156', None)
 A3 = Splines('INT 25z x 1,0m x 30R x 7H - ISO 4156', 25)
@@ -170,5 +190,702 @@ class ExampleB1(unittest.TestCase):
         self.assertEqual(round(B1.base_dia, ndigits=6), 2.165064)
 
 
+class MeasurementInversion(unittest.TestCase):
+    def test_ext_thickness_from_measurement(self):
+        self.assertAlmostEqual(A4.act_size_from_measurement(
+            A4.max_ext_measurement),
+                               A4.max_act_thickness,
+                               places=4)
+        self.assertAlmostEqual(A4.act_size_from_measurement(
+            A4.min_ext_measurement),
+                               A4.min_act_thickness,
+                               places=4)
+
+    def test_int_width_from_measurement(self):
+        self.assertAlmostEqual(A3.act_size_from_measurement(
+            A3.max_int_measurement),
+                               A3.max_act_width,
+                               places=4)
+
+    def test_ansi_thickness_from_measurement(self):
+        self.assertAlmostEqual(B1.act_size_from_measurement(
+            B1.min_pin_measurement),
+                               B1.min_act_thickness,
+                               places=5)
+
+    def test_45_degree_round_trip(self):
+        for spec in ('EXT 50z x 5m x 45P x 7h - ISO 4156',
+                     'INT FLAT ROOT SIDE FIT 12/24 31T 45 CLASS 5 ANSI B92'):
+            splines = Splines(spec)
+            for act_size in splines.act_size_limits():
+                self.assertAlmostEqual(splines.act_size_from_measurement(
+                    splines.measurement_from_act_size(act_size)),
+                                       act_size,
+                                       places=9)
+
+    def test_inspection_summary(self):
+        mid = (A5.max_ext_measurement + A5.min_ext_measurement) / 2
+        rows = [('lot1', A5.spec, None, mid), ('lot1', A5.spec, None, mid),
+                ('lot2', A5.spec, None, A5.max_ext_measurement + 0.1)]
+        summary = summarise(inspect(rows))
+        self.assertEqual(summary['lot1'].count, 2)
+        self.assertEqual(summary['lot1'].nonconforming, 0)
+        self.assertEqual(round(summary['lot1'].std, ndigits=6), 0)
+        self.assertEqual(summary['lot2'].nonconforming, 1)
+
+    def test_bad_rows(self):
+        mid = (A5.max_ext_measurement + A5.min_ext_measurement) / 2
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'measurements.csv')
+            with open(path, 'w') as f:
+                f.write('lot,spec,length,measurement\n'
+                        f'lot1,"{A5.spec}",,{mid}\n'
+                        f'lot1,"{A5.spec}",,abc\n'
+                        f'lot1,"{A5.spec}",,\n'
+                        f'lot1,"{A5.spec}",,1.0\n'
+                        f'lot1,"{A5.spec}",,{mid}\n')
+            inspections = list(inspect(read_measurements(path)))
+        self.assertEqual(len(inspections), 5)
+        self.assertEqual([inspection.error is None
+                          for inspection in inspections],
+                         [True, False, False, False, True])
+        self.assertEqual(inspections[1].measurement, 'abc')
+        self.assertIsNone(inspections[3].act_size)
+        summary = summarise(inspections)['lot1']
+        self.assertEqual((summary.count, summary.nonconforming), (5, 3))
+        self.assertAlmostEqual(summary.mean, inspections[0].act_size)
+
+
+class Profiles(unittest.TestCase):
+    def test_ext_profile_diameters(self):
+        radii = [(x * x + y * y)**.5 for x, y in gear_profile(A5.spec)]
+        self.assertAlmostEqual(2 * max(radii), A5.max_major_ext_dia)
+        self.assertAlmostEqual(2 * min(radii), A5.max_minor_ext_dia)
+
+    def test_int_profile_diameters(self):
+        radii = [(x * x + y * y)**.5 for x, y in gear_profile(A3.spec)]
+        self.assertAlmostEqual(2 * max(radii), A3.min_major_int_dia)
+        self.assertAlmostEqual(2 * min(radii), A3.min_minor_int_dia)
+
+    def test_profile_teeth(self):
+        points = gear_profile(B1.spec, 10)
+        self.assertEqual(len(points) % B1.teeth, 0)
+        self.assertEqual(len(set(points)), len(points))
+
+    def test_profile_length(self):
+        # the length changes the mean actual space width of ISO 4156 splines
+        self.assertNotEqual(gear_profile(A3.spec, 10, 100.),
+                            gear_profile(A3.spec, 10))
+        self.assertEqual(gear_profile(A3.spec, 10, A3.length),
+                         gear_profile(A3.spec, 10, 25))
+
+    def test_fillet_meets_flank(self):
+        # the four segments of 21 points of the half tooth share 3 end
+        # points, the mirrored half shares 2 more
+        for splines in (A5, A3):
+            points = gear_profile(splines.spec, 20)
+            self.assertEqual(len(points), splines.teeth * 160)
+
+
+class ToleranceTable(unittest.TestCase):
+    def test_iso_variants_match_constructions(self):
+        tolerances = ['4h', '5js', '6e', '7d', '5k']
+        table = tolerance_table(A4.spec, tolerances)
+        for tolerance, row in zip(tolerances, table):
+            splines = Splines(
+                f'EXT 25z x 1,0m x 30P x {tolerance} - ISO 4156', None)
+            self.assertEqual(row['spec'], splines.spec)
+            for name, value in splines.as_dict().items():
+                self.assertEqual(row[name], value, name)
+
+    def test_ansi_variants(self):
+        table = tolerance_table(B1.spec, [4, 5, 6, 7])
+        self.assertEqual(table[1]['total_tolerance'], B1.total_tolerance)
+        self.assertLess(table[0]['total_tolerance'],
+                        table[3]['total_tolerance'])
+
+    def test_bs_variants_without_class(self):
+        table = tolerance_table('EXT FLAT ROOT SIDE FIT 12/24 30T 30 BS 3550',
+                                [4, 5, 6, 7])
+        self.assertEqual(table[2]['spec'],
+                         'EXT FLAT ROOT SIDE FIT 12/24 30T 30 CLASS 6 BS 3550')
+        self.assertEqual(table[1]['total_tolerance'], B1.total_tolerance)
+        self.assertLess(table[0]['total_tolerance'],
+                        table[3]['total_tolerance'])
+
+    def test_iso_fit_of_another_type(self):
+        for tolerance in ('5H', '5', 'f5'):
+            with self.assertRaises(ValueError):
+                A4.with_tolerance(tolerance)
+
+
+class Strength(unittest.TestCase):
+    def test_tooth_shear(self):
+        factors = stress_factors(A5)
+        self.assertAlmostEqual(
+            factors['tooth_shear'],
+            4 / (A5.pitch_dia * A5.teeth * A5.length * A5.min_act_thickness))
+        self.assertNotIn('bursting', factors)
+
+    def test_factors(self):
+        base = stress_factors(A5)
+        factors = stress_factors(A5,
+                                 application_factor=1.5,
+                                 fatigue_factor=2.,
+                                 load_distribution_factor=3.,
+                                 wear_factor=4.)
+        self.assertAlmostEqual(factors['tooth_shear'],
+                               base['tooth_shear'] * 1.5 * 3. / 2.)
+        self.assertAlmostEqual(factors['compressive'],
+                               base['compressive'] * 1.5 * 3. / 4.)
+        self.assertAlmostEqual(factors['root_shear'],
+                               base['root_shear'] * 1.5 / 2.)
+
+    def test_bursting(self):
+        wall = 5.
+        bursting = stress_factors(A3, load_distribution_factor=2.,
+                                  wall_thickness=wall)['bursting']
+        radial = math.tan(math.radians(30)) / (math.pi * A3.pitch_dia * wall *
+                                               A3.length)
+        beam = 4 / (A3.pitch_dia**2 * wall * A3.length)
+        self.assertAlmostEqual(bursting, 2. * (radial + beam))
+
+    def test_rainflow_astm_example(self):
+        counts = {}
+        for cycle_range, _, count in rainflow([-2, 1, -3, 5, -1, 3, -4, 4,
+                                               -2]):
+            counts[cycle_range] = counts.get(cycle_range, 0) + count
+        self.assertEqual(counts, {3: .5, 4: 1.5, 6: .5, 8: 1., 9: .5})
+
+    def test_constant_amplitude_damage(self):
+        factor = stress_factors(A5)['tooth_shear']
+        torques = [0, 100 / factor] * 1000 + [0]
+        damage = fatigue_damage(A5, torques, 50, 5, reference_cycles=1e6)
+        self.assertAlmostEqual(damage['tooth_shear'], 1000 / 1e6)
+
+
+class Gauges(unittest.TestCase):
+    def test_ext_gauges(self):
+        go, no_go = gauge_data([A5])
+        self.assertEqual(go.wear_limit, A5.max_eff_thickness)
+        self.assertLess(go.max_size, A5.max_eff_thickness)
+        self.assertEqual(no_go.min_size, A5.min_act_thickness)
+        self.assertLess(no_go.max_size, A5.max_act_thickness)
+        self.assertGreater(go.min_major_dia, A5.max_major_ext_dia)
+
+    def test_int_gauges(self):
+        go, no_go = gauge_data([A2.spec])
+        self.assertGreater(go.min_size, A2.min_eff_width)
+        self.assertEqual(no_go.max_size, A2.max_act_width)
+        self.assertGreater(no_go.min_size, A2.min_act_width)
+        self.assertLess(go.max_minor_dia, A2.min_minor_int_dia)
+        self.assertLess(go.max_major_dia, A2.min_form_int_dia)
+
+
+class Measurements(unittest.TestCase):
+    def test_ball_measurement(self):
+        self.assertAlmostEqual(A4.ball_measurement()[0],
+                               A4.min_ext_measurement)
+        self.assertAlmostEqual(A3.ball_measurement()[1],
+                               A3.max_int_measurement)
+
+    def test_span_measurement(self):
+        splines = Splines('EXT 24z x 2,5m x 30R x 5h - ISO 4156', None)
+        k, min_span, max_span = splines.span_measurement()
+        self.assertEqual(k, 5)
+        self.assertEqual(round(max_span, ndigits=2), 33.37)
+        self.assertLess(min_span, max_span)
+        with self.assertRaises(ValueError):
+            A2.span_measurement()
+
+    def test_inspection_plan(self):
+        ext, int_ = inspection_plan([A5, A2.spec])
+        self.assertEqual(ext.max_pin_measurement, A5.max_ext_measurement)
+        self.assertEqual(ext.span_teeth, A5.span_teeth())
+        self.assertIsNone(int_.span_teeth)
+
+
+class Standards(unittest.TestCase):
+    def test_find_standard(self):
+        self.assertEqual(find_standard(A2.spec), 'ISO 4156')
+        self.assertEqual(find_standard(B1.spec), 'ANSI B92')
+        with self.assertRaises(ValueError):
+            find_standard('EXT 24z x 2,5m x 30R x 5f - DIN 5480')
+
+    def test_bs_equals_ansi_class5(self):
+        bs = Splines('EXT FLAT ROOT SIDE FIT 12/24 30T 30 BS 3550', None)
+        self.assertEqual(bs.standard, 'BS 3550')
+        self.assertEqual(bs.min_act_thickness, B1.min_act_thickness)
+        self.assertEqual(bs.min_pin_measurement, B1.min_pin_measurement)
+
+    def test_mixed_batch(self):
+        specs = [
+            A2.spec, B1.spec, A4.spec, A6.spec,
+            'EXT FLAT ROOT SIDE FIT 12/24 30T 30 BS 3550', A5.spec
+        ]
+        for splines, spec in zip(calculate_batch(specs), specs):
+            self.assertEqual(splines.as_dict(), Splines(spec).as_dict())
+
+
+class Service(unittest.TestCase):
+    def test_coalescing_and_batching(self):
+        async def run():
+            service = SizingService(window=0.01)
+            results = await asyncio.gather(*(service.size(spec)
+                                             for spec in [A2.spec, A4.spec] *
+                                             5))
+            cached = await service.size(A2.spec)
+            return service, results, cached
+
+        service, results, cached = asyncio.run(run())
+        self.assertEqual(results[0]['max_act_width'], A2.max_act_width)
+        self.assertEqual(results[1]['max_act_thickness'], A4.max_act_thickness)
+        self.assertEqual(cached, results[0])
+        self.assertIsNot(cached, results[0])
+        metrics = service.metrics()
+        self.assertEqual(metrics['batches'], 1)
+        self.assertEqual(metrics['calculated'], 2)
+        self.assertEqual(metrics['coalesced'], 8)
+        self.assertEqual(metrics['cache_hits'], 1)
+
+    def test_error(self):
+        async def run():
+            return await SizingService().size('EXT 24z - ISO 4156')
+
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+
+    def test_bad_requests(self):
+        async def request(server, data):
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(data)
+            status = (await reader.readline()).split()[1]
+            headers = {}
+            line = await reader.readline()
+            while line != b'\r\n':
+                name, value = line.decode().split(':', 1)
+                headers[name.lower()] = value
+                line = await reader.readline()
+            length = int(headers['content-length'])
+            payload = json.loads(await reader.readexactly(length))
+            writer.close()
+            return status, payload
+
+        async def run():
+            server = await SizingService().serve(port=0)
+            async with server:
+                return [
+                    await request(server, data)
+                    for data in (b'POST /sizes HTTP/1.1\r\nContent-Length: 1'
+                                 b'\r\n\r\n{', b'GARBAGE\r\n\r\n')
+                ]
+
+        for status, payload in asyncio.run(run()):
+            self.assertEqual(status, b'400')
+            self.assertIn('error', payload)
+
+
+class Backends(unittest.TestCase):
+    def test_numba_falls_back(self):
+        splines = Splines(A4.spec, None, backend='numba')
+        self.assertAlmostEqual(splines.max_ext_measurement,
+                               A4.max_ext_measurement)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            Splines(A4.spec, None, backend='fortran')
+
+    @unittest.skipUnless('numba' in BACKENDS, 'Numba is not installed')
+    def test_numba_kernels(self):
+        python, numba = get_kernels('python'), get_kernels('numba')
+        self.assertIsNot(numba, python)
+        for args in ((A4.base_dia, A4.pitch_dia, 30., 25, 1.75, 1.54, True),
+                     (A3.base_dia, A3.pitch_dia, 30., 25, 1.75, 1.62, False),
+                     (21.2132, 30., 45., 31, 1.5, 1.6, False)):
+            self.assertAlmostEqual(numba.pin_measurement(*args),
+                                   python.pin_measurement(*args),
+                                   places=12)
+        self.assertAlmostEqual(numba.inverse_involute(.05),
+                               python.inverse_involute(.05),
+                               places=15)
+        for spec in (A4.spec, A3.spec, B1.spec):
+            compiled = Splines(spec, backend='numba').as_dict()
+            for name, value in Splines(spec).as_dict().items():
+                if isinstance(value, float):
+                    self.assertAlmostEqual(compiled[name], value, places=12)
+
+
+class AnsiTables(unittest.TestCase):
+    def test_fillet_root_min_minor_ext_dia(self):
+        splines = Splines(
+            'EXT FILLET ROOT SIDE FIT 12/24 30T 30 CLASS 5 ANSI B92', None)
+        self.assertEqual(round(splines.min_minor_ext_dia, ndigits=4), 2.3302)
+
+    def test_fractional_diametral_pitch(self):
+        splines = Splines('INT FLAT ROOT DIA FIT 2.5/5 20T 30 CLASS 5 ANSI B92',
+                          None)
+        self.assertEqual(splines.tolerances_class5, 0.0046)
+
+    def test_min_eff_width_45(self):
+        splines = Splines('INT FILLET ROOT SIDE FIT 8/16 20T 45 CLASS 5 ANSI B92',
+                          None)
+        self.assertAlmostEqual(splines.max_act_width - splines.min_eff_width,
+                               splines.total_tolerance)
+
+    def test_pitch_out_of_table(self):
+        with self.assertRaises(ValueError):
+            Splines('EXT FLAT ROOT SIDE FIT 50/100 30T 30 CLASS 5 ANSI B92',
+                    None)
+
+
+class Editions(unittest.TestCase):
+    def test_default_edition(self):
+        self.assertEqual(A4.edition, 'ISO 4156-1:2005')
+        self.assertEqual(B1.edition, 'ANSI B92.1-1996')
+
+    def test_explicit_edition(self):
+        splines = Splines(A4.spec, None, edition='ISO 4156-1:2005')
+        self.assertEqual(splines.min_major_ext_dia, A4.min_major_ext_dia)
+
+    def test_unknown_edition(self):
+        with self.assertRaises(ValueError):
+            Splines(A4.spec, None, edition='ISO 4156-1:1981')
+
+    def test_edition_of_another_standard(self):
+        with self.assertRaises(ValueError):
+            Splines(A4.spec, None, edition='ANSI B92.1-1996')
+
+    def test_cache_invalidated_by_content(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'iso_test.json')
+            with open(EDITIONS['ISO 4156-1:2005']) as f:
+                data = json.load(f)
+            data['edition'] = 'ISO 4156-1:test'
+            with open(path, 'w') as f:
+                json.dump(data, f)
+            register_edition('ISO 4156-1:test', path)
+            self.addCleanup(EDITIONS.pop, 'ISO 4156-1:test')
+            splines = Splines(A4.spec, None, edition='ISO 4156-1:test')
+            self.assertEqual(splines.min_major_ext_dia, A4.min_major_ext_dia)
+            data['tables']['major_minor_dia_tolerances']['rows'][4][2][1] = 100
+            with open(path, 'w') as f:
+                json.dump(data, f)
+            register_edition('ISO 4156-1:test', path)
+            splines = Splines(A4.spec, None, edition='ISO 4156-1:test')
+            self.assertAlmostEqual(splines.min_major_ext_dia, 25.9)
+            self.assertEqual(
+                len(glob.glob(os.path.join(directory, '__cache__', '*.bin'))),
+                1)
+
+    def test_cache_of_prefixed_name_kept(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(EDITIONS['ISO 4156-1:2005']) as f:
+                data = json.load(f)
+            for edition, name in (('ISO 4156-1:t-b', 'iso_t-b'),
+                                  ('ISO 4156-1:t', 'iso_t')):
+                data['edition'] = edition
+                with open(os.path.join(directory, f'{name}.json'), 'w') as f:
+                    json.dump(data, f)
+                register_edition(edition,
+                                 os.path.join(directory, f'{name}.json'))
+                self.addCleanup(EDITIONS.pop, edition)
+                Splines(A4.spec, None, edition=edition)
+            caches = glob.glob(os.path.join(directory, '__cache__', '*.bin'))
+            self.assertEqual(len(caches), 2)
+
+
+class Jobs(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.input = os.path.join(directory.name, 'specs.csv')
+        self.output = os.path.join(directory.name, 'sizes')
+        with open(self.input, 'w') as f:
+            f.write('spec,length\n')
+            for teeth in range(10, 35):
+                f.write(f'EXT {teeth}z x 2m x 30R x 5f - ISO 4156,\n')
+            f.write('EXT 20z x 2m x 30R x 5f - DIN 5480,20\n')
+            f.write(f'"{B1.spec}",\n')
+
+    def test_chunks(self):
+        manifest = run_job(self.input, self.output, chunk_size=10)
+        self.assertTrue(manifest['complete'])
+        self.assertEqual([chunk['rows'] for chunk in manifest['chunks']],
+                         [10, 10, 7])
+        self.assertEqual(sum(chunk['errors'] for chunk in manifest['chunks']),
+                         1)
+        chunks = list(read_chunks(self.output))
+        self.assertEqual(chunks[2]['row'], list(range(20, 27)))
+        self.assertEqual(chunks[2]['min_pin_measurement'][-1],
+                         B1.min_pin_measurement)
+
+    def test_resume(self):
+        run_job(self.input, self.output, chunk_size=10)
+        expected = list(read_chunks(self.output))
+        manifest_path = os.path.join(self.output, 'manifest.json')
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest['chunks'], manifest['complete'] = manifest['chunks'][:1], False
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f)
+        os.remove(os.path.join(self.output, 'chunk-000002.json'))
+        run_job(self.input, self.output, chunk_size=10)
+        self.assertEqual(list(read_chunks(self.output)), expected)
+
+    def test_another_job(self):
+        run_job(self.input, self.output, chunk_size=10)
+        with self.assertRaises(ValueError):
+            run_job(self.input, self.output, chunk_size=20)
+
+    def test_pin_fit_warning(self):
+        columns = size_chunk(
+            [('INT FLAT ROOT SIDE FIT 12/24 7T 30 CLASS 7 ANSI B92', ''),
+             (B1.spec, '')])
+        self.assertEqual(columns['error'], [None, None])
+        self.assertIsNone(columns['min_pin_measurement'][0])
+        self.assertIsNotNone(columns['max_major_int_dia'][0])
+        self.assertTrue(columns['warning'][0].startswith('pin_fit: '))
+        self.assertIsNone(columns['warning'][1])
+
+    def test_bad_length(self):
+        with open(self.input, 'a') as f:
+            f.write(f'"{B1.spec}",1O\n')
+            f.write(f'"{B1.spec}",10\n')
+        manifest = run_job(self.input, self.output, chunk_size=10)
+        self.assertEqual(sum(chunk['errors'] for chunk in manifest['chunks']),
+                         2)
+        chunk = list(read_chunks(self.output))[-1]
+        self.assertEqual(chunk['length'][-2:], ['1O', 10.])
+        self.assertTrue(chunk['error'][-2].startswith('length: '))
+        self.assertIsNone(chunk['error'][-1])
+
+
+class Sensitivity(unittest.TestCase):
+    def test_module(self):
+        derivative = jacobian(A5.spec)['max_ext_measurement']['module']
+        h = 1e-6
+        spec = 'EXT 25z x {}m x 30R x 6e - ISO 4156'
+        upper = Splines(spec.format(1 + h), A5.length, pin_dia=A5.ext_pin_dia)
+        lower = Splines(spec.format(1 - h), A5.length, pin_dia=A5.ext_pin_dia)
+        self.assertAlmostEqual(derivative, (upper.max_ext_measurement -
+                                            lower.max_ext_measurement) /
+                               (2 * h),
+                               places=4)
+
+    def test_pressure_angle(self):
+        derivative = jacobian(A4.spec)['base_dia']['pressure_angle']
+        self.assertAlmostEqual(derivative,
+                               -A4.pitch_dia * math.sin(math.pi / 6) * math.pi / 180)
+
+    def test_pin_dia(self):
+        derivatives = jacobian(B1.spec)
+        self.assertEqual(derivatives['max_eff_thickness']['pin_dia'], 0)
+        self.assertGreater(derivatives['min_pin_measurement']['pin_dia'], 1)
+
+    def test_batch(self):
+        specs = [A4.spec, A5.spec, B1.spec, A2.spec]
+        self.assertEqual(jacobians(specs),
+                         [jacobian(spec) for spec in specs])
+
+
+class Rendering(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_drawing_data(self):
+        data = dict(B1.drawing_data())
+        self.assertEqual(data['Max actual tooth thickness'],
+                         round(B1.max_act_thickness, 4))
+        self.assertEqual(data['Max measurement over pins'],
+                         round(B1.max_pin_measurement, 4))
+        self.assertEqual(
+            dict(B1.drawing_data('metric'))['Pitch diameter'], 63.5)
+
+    def test_pin_not_fitting(self):
+        # the recommended pin does not fit the spaces at the minimum actual
+        # space width of the small 30 degree internal splines
+        splines = Splines(
+            'INT FLAT ROOT SIDE FIT 12/24 7T 30 CLASS 7 ANSI B92')
+        self.assertIsNone(splines.min_pin_measurement)
+        self.assertGreater(splines.max_pin_measurement, 0)
+        data = dict(splines.drawing_data())
+        self.assertEqual(data['Min measurement between pins'], 'n/a')
+        path = os.path.join(self.directory.name, 'catalogue.html')
+        self.assertEqual(render([splines], path, processes=1), 1)
+
+    def test_html(self):
+        path = os.path.join(self.directory.name, 'catalogue.html')
+        self.assertEqual(render([B1, A5.spec], path, processes=1), 2)
+        with open(path) as f:
+            content = f.read()
+        self.assertIn(f'<caption>{B1.spec}</caption>', content)
+        self.assertIn('<th>Max actual tooth thickness</th>', content)
+        self.assertTrue(content.endswith('</html>\n'))
+
+    def test_pool(self):
+        catalogue = [A2, A3, A4, A5, B1]
+        serial = os.path.join(self.directory.name, 'serial.dxf')
+        parallel = os.path.join(self.directory.name, 'parallel.dxf')
+        render(catalogue, serial, processes=1)
+        render(catalogue, parallel, processes=2, chunksize=2)
+        with open(serial) as f, open(parallel) as g:
+            content = f.read()
+            self.assertEqual(content, g.read())
+        self.assertIn('DRAWING_DATA_4', content)
+        self.assertTrue(content.endswith('EOF\n'))
+
+    def test_latex_escape(self):
+        escape = FORMATS['latex'].escape
+        self.assertEqual(escape('50% ~ 2^3 \\ A_1 & {B}'),
+                         '50\\% \\textasciitilde{} 2\\textasciicircum{}3 '
+                         '\\textbackslash{} A\\_1 \\& \\{B\\}')
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            render([B1], os.path.join(self.directory.name, 'catalogue.pdf'))
+
+
+class Explorer(unittest.TestCase):
+    def test_design_spec(self):
+        for splines in (A2, A5, A6, B1):
+            self.assertEqual(design_spec(**design_fields(splines)), splines.spec)
+        fields = {**design_fields(B1), 'pitch': '2.5/5', 'pressure_angle': 37.5}
+        self.assertEqual(
+            design_spec(**fields),
+            'EXT FLAT ROOT SIDE FIT 2.5/5 30T 37.5 CLASS 5 ANSI B92')
+
+    def test_debounce(self):
+        calls = []
+
+        async def sweep():
+            debounced = debounce(0.01)(calls.append)
+            for teeth in range(20, 30):
+                debounced(teeth)
+            await asyncio.sleep(0.05)
+
+        asyncio.run(sweep())
+        self.assertEqual(calls, [29])
+
+
+class Validation(unittest.TestCase):
+    def test_valid(self):
+        for splines in (A2, A3, A4, A5, A6, B1):
+            self.assertEqual(validate_spec(splines.spec), splines.spec)
+
+    def test_normalise(self):
+        self.assertEqual(validate_spec('ext 25Z x 1.0M x 30r x 6e - iso  4156'),
+                         A5.spec)
+        self.assertEqual(
+            validate_spec(
+                'EXT flat root side fit 12/24 30 30 CLASS 5 ANSI B92.1'),
+            B1.spec)
+
+    def test_codes(self):
+        specs = {
+            'EXT 20z x 2m x 30R x 5f - DIN 5480': 'standard',
+            'EXT 25z x 1,0m x 30R - ISO 4156': 'grammar',
+            'EXT 25z x 1,0m x 20R x 6e - ISO 4156': 'pressure_angle',
+            'INT 25z x 1,0m x 30R x 6e - ISO 4156': 'fit_class',
+            'EXT 25z x 1,0m x 30R x 9e - ISO 4156': 'tolerance_class',
+            'EXT 2000z x 1,0m x 30R x 6e - ISO 4156': 'pitch_dia',
+            'EXT 200z x 0,5m x 30R x 6e - ISO 4156': 'dia_tolerance',
+            'EXT 4z x 2m x 30R x 6e - ISO 4156': 'teeth',
+            'EXT FLAT ROOT SIDE FIT 50/100 30T 30 CLASS 5 ANSI B92':
+            'diametral_pitch',
+            'EXT FLAT ROOT TIGHT FIT 12/24 30T 30 CLASS 5 ANSI B92': 'fit',
+        }
+        for diagnostic in validate(specs):
+            self.assertEqual(diagnostic.code, specs[diagnostic.spec])
+            self.assertIsNone(diagnostic.normalised)
+
+    def test_pin_fit(self):
+        specs = [
+            'INT 6z x 0,5m x 30R x 5H - ISO 4156',
+            'INT FLAT ROOT SIDE FIT 12/24 7T 30 CLASS 7 ANSI B92'
+        ]
+        for diagnostic in validate(specs):
+            self.assertEqual(diagnostic.code, 'ok')
+        for diagnostic in validate(specs, pins=True):
+            self.assertEqual(diagnostic.code, 'pin_fit')
+            self.assertEqual(diagnostic.normalised, specs[diagnostic.row])
+
+    def test_edition(self):
+        with self.assertRaises(SpecificationError) as context:
+            validate_spec(B1.spec, 'ISO 4156-1:2005')
+        self.assertEqual(context.exception.code, 'edition')
+
+    def test_write_diagnostics(self):
+        with tempfile.TemporaryDirectory() as directory:
+            counts = write_diagnostics(
+                [A5.spec, A5.spec, 'EXT 25z x 1,0m x 30R - ISO 4156'],
+                os.path.join(directory, 'diagnostics.csv'))
+        self.assertEqual(counts, {'ok': 2, 'grammar': 1})
+
+
+class Pins(unittest.TestCase):
+    def test_recommended_pin(self):
+        choice, = optimise_pins([A5], inventory=[A5.ext_pin_dia])
+        self.assertEqual(choice.pin_dia, A5.ext_pin_dia)
+        self.assertAlmostEqual(choice.min_measurement, A5.min_ext_measurement)
+        self.assertAlmostEqual(choice.max_measurement, A5.max_ext_measurement)
+        # the contact point at the mean actual tooth thickness is on the base
+        # tangent through the pin centre, the involute inverted by bisection
+        inv_centre = (sum(A5.act_size_limits()) / 2 / A5.pitch_dia +
+                      math.tan(math.radians(30)) - math.radians(30) +
+                      A5.ext_pin_dia / A5.base_dia - math.pi / A5.teeth)
+        low, high = 0, math.pi / 2
+        for _ in range(100):
+            centre = (low + high) / 2
+            if math.tan(centre) - centre < inv_centre:
+                low = centre
+            else:
+                high = centre
+        tan_contact = math.tan(centre) - A5.ext_pin_dia / A5.base_dia
+        self.assertAlmostEqual(choice.contact_dia,
+                               A5.base_dia * math.sqrt(1 + tan_contact**2),
+                               places=9)
+        # the ISO 4156 pin contacts the flanks near the pitch circle
+        self.assertAlmostEqual(choice.contact_dia, A5.pitch_dia, delta=0.13)
+
+    def test_catalogue(self):
+        choices = optimise_pins([A2.spec, A5, B1.spec])
+        self.assertEqual([choice.spec for choice in choices],
+                         [A2.spec, A5.spec, B1.spec])
+        for choice in choices:
+            splines = Splines(choice.spec)
+            units_coef = 1 if splines.standard == 'ISO 4156' else 1 / 25.4
+            evaluations = [
+                evaluate_pin(splines, pin_dia * units_coef)
+                for pin_dia in (1, 1.5, 2, 2.5, 3, 4, 5)
+            ]
+            self.assertGreater(choice.candidates, 1)
+            self.assertLessEqual(
+                choice.score,
+                min(evaluation[0] for evaluation in evaluations
+                    if evaluation is not None))
+
+    def test_infeasible(self):
+        choice, = optimise_pins([A5.spec], inventory=[0.1, 10])
+        self.assertIsNone(choice.pin_dia)
+        self.assertEqual(choice.candidates, 0)
+
+    def test_recommended_pin_not_fitting(self):
+        specs = [
+            'INT FLAT ROOT SIDE FIT 12/24 6T 30 CLASS 5 ANSI B92',
+            'INT 6z x 0,5m x 30R x 7H - ISO 4156',
+            'EXT 20z x 2m x 30R x 5f - DIN 5480'
+        ]
+        choices = optimise_pins(specs)
+        self.assertEqual([choice.spec for choice in choices], specs)
+        for choice in choices[:2]:
+            self.assertGreater(choice.candidates, 0)
+            self.assertLess(choice.min_measurement, choice.max_measurement)
+        self.assertIsNone(choices[2].pin_dia)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
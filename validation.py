@@ -0,0 +1,119 @@
+import argparse
+import csv
+from collections import Counter, namedtuple
+from functools import lru_cache
+
+from splines import Splines, SpecificationError, validate_spec
+
+# The diagnostic codes of the specifications
+CODES = {
+    'ok': 'The specification is valid',
+    'standard': 'The standard is unknown',
+    'edition': 'The edition does not apply to the standard',
+    'grammar': 'The specification does not follow the grammar of the standard',
+    'spline_type': 'The spline type is neither EXT nor INT',
+    'root': 'The root is unknown',
+    'fit': 'The fit is unknown',
+    'teeth': 'The number of teeth is less than the standard covers',
+    'pressure_angle': 'The pressure angle is not tabulated',
+    'tolerance_class': 'The tolerance class is not tabulated',
+    'fit_class': 'The fit class is not tabulated for the spline type',
+    'pitch_dia': 'The pitch diameter is out of the tables',
+    'diametral_pitch': 'The diametral pitch is out of the tables',
+    'dia_tolerance': 'The major or minor diameter tolerance is not tabulated',
+    # the warning of the valid specifications, see `pins_fit`
+    'pin_fit': 'The recommended measuring pin does not fit the spaces, the '
+    'measurements over or between pins are left out of the drawing data',
+}
+
+Diagnostic = namedtuple('Diagnostic',
+                        ['row', 'spec', 'code', 'normalised', 'message'])
+
+
+def pins_fit(sizes):
+    """
+    Returns True if the recommended measuring pins fit the spaces within the actual size limits, i.e. the involute at the pin centre is positive, see the `pin_fit` code.
+
+    Parameters
+    ----------
+    sizes : dict
+        The sizes of the splines, see `Splines.as_dict` or `splines.json_sizes`.
+
+    Returns
+    -------
+    bool
+    """
+    return all(value is not None for name, value in sizes.items()
+               if name.endswith('_measurement'))
+
+
+@lru_cache(maxsize=65536)
+def _diagnose(spec, edition, pins):
+    try:
+        normalised = validate_spec(spec, edition)
+    except SpecificationError as e:
+        return e.code, None, str(e)
+    if pins and not pins_fit(Splines(normalised, edition=edition).as_dict()):
+        return 'pin_fit', normalised, CODES['pin_fit']
+    return 'ok', normalised, None
+
+
+def validate(specs, edition=None, pins=False):
+    """
+    Validates the specifications against the grammar and the coverage of the tables of their standards before any sizes are calculated, see `splines.validate_spec`. The repeated specifications are validated once.
+
+    Parameters
+    ----------
+    specs : iterable
+        The spline specifications.
+    edition : str
+        The edition of the standard tables, default the edition of each standard.
+    pins : bool
+        True to check that the recommended measuring pins of the valid specifications fit the spaces as well, which sizes them, default False.
+
+    Yields
+    ------
+    Diagnostic
+        The row number, the specification, the diagnostic code, see `CODES`, the normalised specification of the valid ones and the message of the invalid ones. The valid specifications whose pins do not fit are sizeable, they have the `pin_fit` code with the normalised specification and the message.
+    """
+    for row, spec in enumerate(specs):
+        yield Diagnostic(row, spec, *_diagnose(spec, edition, pins))
+
+
+def write_diagnostics(specs, path, edition=None, pins=False):
+    """
+    Writes the diagnostics of the specifications to the CSV file one row at a time, returns the counts of the diagnostic codes, see `validate`.
+
+    Returns
+    -------
+    Counter
+    """
+    counts = Counter()
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(Diagnostic._fields)
+        for diagnostic in validate(specs, edition, pins):
+            writer.writerow(diagnostic)
+            counts[diagnostic.code] += 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Splines specifications validation')
+    parser.add_argument('input', help='CSV file with spec column')
+    parser.add_argument('output', help='CSV file of the diagnostics')
+    parser.add_argument('--edition', default=None)
+    parser.add_argument('--pins',
+                        action='store_true',
+                        help='check the recommended measuring pins fit')
+    args = parser.parse_args()
+    with open(args.input, newline='') as f:
+        counts = write_diagnostics((row['spec'] for row in csv.DictReader(f)),
+                                   args.output, args.edition, args.pins)
+    for code, count in counts.most_common():
+        print(f'{code}: {count}')
+
+
+if __name__ == '__main__':
+    main()